@@ -37,6 +37,15 @@ export const ARTIFACT_EXPORT = {
     inputMaxBytes: envNum(process.env.ARTIFACT_EXPORT_INPUT_MAX, 5 * 1024 * 1024),
     /** 변환 출력(base64) 캡 — pdf 수 MB 수준이면 충분. */
     outputMaxBytes: envNum(process.env.ARTIFACT_EXPORT_OUTPUT_MAX, 40 * 1024 * 1024),
+    /**
+     * docx 상주 워커 수 — 0(기본)이면 잡마다 one-shot 컨테이너. 워커는 maxConcurrent 슬롯 안에서
+     * 재사용되고(상한 min(이 값, maxConcurrent)), 유휴 중에도 컨테이너 1개씩 memory 를 점유한다.
+     */
+    warmWorkers: envNum(process.env.ARTIFACT_EXPORT_WARM_WORKERS, 0),
+    /** 상주 워커 RSS 워터마크(MB) — 잡 뒤 초과하면 워커를 새로 교체. memory(컨테이너 상한)보다 작게. */
+    workerWatermarkMb: envNum(process.env.ARTIFACT_EXPORT_WORKER_WATERMARK_MB, 512),
+    /** 상주 워커 진입점 — task-runtime 이미지의 report-template 툴킷. */
+    workerScript: process.env.ARTIFACT_EXPORT_WORKER_SCRIPT || '/opt/report-template/export_worker.py',
     user: process.env.ARTIFACT_EXPORT_USER || '1000:1000',
     /** 레이트 리밋 (변환은 비용이 커 보수적). */
     rateWindowMs: envNum(process.env.ARTIFACT_EXPORT_RATE_WINDOW_MS, 60_000),
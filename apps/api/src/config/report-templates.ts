@@ -5,12 +5,16 @@
  * ```reportdata 블록으로 데이터(JSON)만 생성한다 — 예약 리포트(render_report.py)와
  * 동일한 "renderer owns design" 계약의 채팅 경로 버전.
  *
- * 새 템플릿 추가 시: ① src/report-templates/ 에 HTML 작성 ② 여기 스펙 등록
- * ③ contract 에 LLM 에게 보여줄 데이터 계약을 기술.
+ * 그룹 스펙·길이 상한·표/차트 상한은 render_report.py 와 공유하는 src/report-templates/registry.json
+ * 이 원본이다(task-runtime 이미지에는 빌드 컨텍스트 report-templates 로 함께 베이킹).
+ *
+ * 새 템플릿 추가 시: ① src/report-templates/ 에 HTML 작성 ② registry.json 에 스펙 등록
+ * ③ 여기 CONTRACTS 에 LLM 에게 보여줄 데이터 계약을 기술.
  *
  * @module config/report-templates
  */
 import path from 'path';
+import registry from '../report-templates/registry.json';
 
 /** 반복 그룹(<!-- REPEAT:NAME -->) 렌더 방식. */
 export type ReportGroupKind =
@@ -49,41 +53,39 @@ export interface ReportTemplateSpec {
 export const REPORT_TEMPLATES_DIR = process.env.REPORT_TEMPLATES_DIR
     || path.resolve(__dirname, '../report-templates');
 
-export const REPORT_TEMPLATES: Record<string, ReportTemplateSpec> = {
-    'generic-report': {
-        file: 'generic-report.html',
-        groups: {
-            KPIS: { source: 'kpis', kind: 'flat' },
-            SECTIONS: { source: 'sections', kind: 'section' },
-            SOURCES: {
-                source: 'sources',
-                kind: 'source',
-                emptyHtml: '<div class="source-line"><span class="num">—</span><span>출처 미제공</span></div>',
-            },
-        },
-        maxLen: { KICKER: 40 },
-        contract: [
-            '{',
-            '  "template": "generic-report",',
-            '  "data": {',
-            '    "KICKER": "짧은 카테고리 라벨 (예: MARKET RESEARCH, 40자 이내)",',
-            '    "REPORT_TITLE": "보고서 제목",',
-            '    "SUBTITLE": "제목 아래 한두 문장 요지",',
-            '    "TOPLINE": "조사 범위·방법 한 줄",',
-            '    "SUMMARY": "핵심 요약 3~5문장",',
-            '    "kpis": [ { "label": "지표명", "value": "값", "note": "부연", "delta": "+7%", "deltaclass": "up|down|steady" } ],',
-            '    "sections": [ {',
-            '      "kicker": "섹션 카테고리 라벨", "heading": "섹션 제목",',
-            '      "paragraphs": ["본문 문단", "..."],',
-            '      "bullets": ["요점", "..."],',
-            '      "table": { "headers": ["열1", "열2"], "rows": [["값", "값"]] },',
-            '      "chart": { "type": "bar|line", "title": "차트 제목", "labels": ["항목"], "values": [숫자], "unit": "%" }',
-            '    } ],',
-            '    "sources": [ { "title": "출처 제목", "url": "https://..." } ]',
-            '  }',
-            '}',
-            '- kpis 는 0~4개. sections 는 2개 이상 필수 — paragraphs/bullets/table/chart 는 각 섹션에서 필요한 것만 포함.',
-            '- 조사에 사용한 실제 출처를 sources 에 전부 담는다. 값은 전부 조사 근거 기반 — 지어내지 마라.',
-        ].join('\n'),
-    },
+/** 렌더 상한 — 표 행·차트 항목 (초과분은 경고와 함께 절단). py 렌더러와 같은 값. */
+export const REPORT_LIMITS: { tableMaxRows: number; chartMaxItems: number } = registry.limits;
+
+/** 템플릿별 LLM 데이터 계약 — 프롬프트 전용이라 공유 레지스트리에 두지 않는다. */
+const CONTRACTS: Record<string, string> = {
+    'generic-report': [
+        '{',
+        '  "template": "generic-report",',
+        '  "data": {',
+        '    "KICKER": "짧은 카테고리 라벨 (예: MARKET RESEARCH, 40자 이내)",',
+        '    "REPORT_TITLE": "보고서 제목",',
+        '    "SUBTITLE": "제목 아래 한두 문장 요지",',
+        '    "TOPLINE": "조사 범위·방법 한 줄",',
+        '    "SUMMARY": "핵심 요약 3~5문장",',
+        '    "kpis": [ { "label": "지표명", "value": "값", "note": "부연", "delta": "+7%", "deltaclass": "up|down|steady" } ],',
+        '    "sections": [ {',
+        '      "kicker": "섹션 카테고리 라벨", "heading": "섹션 제목",',
+        '      "paragraphs": ["본문 문단", "..."],',
+        '      "bullets": ["요점", "..."],',
+        '      "table": { "headers": ["열1", "열2"], "rows": [["값", "값"]] },',
+        '      "chart": { "type": "bar|line", "title": "차트 제목", "labels": ["항목"], "values": [숫자], "unit": "%" }',
+        '    } ],',
+        '    "sources": [ { "title": "출처 제목", "url": "https://..." } ]',
+        '  }',
+        '}',
+        '- kpis 는 0~4개. sections 는 2개 이상 필수 — paragraphs/bullets/table/chart 는 각 섹션에서 필요한 것만 포함.',
+        '- 조사에 사용한 실제 출처를 sources 에 전부 담는다. 값은 전부 조사 근거 기반 — 지어내지 마라.',
+    ].join('\n'),
 };
+
+export const REPORT_TEMPLATES: Record<string, ReportTemplateSpec> = Object.fromEntries(
+    Object.entries<unknown>(registry.templates).map(([id, spec]) => [
+        id,
+        { ...(spec as Omit<ReportTemplateSpec, 'contract'>), contract: CONTRACTS[id] ?? '' },
+    ]),
+);
@@ -470,6 +470,14 @@ if (require.main === module) {
                 console.error('[Shutdown] MCP supervisor 정리 중 오류:', error);
             }
 
+            // 상주 export 워커(docx 변환 컨테이너) 정리
+            try {
+                const { shutdownExportWorkers } = await import('./services/report/artifact-export-service');
+                shutdownExportWorkers();
+            } catch (error) {
+                console.error('[Shutdown] export 워커 정리 중 오류:', error);
+            }
+
             server.stop();
         };
 
@@ -1,8 +1,8 @@
 /**
  * 아티팩트 export 순수 함수 테스트 — docker 인자 격리 원칙·pdf 스크립트 임베딩 계약.
  */
-import { buildExportDockerArgs, buildPdfScript } from '../artifact-export-service';
-import { REPORT_DOCX_SCRIPT } from '../docx-script';
+import { buildExportDockerArgs, buildExportWorkerCommand, buildPdfScript } from '../artifact-export-service';
+import { REPORT_DOCX_SCRIPT, REPORT_TOOLKIT_DIR } from '../docx-script';
 
 describe('buildExportDockerArgs', () => {
     it('3 샌드박스 공통 격리 원칙 — cap-drop·no-new-privileges·read-only·network none·swap 차단', () => {
@@ -24,6 +24,17 @@ describe('buildExportDockerArgs', () => {
     });
 });
 
+describe('buildExportWorkerCommand', () => {
+    it('상주 워커 — export_worker.py 를 docx_report 선로드·잡 상한(초)·RSS 워터마크와 함께', () => {
+        const cmd = buildExportWorkerCommand();
+        expect(cmd[0]).toBe('python3');
+        expect(cmd[1]).toMatch(/export_worker\.py$/);
+        expect(cmd[cmd.indexOf('--preload') + 1]).toBe('docx_report');
+        expect(Number(cmd[cmd.indexOf('--timeout') + 1])).toBeGreaterThan(0);
+        expect(Number(cmd[cmd.indexOf('--watermark-mb') + 1])).toBeGreaterThan(0);
+    });
+});
+
 describe('buildPdfScript', () => {
     it('html 은 base64 로만 임베드 — 원문/따옴표가 스크립트에 노출되지 않는다', () => {
         const html = `<script>alert('x "quote" \\backtick\`')</script>`;
@@ -36,8 +47,18 @@ describe('buildPdfScript', () => {
 });
 
 describe('REPORT_DOCX_SCRIPT', () => {
-    it('정적 스크립트 — stdin JSON 읽기·stdout base64 출력 계약 유지', () => {
-        expect(REPORT_DOCX_SCRIPT).toContain('json.load(sys.stdin)');
-        expect(REPORT_DOCX_SCRIPT).toContain('base64.b64encode');
+    it('정적 스크립트 — 툴킷의 docx_report.main()(stdin JSON → stdout base64) 을 부른다', () => {
+        expect(REPORT_DOCX_SCRIPT).toContain(`sys.path.insert(0, '${REPORT_TOOLKIT_DIR}')`);
+        expect(REPORT_DOCX_SCRIPT).toContain('import docx_report');
+        expect(REPORT_DOCX_SCRIPT).toContain('docx_report.main()');
+    });
+
+    it('템플릿 리터럴 이스케이프가 파이썬 소스에 제어문자를 심지 않는다 (chr() 사용 계약)', () => {
+        expect(REPORT_DOCX_SCRIPT).not.toMatch(/[\x00-\x08\x0b\x0c\x0e-\x1f]/);
+    });
+
+    it('변환 코드를 스크립트에 다시 싣지 않는다 — docx_report.py 한 벌만 유지', () => {
+        expect(REPORT_DOCX_SCRIPT).not.toContain('from docx import');
+        expect(REPORT_DOCX_SCRIPT).not.toContain('etree');
     });
 });
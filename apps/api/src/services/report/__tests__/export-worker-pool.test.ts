@@ -0,0 +1,89 @@
+/**
+ * 상주 export 워커 풀 테스트 — 길이 접두 프레임 계약·워커 재사용/재활용 (가짜 워커 프로세스).
+ */
+import { EventEmitter } from 'events';
+import { PassThrough } from 'stream';
+import type { ChildProcessWithoutNullStreams } from 'child_process';
+import { encodeFrame, FrameDecoder, ExportWorkerPool, type ExportWorkerResult } from '../export-worker-pool';
+
+type Job = { id: string; script: string; input: string };
+
+/** export_worker.py 흉내 — 잡 프레임마다 respond 결과를 응답 프레임으로 (null 이면 무응답). */
+function fakeWorker(respond: (job: Job) => Partial<ExportWorkerResult> | null) {
+    const proc = new EventEmitter() as EventEmitter & {
+        stdin: PassThrough; stdout: PassThrough; stderr: PassThrough; kill: jest.Mock;
+    };
+    proc.stdin = new PassThrough();
+    proc.stdout = new PassThrough();
+    proc.stderr = new PassThrough();
+    proc.kill = jest.fn(() => { proc.emit('close', null); return true; });
+    proc.stdin.on('finish', () => proc.emit('close', 0)); // stdin EOF → 워커 종료
+    const decoder = new FrameDecoder(1 << 20);
+    proc.stdin.on('data', (d: Buffer) => {
+        for (const job of decoder.push(d) as Job[]) {
+            const r = respond(job);
+            if (r) proc.stdout.write(encodeFrame({ id: job.id, ok: true, recycle: false, ...r }));
+        }
+    });
+    return proc as unknown as ChildProcessWithoutNullStreams & { emit: EventEmitter['emit'] };
+}
+
+describe('encodeFrame / FrameDecoder', () => {
+    it('4바이트 빅엔디언 길이 + UTF-8 JSON — 조각 경계와 무관하게 복원', () => {
+        const frame = encodeFrame({ id: '1', output: '한글 출력' });
+        expect(frame.readUInt32BE(0)).toBe(frame.length - 4);
+        const stream = Buffer.concat([frame, encodeFrame({ id: '2' })]);
+        const decoder = new FrameDecoder(1 << 20);
+        const got: unknown[] = [];
+        for (let i = 0; i < stream.length; i += 3) got.push(...decoder.push(stream.subarray(i, i + 3)));
+        expect(got).toEqual([{ id: '1', output: '한글 출력' }, { id: '2' }]);
+    });
+
+    it('상한을 넘는 길이 헤더는 본문을 기다리지 않고 거부', () => {
+        const decoder = new FrameDecoder(8);
+        expect(() => decoder.push(encodeFrame({ output: 'x'.repeat(32) }))).toThrow('프레임 크기 상한 초과');
+    });
+});
+
+describe('ExportWorkerPool', () => {
+    it('순차 잡은 같은 워커를 재사용한다 (기동 1회)', async () => {
+        const spawn = jest.fn(() => fakeWorker((job) => ({ output: `out:${job.input}` })));
+        const pool = new ExportWorkerPool(spawn, 2, 1 << 20);
+        expect((await pool.run('s', 'a', 1000))?.output).toBe('out:a');
+        expect((await pool.run('s', 'b', 1000))?.output).toBe('out:b');
+        expect(spawn).toHaveBeenCalledTimes(1);
+        pool.shutdown();
+    });
+
+    it('recycle 응답이면 결과는 돌려주고 빈자리를 새 워커로 채운다', async () => {
+        const spawn = jest.fn(() => fakeWorker(() => ({ output: 'x', recycle: true, rss_mb: 600 })));
+        const pool = new ExportWorkerPool(spawn, 1, 1 << 20);
+        const r = await pool.run('s', '', 1000);
+        expect(r?.ok).toBe(true);
+        expect(spawn).toHaveBeenCalledTimes(2);
+        expect(pool.workerCount).toBe(1);
+        pool.shutdown();
+    });
+
+    it('워커가 모두 바쁘고 상한이면 null — 호출측 one-shot', async () => {
+        const pool = new ExportWorkerPool(() => fakeWorker(() => null), 1, 1 << 20);
+        void pool.run('s', '', 60_000);
+        expect(await pool.run('s', '', 60_000)).toBeNull();
+        pool.shutdown();
+    });
+
+    it('잡 도중 워커가 죽으면 WORKER_EXITED, 다음 잡은 새 워커', async () => {
+        const procs: ReturnType<typeof fakeWorker>[] = [];
+        const pool = new ExportWorkerPool(() => {
+            const p = fakeWorker((job) => (job.script === 'die' ? null : { output: 'ok' }));
+            procs.push(p);
+            return p;
+        }, 1, 1 << 20);
+        const pending = pool.run('die', '', 60_000);
+        procs[0].emit('close', 137);
+        expect((await pending)?.code).toBe('WORKER_EXITED');
+        expect((await pool.run('s', '', 1000))?.output).toBe('ok');
+        expect(procs).toHaveLength(2);
+        pool.shutdown();
+    });
+});
@@ -0,0 +1,27 @@
+/**
+ * 보고서 렌더러 골든 코퍼스 — report-renderer.ts 와 render_report.py 가 같은 바이트를 내는지.
+ *
+ * golden/<case>.json({ template, now, data })의 기대 출력 golden/<case>.html 을 두 구현이
+ * 공유한다. 양쪽 동시 비교·처리량 측정은 scripts/eval/report-renderer-parity.js.
+ */
+import fs from 'fs';
+import path from 'path';
+import { renderReport } from '../report-renderer';
+
+const GOLDEN_DIR = path.join(__dirname, 'golden');
+const CASES = fs.readdirSync(GOLDEN_DIR).filter((f) => f.endsWith('.json')).sort();
+
+describe('renderReport 골든 코퍼스', () => {
+    it('코퍼스가 비어 있지 않고 케이스마다 기대 HTML 이 있다', () => {
+        expect(CASES.length).toBeGreaterThan(0);
+        for (const f of CASES) {
+            expect(fs.existsSync(path.join(GOLDEN_DIR, f.replace(/\.json$/, '.html')))).toBe(true);
+        }
+    });
+
+    it.each(CASES)('%s — 기대 HTML 과 바이트 단위 일치', (file) => {
+        const c = JSON.parse(fs.readFileSync(path.join(GOLDEN_DIR, file), 'utf-8'));
+        const expected = fs.readFileSync(path.join(GOLDEN_DIR, file.replace(/\.json$/, '.html')), 'utf-8');
+        expect(renderReport(c.template, c.data, new Date(c.now)).html).toBe(expected);
+    });
+});
@@ -60,6 +60,15 @@ describe('renderReport(generic-report)', () => {
         expect(html).toContain('a &amp; b &lt;i&gt;');
     });
 
+    it('항목 값 안의 {{TOKEN}} 문자열은 재치환되지 않는다 (단일 패스 렌더)', () => {
+        const { html } = renderReport('generic-report', {
+            ...FULL_DATA,
+            sections: [{ heading: '{{SUMMARY}} 인용', paragraphs: ['본문 {{REPORT_TITLE}}'] }],
+        }, FIXED_NOW);
+        expect(html).toContain('{{SUMMARY}} 인용');
+        expect(html).toContain('<p>본문 {{REPORT_TITLE}}</p>');
+    });
+
     it('출처 URL 은 http(s)만 링크 — 그 외 스킴은 텍스트 강등', () => {
         const { html } = renderReport('generic-report', FULL_DATA, FIXED_NOW);
         expect(html).toContain('href="https://kind.krx.co.kr/x"');
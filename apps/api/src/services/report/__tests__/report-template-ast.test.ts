@@ -0,0 +1,75 @@
+/**
+ * 템플릿 사전 컴파일 AST 테스트 — 노드 구조·render_report.py 호환 포맷·해시 무효화.
+ */
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import {
+    buildTemplateAst,
+    compileTemplate,
+    loadTemplateAst,
+    templateAstPath,
+    writeTemplateAst,
+    TEMPLATE_AST_FORMAT,
+} from '../report-template-ast';
+
+const TPL = [
+    '<h1>{{TITLE}}</h1>',
+    '<ul>',
+    '  <!-- REPEAT:ITEMS -->',
+    '  <li>{{ITEM_NAME}} · {{TITLE}}</li>',
+    '  <!-- /REPEAT -->',
+    '</ul><p>{{COUNT}} {{TITLE}}</p>',
+].join('\n');
+
+describe('compileTemplate', () => {
+    it('리터럴·토큰·반복 노드로 평면 분해 — REPEAT 마커 줄은 소비', () => {
+        const nodes = compileTemplate(TPL);
+        expect(nodes).toEqual([
+            ['text', '<h1>'], ['token', 'TITLE'], ['text', '</h1>\n<ul>\n'],
+            ['repeat', 'ITEMS', [['text', '  <li>'], ['token', 'ITEM_NAME'], ['text', ' · '], ['token', 'TITLE'], ['text', '</li>\n']]],
+            ['text', '</ul><p>'], ['token', 'COUNT'], ['text', ' '], ['token', 'TITLE'], ['text', '</p>'],
+        ]);
+    });
+
+    it('AST 메타 — 스칼라 키(중복 제거·반복 블록 밖만)와 그룹 목록', () => {
+        const ast = buildTemplateAst(Buffer.from(TPL, 'utf-8'), 't.html');
+        expect(ast.format).toBe(TEMPLATE_AST_FORMAT);
+        expect(ast.scalars).toEqual(['TITLE', 'COUNT']);
+        expect(ast.groups).toEqual(['ITEMS']);
+        expect(ast.sha256).toMatch(/^[0-9a-f]{64}$/);
+    });
+});
+
+describe('loadTemplateAst', () => {
+    let dir: string;
+    beforeEach(() => { dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tpl-ast-')); });
+    afterEach(() => { fs.rmSync(dir, { recursive: true, force: true }); });
+
+    it('해시가 일치하는 사전 컴파일 AST 를 그대로 사용', () => {
+        const file = path.join(dir, 't.html');
+        fs.writeFileSync(file, TPL);
+        expect(writeTemplateAst(file)).toBe(path.join(dir, 't.ast.json'));
+        // 노드를 표식값으로 바꿔도 해시가 맞으면 재파싱하지 않는다
+        const ast = JSON.parse(fs.readFileSync(templateAstPath(file), 'utf-8'));
+        ast.nodes = [['text', 'precompiled']];
+        fs.writeFileSync(templateAstPath(file), JSON.stringify(ast));
+        expect(loadTemplateAst(file).nodes).toEqual([['text', 'precompiled']]);
+    });
+
+    it('템플릿이 바뀌어 해시가 다르면 AST 무효 → 재컴파일', () => {
+        const file = path.join(dir, 't.html');
+        fs.writeFileSync(file, TPL);
+        writeTemplateAst(file);
+        fs.writeFileSync(file, '<b>{{OTHER}}</b>');
+        expect(loadTemplateAst(file).scalars).toEqual(['OTHER']);
+    });
+
+    it('AST 파일 부재·손상 시 메모리 컴파일로 폴백', () => {
+        const file = path.join(dir, 't.html');
+        fs.writeFileSync(file, TPL);
+        expect(loadTemplateAst(file).groups).toEqual(['ITEMS']);
+        fs.writeFileSync(templateAstPath(file), '{not json');
+        expect(loadTemplateAst(file).groups).toEqual(['ITEMS']);
+    });
+});
@@ -5,7 +5,10 @@
  * - pdf: task-runtime 이미지의 playwright chromium 으로 headless print (fonts-nanum 한글).
  *   변환 스크립트(node 프로그램)는 stdin 으로 전달 — html 은 base64 로 스크립트에 임베드,
  *   산출물은 stdout 에 base64 로 출력(바이너리 파이프 오염 방지).
- * - docx: /opt/pyenv 의 python-docx 로 reportdata source_data(JSON, stdin)에서 직접 생성.
+ * - docx: /opt/pyenv 의 python-docx 로 reportdata source_data(JSON, stdin)에서 직접 생성 —
+ *   변환 코드는 report-template 툴킷의 docx_report.py(예약 리포트 --docx 와 공용).
+ *   ARTIFACT_EXPORT_WARM_WORKERS > 0 이면 상주 워커 풀(export-worker-pool)로 같은 스크립트를
+ *   돌려 컨테이너 기동·import 비용을 없앤다. 워커가 없거나 죽으면 one-shot 컨테이너로.
  *
  * 격리: artifact-exec 와 동일한 3 샌드박스 공통 원칙 — cap-drop ALL·no-new-privileges·
  * non-root·read-only(+tmpfs)·network none·pids-limit·memory=memory-swap.
@@ -17,6 +20,7 @@ import { createLogger } from '../../utils/logger';
 import { resolveDocker } from '../../mcp/sandbox-docker';
 import { ARTIFACT_EXPORT } from '../../config/artifact-export';
 import { REPORT_DOCX_SCRIPT } from './docx-script';
+import { ExportWorkerPool, type ExportWorkerResult } from './export-worker-pool';
 
 const log = createLogger('ArtifactExport');
 
@@ -56,6 +60,17 @@ export function buildExportDockerArgs(command: string[]): string[] {
     ];
 }
 
+/** PURE: 상주 워커 실행 명령 — docx_report(python-docx·lxml 포함)를 기동 때 import, 잡 상한·RSS 워터마크는 워커가 지킨다. */
+export function buildExportWorkerCommand(): string[] {
+    const c = ARTIFACT_EXPORT;
+    return [
+        'python3', c.workerScript,
+        '--preload', 'docx_report',
+        '--timeout', String(c.timeoutMs / 1000),
+        '--watermark-mb', String(c.workerWatermarkMb),
+    ];
+}
+
 /**
  * pdf 변환용 node 프로그램 — stdin 으로 node 에 파이프된다.
  * html 은 base64 로 임베드(스크립트 인젝션 표면 제거), pdf 는 stdout 에 base64.
@@ -118,7 +133,47 @@ function runDocker(dockerPath: string, args: string[], stdinData: string): Promi
 /** 동시 변환 세마포어 — artifact-exec 와 동일 모델(단일 워커 전제). */
 let inFlight = 0;
 
-async function runExport(command: string[], stdinData: string, format: ExportFormat, mime: string): Promise<ArtifactExportResult> {
+let workerPool: ExportWorkerPool | null = null;
+
+/** 상주 워커 풀 (지연 생성) — warmWorkers 가 0 이면 null. */
+function getWorkerPool(dockerPath: string): ExportWorkerPool | null {
+    const c = ARTIFACT_EXPORT;
+    if (c.warmWorkers <= 0) return null;
+    if (!workerPool) {
+        const args = buildExportDockerArgs(buildExportWorkerCommand());
+        workerPool = new ExportWorkerPool(
+            () => spawn(dockerPath, args, { stdio: ['pipe', 'pipe', 'pipe'] }),
+            Math.min(c.warmWorkers, c.maxConcurrent),
+            c.outputMaxBytes + 64 * 1024, // base64 출력 + JSON 봉투
+        );
+    }
+    return workerPool;
+}
+
+/** 상주 워커 정리 — stdin EOF 로 워커가 끝나고 컨테이너는 --rm 으로 지워진다 (graceful shutdown). */
+export function shutdownExportWorkers(): void {
+    workerPool?.shutdown();
+    workerPool = null;
+}
+
+/** 워커 결과 → export 결과. 시간 초과는 504, 그 외 실패는 500 (one-shot 과 같은 오류 계약). */
+function fromWorker(r: ExportWorkerResult, format: ExportFormat, mime: string, durationMs: number): ArtifactExportResult {
+    if (r.code === 'TIMEOUT') {
+        throw new ArtifactExportError(`변환 시간 초과 (${ARTIFACT_EXPORT.timeoutMs}ms)`, 504, 'EXPORT_TIMEOUT');
+    }
+    if (!r.ok || !r.output?.trim()) {
+        log.warn(`[Export] ${format} 워커 변환 실패 code=${r.code}: ${(r.error || '').slice(0, 500)}`);
+        throw new ArtifactExportError('변환에 실패했습니다', 500, 'EXPORT_FAILED');
+    }
+    log.info(`[Export] ${format} 변환 완료 (warm ${durationMs}ms, 워커 ${r.ms}ms, rss ${r.rss_mb}MB)`);
+    return { format, mime, dataBase64: r.output.trim(), durationMs };
+}
+
+/**
+ * @param warmScript 주면 상주 워커 풀에서 이 python 스크립트를 stdinData 로 실행(가능할 때).
+ *   command 는 워커를 못 쓸 때의 one-shot 명령.
+ */
+async function runExport(command: string[], stdinData: string, format: ExportFormat, mime: string, warmScript?: string): Promise<ArtifactExportResult> {
     if (!ARTIFACT_EXPORT.enabled) {
         throw new ArtifactExportError('export 기능이 비활성화되어 있습니다', 503, 'EXPORT_DISABLED');
     }
@@ -131,6 +186,14 @@ async function runExport(command: string[], stdinData: string, format: ExportFor
     }
     inFlight++;
     try {
+        const pool = warmScript !== undefined ? getWorkerPool(dockerPath) : null;
+        if (pool && warmScript !== undefined) {
+            const started = Date.now();
+            const warm = await pool.run(warmScript, stdinData, ARTIFACT_EXPORT.timeoutMs);
+            // null = 워커 모두 사용 중, WORKER_EXITED = 워커가 잡 도중 죽음 → one-shot 으로 처리
+            if (warm && warm.code !== 'WORKER_EXITED') return fromWorker(warm, format, mime, Date.now() - started);
+            if (warm) log.warn(`[Export] ${format} 워커 이탈 — one-shot 재시도: ${warm.error}`);
+        }
         const r = await runDocker(dockerPath, buildExportDockerArgs(command), stdinData);
         if (r.timedOut) {
             throw new ArtifactExportError(`변환 시간 초과 (${ARTIFACT_EXPORT.timeoutMs}ms)`, 504, 'EXPORT_TIMEOUT');
@@ -166,5 +229,6 @@ export async function exportArtifactDocx(sourceData: Record<string, unknown>): P
         json,
         'docx',
         'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        REPORT_DOCX_SCRIPT,
     );
 }
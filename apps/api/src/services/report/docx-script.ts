@@ -3,83 +3,26 @@
  *
  * 데이터는 stdin(JSON), 산출물은 stdout(base64 docx) — 스크립트 자체는 정적이라
  * 사용자 데이터가 코드에 섞이지 않는다(인젝션 표면 없음). task-runtime 이미지의
- * /opt/pyenv(python-docx)에서 실행. generic-report 데이터 계약(config/report-templates)의
- * 구조(kpis/sections/sources)를 워드 문서로 직역한다 — html→docx 변환보다 고품질.
+ * /opt/pyenv(python-docx)에서 실행.
+ *
+ * 변환 구현은 이미지의 report-template 툴킷(docx_report.py)에 한 벌만 있다 — 예약 리포트의
+ * `render_report.py --docx` 와 같은 코드가 generic-report 데이터 계약(config/report-templates)의
+ * 구조(kpis/sections/sources)를 레지스트리 스펙 순서대로 워드 문서로 옮긴다(표 본문 행 lxml 일괄
+ * 조립·문서당 1회 스타일 해석 포함). 이 스크립트는 툴킷을 import 경로에 넣고 진입점만 부른다.
+ * 레지스트리(registry.json)가 없는 이미지(report-templates 빌드 컨텍스트 생략)에서는 툴킷에 내장된
+ * generic-report 그룹 스펙으로 돈다. KPI 표 열은 예전 그대로 Label/Value/Note/Delta 고정.
+ * 상주 워커(export_worker.py --preload docx_report)는 모듈을 기동 때 이미 올려 둔다.
  *
  * @module services/report/docx-script
  */
-export const REPORT_DOCX_SCRIPT = `
-import sys, json, base64, io
-from docx import Document
-
-payload = json.load(sys.stdin)
-data = payload.get('data', payload) if isinstance(payload, dict) else {}
-
-def s(v):
-    return '' if v is None else str(v)
-
-doc = Document()
-doc.add_heading(s(data.get('REPORT_TITLE') or 'Report'), 0)
-if data.get('SUBTITLE'):
-    doc.add_paragraph(s(data['SUBTITLE']))
-meta = ' - '.join(s(data[k]) for k in ('KICKER', 'RUN_DATE', 'TOPLINE') if data.get(k))
-if meta:
-    doc.add_paragraph(meta)
 
-if data.get('SUMMARY'):
-    doc.add_heading('Executive Summary', level=1)
-    doc.add_paragraph(s(data['SUMMARY']))
+/** task-runtime 이미지의 보고서 툴킷 위치 (Dockerfile: COPY report-template/ /opt/report-template/). */
+export const REPORT_TOOLKIT_DIR = '/opt/report-template';
 
-def add_table(headers, rows):
-    if not headers:
-        return
-    t = doc.add_table(rows=1, cols=len(headers))
-    try:
-        t.style = 'Light Grid Accent 1'
-    except Exception:
-        pass
-    for i, h in enumerate(headers):
-        t.rows[0].cells[i].text = s(h)
-    for r in rows:
-        cells = t.add_row().cells
-        vals = r if isinstance(r, list) else [r]
-        for i, c in enumerate(vals):
-            if i < len(cells):
-                cells[i].text = s(c)
-
-kpis = data.get('kpis') or []
-if isinstance(kpis, list) and kpis:
-    add_table(['Label', 'Value', 'Note', 'Delta'],
-              [[k.get('label'), k.get('value'), k.get('note'), k.get('delta')]
-               for k in kpis if isinstance(k, dict)])
-
-for sec in (data.get('sections') or []):
-    if not isinstance(sec, dict):
-        continue
-    doc.add_heading(s(sec.get('heading') or ''), level=1)
-    for p in (sec.get('paragraphs') or []):
-        doc.add_paragraph(s(p))
-    for b in (sec.get('bullets') or []):
-        doc.add_paragraph(s(b), style='List Bullet')
-    tb = sec.get('table')
-    if isinstance(tb, dict):
-        add_table(tb.get('headers') or [], tb.get('rows') or [])
-    ch = sec.get('chart')
-    if isinstance(ch, dict) and (ch.get('labels') or []):
-        labels = ch.get('labels') or []
-        values = ch.get('values') or []
-        unit = s(ch.get('unit'))
-        line = ', '.join(f"{s(l)}={s(v)}{unit}" for l, v in zip(labels, values))
-        doc.add_paragraph((s(ch.get('title')) + ': ' if ch.get('title') else '') + line)
-
-sources = data.get('sources') or []
-if isinstance(sources, list) and sources:
-    doc.add_heading('Sources', level=1)
-    for i, src in enumerate(sources, 1):
-        if isinstance(src, dict):
-            doc.add_paragraph(f"{i}. {s(src.get('title'))} - {s(src.get('url'))}")
-
-buf = io.BytesIO()
-doc.save(buf)
-sys.stdout.write(base64.b64encode(buf.getvalue()).decode())
+export const REPORT_DOCX_SCRIPT = `
+import sys
+if '${REPORT_TOOLKIT_DIR}' not in sys.path:
+    sys.path.insert(0, '${REPORT_TOOLKIT_DIR}')
+import docx_report
+docx_report.main()
 `;
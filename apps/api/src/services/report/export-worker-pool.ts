@@ -0,0 +1,214 @@
+/**
+ * 상주 export 워커 풀 — 변환 컨테이너를 미리 띄워 두고 잡을 길이 접두 JSON 프레임으로 주고받는다.
+ *
+ * 잡마다 `docker run` 하면 컨테이너 생성·인터프리터 기동·python-docx import·스크립트 컴파일을
+ * 매번 치른다. 워커(infra/task-runtime/report-template/export_worker.py)는 한 번 기동해 import 를
+ * 끝내 두고 stdin 프레임(잡) → stdout 프레임(결과)을 반복하므로 잡 지연은 변환 시간만 남는다.
+ *
+ * 프레임: 4바이트 빅엔디언 길이 + UTF-8 JSON (export_worker.py 와 같은 형식).
+ * - 잡 시간 상한은 워커가 스스로 지킨다(SIGALRM → code TIMEOUT). 워커가 멈춰 응답이 없으면
+ *   여기서 상한+유예 후 프로세스를 죽이고 TIMEOUT 으로 돌려준다.
+ * - 워커는 RSS 워터마크를 넘기거나 시간 초과가 난 잡 뒤 recycle=true 로 응답하고 종료한다 —
+ *   풀은 그 자리를 새 워커로 미리 채운다(다음 잡도 warm).
+ * - 워커는 한 번에 잡 1건. 모두 바쁘고 상한이면 null — 호출측이 one-shot 컨테이너로 처리한다.
+ *
+ * @module services/report/export-worker-pool
+ */
+import type { ChildProcessWithoutNullStreams } from 'child_process';
+import { createLogger } from '../../utils/logger';
+
+const log = createLogger('ExportWorkerPool');
+
+export const FRAME_HEADER_BYTES = 4;
+/** 워커 무응답 판정 유예 — 워커 자체 타임아웃(SIGALRM)이 먼저 응답할 여유. */
+const HARD_TIMEOUT_GRACE_MS = 5_000;
+
+export interface ExportWorkerResult {
+    id: string;
+    ok: boolean;
+    /** 스크립트 stdout (docx 는 base64) */
+    output?: string;
+    /** TIMEOUT · EXPORT_FAILED · BAD_JOB · BAD_FRAME · WORKER_EXITED */
+    code?: string;
+    error?: string;
+    ms?: number;
+    rss_mb?: number;
+    recycle?: boolean;
+}
+
+/** PURE: 값 → 길이 접두 프레임. */
+export function encodeFrame(value: unknown): Buffer {
+    const body = Buffer.from(JSON.stringify(value), 'utf8');
+    const head = Buffer.alloc(FRAME_HEADER_BYTES);
+    head.writeUInt32BE(body.length, 0);
+    return Buffer.concat([head, body]);
+}
+
+/**
+ * 스트림 조각 → 완성 프레임. 조각 경계와 프레임 경계는 무관하다.
+ * 프레임이 다 모일 때까지 조각을 이어 붙이지 않고 모아만 둔다(수십 MB 출력도 복사 1회).
+ */
+export class FrameDecoder {
+    private chunks: Buffer[] = [];
+    private buffered = 0;
+    /** 현재 프레임 본문 길이 — 헤더를 아직 못 읽었으면 -1 */
+    private need = -1;
+
+    constructor(private readonly maxFrameBytes: number) {}
+
+    push(chunk: Buffer): unknown[] {
+        this.chunks.push(chunk);
+        this.buffered += chunk.length;
+        const frames: unknown[] = [];
+        for (;;) {
+            if (this.need < 0) {
+                if (this.buffered < FRAME_HEADER_BYTES) break;
+                this.need = this.take(FRAME_HEADER_BYTES).readUInt32BE(0);
+                if (this.need > this.maxFrameBytes) {
+                    throw new Error(`프레임 크기 상한 초과: ${this.need} bytes`);
+                }
+            }
+            if (this.buffered < this.need) break;
+            frames.push(JSON.parse(this.take(this.need).toString('utf8')));
+            this.need = -1;
+        }
+        return frames;
+    }
+
+    private take(n: number): Buffer {
+        const all = this.chunks.length === 1 ? this.chunks[0] : Buffer.concat(this.chunks, this.buffered);
+        const rest = all.subarray(n);
+        this.chunks = rest.length ? [rest] : [];
+        this.buffered = rest.length;
+        return all.subarray(0, n);
+    }
+}
+
+interface PendingJob {
+    id: string;
+    resolve: (r: ExportWorkerResult) => void;
+    timer: NodeJS.Timeout;
+}
+
+/** 워커 프로세스 1개 — 잡 1건씩. 프로세스가 죽으면 진행 중 잡은 WORKER_EXITED 로 끝난다. */
+class ExportWorker {
+    private readonly decoder: FrameDecoder;
+    private pending: PendingJob | null = null;
+    dead = false;
+
+    constructor(private readonly proc: ChildProcessWithoutNullStreams, maxFrameBytes: number) {
+        this.decoder = new FrameDecoder(maxFrameBytes);
+        proc.stdout.on('data', (d: Buffer) => this.onData(d));
+        // stderr 는 비워 줘야 파이프가 차서 워커가 멈추지 않는다
+        proc.stderr.on('data', (d: Buffer) => log.debug(`[Worker] ${d.toString('utf8').trim().slice(0, 500)}`));
+        proc.on('error', (e) => this.finish(`워커 기동 실패: ${e.message}`));
+        proc.on('close', (exitCode) => this.finish(`워커 종료 (exit ${exitCode})`));
+        proc.stdin.on('error', () => { /* EPIPE 무시 — close 에서 처리 */ });
+    }
+
+    get busy(): boolean {
+        return this.pending !== null;
+    }
+
+    run(id: string, script: string, input: string, timeoutMs: number): Promise<ExportWorkerResult> {
+        return new Promise((resolve) => {
+            const timer = setTimeout(() => {
+                this.settle({ id, ok: false, code: 'TIMEOUT', error: `워커 무응답 (${timeoutMs}ms)` });
+                this.close(true);
+            }, timeoutMs + HARD_TIMEOUT_GRACE_MS);
+            this.pending = { id, resolve, timer };
+            this.proc.stdin.write(encodeFrame({ id, script, input }));
+        });
+    }
+
+    close(kill = false): void {
+        this.dead = true;
+        this.proc.stdin.end(); // EOF → 워커 정상 종료(컨테이너 --rm 정리)
+        if (kill) this.proc.kill('SIGKILL');
+    }
+
+    private onData(d: Buffer): void {
+        let frames: unknown[];
+        try {
+            frames = this.decoder.push(d);
+        } catch (e) {
+            this.finish(`워커 응답 해석 실패: ${(e as Error).message}`);
+            this.close(true);
+            return;
+        }
+        for (const f of frames) {
+            const r = f as ExportWorkerResult;
+            if (r.recycle) this.dead = true; // 워커가 스스로 종료 중 — 새 잡 배정 금지
+            if (!this.pending || r.id !== this.pending.id) {
+                log.warn(`[Worker] 짝 없는 응답 무시 (id=${r.id}, code=${r.code})`);
+                continue;
+            }
+            this.settle(r);
+        }
+    }
+
+    private finish(reason: string): void {
+        this.dead = true;
+        if (this.pending) this.settle({ id: this.pending.id, ok: false, code: 'WORKER_EXITED', error: reason });
+    }
+
+    private settle(r: ExportWorkerResult): void {
+        const p = this.pending;
+        if (!p) return;
+        clearTimeout(p.timer);
+        this.pending = null;
+        p.resolve(r);
+    }
+}
+
+export class ExportWorkerPool {
+    private workers: ExportWorker[] = [];
+    private seq = 0;
+    private closed = false;
+
+    /**
+     * @param spawnWorker 워커 프로세스 기동 (docker run -i ... export_worker.py)
+     * @param size 상주 워커 상한
+     * @param maxFrameBytes 응답 프레임 상한 (출력 캡)
+     */
+    constructor(
+        private readonly spawnWorker: () => ChildProcessWithoutNullStreams,
+        private readonly size: number,
+        private readonly maxFrameBytes: number,
+    ) {}
+
+    /** 유휴 워커에 잡 배정 — 없으면 상한까지 새로 띄운다. 모두 바쁘고 상한이면 null. */
+    async run(script: string, input: string, timeoutMs: number): Promise<ExportWorkerResult | null> {
+        if (this.closed) return null;
+        this.workers = this.workers.filter((w) => !w.dead);
+        let worker = this.workers.find((w) => !w.busy);
+        if (!worker) {
+            if (this.workers.length >= this.size) return null;
+            worker = this.spawn();
+        }
+        const result = await worker.run(String(++this.seq), script, input, timeoutMs);
+        if (result.recycle && !this.closed) {
+            // 정상 재활용 — 빈자리를 바로 채워 다음 잡도 warm. 기동 실패는 다음 잡에서 드러난다.
+            this.workers = this.workers.filter((w) => w !== worker);
+            this.spawn();
+            log.info(`[Pool] 워커 재활용 (rss ${result.rss_mb}MB, code ${result.code ?? 'OK'})`);
+        }
+        return result;
+    }
+
+    get workerCount(): number {
+        return this.workers.filter((w) => !w.dead).length;
+    }
+
+    shutdown(): void {
+        this.closed = true;
+        for (const w of this.workers) w.close();
+        this.workers = [];
+    }
+
+    private spawn(): ExportWorker {
+        const worker = new ExportWorker(this.spawnWorker(), this.maxFrameBytes);
+        this.workers.push(worker);
+        return worker;
+    }
+}
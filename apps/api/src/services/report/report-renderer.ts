@@ -6,26 +6,27 @@
  * 바뀌지 않고, LLM 문자열은 전부 escape 되어 마크업으로 해석되지 않는다(아티팩트
  * iframe·공유 뷰어로 서빙되는 산출물).
  *
- * py 렌더러와의 차이: 반복 그룹이 region 필터가 아니라 레지스트리
- * (config/report-templates.ts) 의 kind(flat/section/source)로 렌더된다 —
- * section 은 paragraphs/bullets/table/chart 를 렌더러가 안전 HTML 로 조립한다.
+ * 템플릿은 사전 컴파일 AST(report-template-ast)로 로드해 단일 선형 패스로 렌더한다 —
+ * 치환된 값은 다시 스캔되지 않으므로 항목 본문의 {{TOKEN}} 문자열이 재치환되지 않는다.
+ *
+ * 반복 그룹은 레지스트리(config/report-templates.ts ← registry.json) 의 kind
+ * (flat/section/source)로 렌더된다 — section 은 paragraphs/bullets/table/chart 를 렌더러가
+ * 안전 HTML 로 조립한다. py 렌더러도 --template ID 로 같은 레지스트리·같은 규칙을 쓴다.
  *
  * @module services/report/report-renderer
  */
-import fs from 'fs';
 import path from 'path';
 import {
+    REPORT_LIMITS,
     REPORT_TEMPLATES,
     REPORT_TEMPLATES_DIR,
     type ReportTemplateGroupSpec,
 } from '../../config/report-templates';
-
-const TOKEN_RE = /\{\{([A-Z0-9_]+)\}\}/g;
-const REPEAT_RE = /[ \t]*<!-- REPEAT:([A-Z0-9_]+) -->\n?([\s\S]*?)[ \t]*<!-- \/REPEAT -->\n?/g;
+import { loadTemplateAst, type TemplateAst, type TemplateLeafNode } from './report-template-ast';
 /** 표 행 상한 — 아티팩트 비대·레이아웃 붕괴 방지 (초과분은 경고와 함께 절단). */
-const TABLE_MAX_ROWS = 50;
+const TABLE_MAX_ROWS = REPORT_LIMITS.tableMaxRows;
 /** 차트 항목 상한 — 막대/라인 모두 이 개수까지만 렌더. */
-const CHART_MAX_ITEMS = 24;
+const CHART_MAX_ITEMS = REPORT_LIMITS.chartMaxItems;
 
 export interface RenderReportResult {
     html: string;
@@ -35,18 +36,17 @@ export interface RenderReportResult {
     title: string;
 }
 
-/** 템플릿 파일 캐시 — 배포 단위로 정적이므로 프로세스 수명 캐시. */
-const templateCache = new Map<string, string>();
+/** 컴파일된 템플릿 캐시 — 배포 단위로 정적이므로 프로세스 수명 캐시. */
+const templateCache = new Map<string, TemplateAst>();
 
-function loadTemplate(templateId: string): string {
+function loadTemplate(templateId: string): TemplateAst {
     const spec = REPORT_TEMPLATES[templateId];
     if (!spec) throw new Error(`알 수 없는 보고서 템플릿: ${templateId}`);
     const cached = templateCache.get(templateId);
     if (cached) return cached;
-    const filePath = path.join(REPORT_TEMPLATES_DIR, spec.file);
-    const tpl = fs.readFileSync(filePath, 'utf-8');
-    templateCache.set(templateId, tpl);
-    return tpl;
+    const ast = loadTemplateAst(path.join(REPORT_TEMPLATES_DIR, spec.file));
+    templateCache.set(templateId, ast);
+    return ast;
 }
 
 function esc(v: unknown): string {
@@ -206,21 +206,25 @@ function itemFields(
 
 function renderGroup(
     spec: ReportTemplateGroupSpec,
-    block: string,
+    block: TemplateLeafNode[],
     items: unknown[],
     warnings: string[],
+    scalar: (tok: string) => string,
 ): string {
     if (items.length === 0) return spec.emptyHtml ?? '';
     const out: string[] = [];
     items.forEach((raw, i) => {
         const item = isRecord(raw) ? raw : {};
         const fields = itemFields(spec, item, i, warnings);
-        out.push(block.replace(TOKEN_RE, (m, tok: string) => {
-            if (!tok.startsWith('ITEM_')) return m; // 스칼라 토큰은 그룹 밖 단계에서 치환
-            if (tok in fields) return fields[tok];
-            warnings.push(`반복 블록 토큰 ${tok} 에 대응하는 항목 필드 없음(—로 채움)`);
-            return '—';
-        }));
+        for (const [kind, v] of block) {
+            if (kind === 'text') out.push(v);
+            else if (!v.startsWith('ITEM_')) out.push(scalar(v)); // 블록 안 스칼라 토큰
+            else if (v in fields) out.push(fields[v]);
+            else {
+                warnings.push(`반복 블록 토큰 ${v} 에 대응하는 항목 필드 없음(—로 채움)`);
+                out.push('—');
+            }
+        }
     });
     return out.join('');
 }
@@ -238,23 +242,10 @@ export function renderReport(
     const tpl = loadTemplate(templateId);
     const warnings: string[] = [];
 
-    // 1) 반복 블록 렌더
-    const usedGroupSources = new Set<string>();
-    let html = tpl.replace(REPEAT_RE, (_whole, name: string, block: string) => {
-        const groupSpec = spec.groups[name];
-        if (!groupSpec) {
-            warnings.push(`레지스트리에 없는 반복 그룹 ${name} — 블록 제거`);
-            return '';
-        }
-        usedGroupSources.add(groupSpec.source);
-        const items = Array.isArray(data[groupSpec.source]) ? data[groupSpec.source] as unknown[] : [];
-        return renderGroup(groupSpec, block, items, warnings);
-    });
-
-    // 2) 스칼라 토큰 치환 (누락 키는 — 로 채우고 경고 — py 렌더러와 동일 계약)
+    // 스칼라 토큰 값 (누락 키는 — 로 채우고 경고 — py 렌더러와 동일 계약)
     const auto = computed(now);
     const missing: string[] = [];
-    html = html.replace(TOKEN_RE, (_m, tok: string) => {
+    const scalar = (tok: string): string => {
         if (tok in auto) return auto[tok];
         const v = data[tok];
         if (v === undefined || v === null || typeof v === 'object') {
@@ -268,12 +259,32 @@ export function renderReport(
             raw = `${raw.slice(0, cap - 1)}…`;
         }
         return esc(raw);
-    });
+    };
+
+    // 단일 패스 렌더 — 리터럴·스칼라 토큰·반복 블록을 템플릿 순서대로 조립
+    const usedGroupSources = new Set<string>();
+    const out: string[] = [];
+    for (const node of tpl.nodes) {
+        if (node[0] === 'text') {
+            out.push(node[1]);
+        } else if (node[0] === 'token') {
+            out.push(scalar(node[1]));
+        } else {
+            const groupSpec = spec.groups[node[1]];
+            if (!groupSpec) {
+                warnings.push(`레지스트리에 없는 반복 그룹 ${node[1]} — 블록 제거`);
+                continue;
+            }
+            usedGroupSources.add(groupSpec.source);
+            const items = Array.isArray(data[groupSpec.source]) ? data[groupSpec.source] as unknown[] : [];
+            out.push(renderGroup(groupSpec, node[2], items, warnings, scalar));
+        }
+    }
+    const html = out.join('');
     if (missing.length > 0) warnings.push(`data 미제공 키(—로 채움): ${[...new Set(missing)].join(', ')}`);
 
-    // 3) 역방향 검사 — 템플릿이 쓰지 않아 조용히 버려지는 데이터 표면화 (py 렌더러 계약).
-    const scalarTokens = new Set<string>();
-    for (const m of tpl.replace(REPEAT_RE, '').matchAll(TOKEN_RE)) scalarTokens.add(m[1]);
+    // 역방향 검사 — 템플릿이 쓰지 않아 조용히 버려지는 데이터 표면화 (py 렌더러 계약).
+    const scalarTokens = new Set(tpl.scalars);
     const unused = Object.keys(data).filter((k) => !scalarTokens.has(k) && !usedGroupSources.has(k));
     if (unused.length > 0) warnings.push(`템플릿이 사용하지 않아 버려진 키: ${unused.join(', ')}`);
 
@@ -0,0 +1,122 @@
+/**
+ * 보고서 템플릿 사전 컴파일 AST — render_report.py 와 공유하는 언어 중립 구조.
+ *
+ * 템플릿을 1회 파싱해 평면 노드 리스트(리터럴 구간·토큰 자리·반복 그룹)로 만든다.
+ * 빌드 시 `<이름>.ast.json` 으로 구워 두면(task-runtime 이미지: render_report.py --compile,
+ * API dist: compile-report-templates) 로드 시 정규식 파싱 없이 그대로 쓴다. 템플릿
+ * sha256 이 AST 의 해시와 다르면 무효로 보고 메모리에서 재컴파일한다.
+ *
+ * 노드: ['text', 문자열] · ['token', 이름] · ['repeat', 그룹명, [text|token 노드...]]
+ *
+ * @module services/report/report-template-ast
+ */
+import * as crypto from 'crypto';
+import fs from 'fs';
+import path from 'path';
+
+const TOKEN_RE = /\{\{([A-Z0-9_]+)\}\}/g;
+const REPEAT_RE = /[ \t]*<!-- REPEAT:([A-Z0-9_]+) -->\n?([\s\S]*?)[ \t]*<!-- \/REPEAT -->\n?/g;
+
+/** AST 포맷 버전 — render_report.py 의 AST_FORMAT 과 동기 유지. */
+export const TEMPLATE_AST_FORMAT = 1;
+
+export type TemplateLeafNode = ['text', string] | ['token', string];
+export type TemplateNode = TemplateLeafNode | ['repeat', string, TemplateLeafNode[]];
+
+export interface TemplateAst {
+    format: number;
+    /** 원본 템플릿 파일명 */
+    source: string;
+    /** 원본 템플릿 바이트의 sha256 (hex) — 불일치 시 AST 무효 */
+    sha256: string;
+    /** 반복 블록 밖 스칼라 토큰 (등장 순서, 중복 제거) */
+    scalars: string[];
+    /** 반복 그룹명 (등장 순서) */
+    groups: string[];
+    nodes: TemplateNode[];
+}
+
+function compileSpan(text: string): TemplateLeafNode[] {
+    const nodes: TemplateLeafNode[] = [];
+    let pos = 0;
+    for (const m of text.matchAll(TOKEN_RE)) {
+        const start = m.index ?? 0;
+        if (start > pos) nodes.push(['text', text.slice(pos, start)]);
+        nodes.push(['token', m[1]]);
+        pos = start + m[0].length;
+    }
+    if (pos < text.length) nodes.push(['text', text.slice(pos)]);
+    return nodes;
+}
+
+/** 템플릿 문자열 → 노드 리스트 (render_report.py compile_template 과 동일 결과). */
+export function compileTemplate(tpl: string): TemplateNode[] {
+    const nodes: TemplateNode[] = [];
+    let pos = 0;
+    for (const m of tpl.matchAll(REPEAT_RE)) {
+        const start = m.index ?? 0;
+        nodes.push(...compileSpan(tpl.slice(pos, start)));
+        nodes.push(['repeat', m[1], compileSpan(m[2])]);
+        pos = start + m[0].length;
+    }
+    nodes.push(...compileSpan(tpl.slice(pos)));
+    return nodes;
+}
+
+export function buildTemplateAst(raw: Buffer, source: string): TemplateAst {
+    const nodes = compileTemplate(raw.toString('utf-8'));
+    const scalars: string[] = [];
+    const groups: string[] = [];
+    for (const n of nodes) {
+        if (n[0] === 'token' && !scalars.includes(n[1])) scalars.push(n[1]);
+        if (n[0] === 'repeat') groups.push(n[1]);
+    }
+    return {
+        format: TEMPLATE_AST_FORMAT,
+        source,
+        sha256: crypto.createHash('sha256').update(raw).digest('hex'),
+        scalars,
+        groups,
+        nodes,
+    };
+}
+
+export function templateAstPath(templatePath: string): string {
+    return templatePath.replace(/\.[^./\\]+$/, '') + '.ast.json';
+}
+
+/**
+ * 템플릿 AST 로드 — 해시가 일치하는 사전 컴파일 AST 가 있으면 그대로, 없거나
+ * 무효(포맷·해시 불일치, 손상)면 메모리에서 컴파일.
+ */
+export function loadTemplateAst(templatePath: string): TemplateAst {
+    const raw = fs.readFileSync(templatePath);
+    const sha256 = crypto.createHash('sha256').update(raw).digest('hex');
+    try {
+        const ast = JSON.parse(fs.readFileSync(templateAstPath(templatePath), 'utf-8')) as TemplateAst;
+        if (ast.format === TEMPLATE_AST_FORMAT && ast.sha256 === sha256 && Array.isArray(ast.nodes)) return ast;
+    } catch {
+        // AST 부재·손상 — 재컴파일로 폴백
+    }
+    return buildTemplateAst(raw, path.basename(templatePath));
+}
+
+/** 템플릿 → AST 파일 기록. 기록한 경로 반환. */
+export function writeTemplateAst(templatePath: string): string {
+    const ast = buildTemplateAst(fs.readFileSync(templatePath), path.basename(templatePath));
+    const out = templateAstPath(templatePath);
+    fs.writeFileSync(out, JSON.stringify(ast));
+    return out;
+}
+
+// 빌드 단계: node dist/services/report/report-template-ast.js <템플릿 디렉토리>
+if (require.main === module) {
+    const dir = process.argv[2];
+    if (!dir) {
+        console.error('사용: node report-template-ast.js <템플릿 디렉토리>');
+        process.exit(1);
+    }
+    for (const f of fs.readdirSync(dir)) {
+        if (f.endsWith('.html')) console.log(`컴파일 완료: ${writeTemplateAst(path.join(dir, f))}`);
+    }
+}
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+render_report.py 성능 벤치마크 — 합성 data.json 으로 단계별 시간·피크 메모리 측정.
+
+기사 0 · 10 · 1k · 10k · 100k 건 규모의 페이로드를 결정적으로 생성한다(긴 한국어 본문,
+값 안에 박힌 {{TOKEN}} 문자열, 초대형 SUMMARY 등 적대적 값 포함). 단계(compile · parse ·
+group · render · write)별 시간을 따로 재고, 피크 메모리는 tracemalloc 을 켠 별도 패스로
+잰다(측정 오버헤드가 시간 수치를 오염시키지 않도록). 결과는 JSON 으로 남겨 커밋 간 비교한다.
+선택 단계(유사 중복 병합·그룹 정렬 상한)는 BENCH_ENV 로 끈 채 잰다 — 셸에 REPORT_DEDUPE·
+REPORT_GROUP_RANK 가 남아 있어도 커밋 간 같은 일을 비교한다(고정값은 결과 JSON 의 env).
+
+사용:
+  python3 bench_report.py                              # 기본 규모 전체, 결과를 stdout
+  python3 bench_report.py --sizes 0,10,1000 --repeat 5 --out bench.json
+  python3 bench_report.py --compare base.json --out new.json   # 기준 대비 배율 출력
+"""
+import sys, os, json, time, random, tempfile, tracemalloc, platform, subprocess, datetime
+
+import render_report as rr
+
+DEFAULT_SIZES = [0, 10, 1000, 10000, 100000]
+PHASES = ["compile", "parse", "group", "render", "write"]
+BENCH_ENV = {"REPORT_DEDUPE": "off", "REPORT_GROUP_RANK": ""}
+DESC_WORDS = ("생성형", "AI", "반도체", "투자", "규제", "모델", "데이터센터", "스타트업",
+              "클라우드", "에이전트", "파운데이션", "국내", "글로벌", "협력", "출시")
+
+
+def synth_data(n, seed=7):
+    """기사 n 건의 합성 data — 값 분포는 seed 로 고정(커밋 간 같은 입력)."""
+    rnd = random.Random(seed)
+    tpl = open(rr.TPL, encoding="utf-8").read()
+    ks = rr.scalar_tokens(rr.compile_template(tpl))
+    data = {k: f"{k} 값 — <측정> & \"인용\"" for k in rr.data_keys(ks)}
+    for k in ks:
+        if k.endswith(rr.SPARK_SUFFIX):
+            data[rr.trend_key(k)] = [round(rnd.uniform(0, 100), 1) for _ in range(12)]
+    # 초대형 스칼라 + 값 안의 토큰 문자열(재치환되면 출력이 폭증한다)
+    data["SUMMARY"] = ("요약 {{SUMMARY}} {{RUN_DATE}} " + " ".join(DESC_WORDS)) * 2000
+    news = []
+    for i in range(n):
+        desc = " ".join(rnd.choice(DESC_WORDS) for _ in range(rnd.randint(40, 160)))
+        if i % 50 == 0:
+            desc += " {{SUMMARY}} {{ITEM_TITLE}} <script>alert(1)</script>"
+        news.append({
+            "region": "국내" if i % 2 else "국외",
+            "src": rnd.choice(["연합뉴스", "전자신문", "Reuters", "The Verge", "TechCrunch"]),
+            "date": f"2026-10-{1 + i % 28:02d}",
+            "title": f"[{i}] " + " ".join(rnd.choice(DESC_WORDS) for _ in range(8)),
+            "desc": desc,
+        })
+    data["news"] = news
+    return data
+
+
+def run_phases(raw, out_path):
+    """1회 렌더를 단계별로 실행 — {단계: 초}, 출력 바이트."""
+    t = {}
+    start = time.perf_counter()
+    nodes = rr.compile_template(open(rr.TPL, encoding="utf-8").read())
+    t["compile"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = json.loads(raw)
+    t["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values, groups, _, _ = rr.prepare(nodes, data, now=rr.parse_now("2026-10-17"))
+    t["group"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = list(rr.iter_render(nodes, values, groups))
+    t["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    size = rr.write_stream(iter(chunks), out_path)
+    t["write"] = time.perf_counter() - start
+    return t, size
+
+
+def peak_memory(raw, out_path):
+    """스트리밍 렌더 1회(파일 기록 포함)의 tracemalloc 피크 바이트 — 입력 원문 제외."""
+    tracemalloc.start()
+    try:
+        nodes = rr.compile_template(open(rr.TPL, encoding="utf-8").read())
+        values, groups, _, _ = rr.prepare(nodes, json.loads(raw), now=rr.parse_now("2026-10-17"))
+        rr.write_stream(rr.iter_render(nodes, values, groups), out_path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_size(n, repeat, workdir):
+    raw = json.dumps(synth_data(n), ensure_ascii=False).encode("utf-8")
+    out_path = os.path.join(workdir, f"report-{n}.html")
+    runs = [run_phases(raw, out_path) for _ in range(repeat)]
+    # 단계별 최솟값 — 스케줄링 잡음에 가장 덜 흔들리는 대표값
+    phases = {p: round(min(r[0][p] for r in runs) * 1000, 3) for p in PHASES}
+    return {
+        "items": n,
+        "input_bytes": len(raw),
+        "output_bytes": runs[0][1],
+        "ms": phases,
+        "total_ms": round(sum(phases.values()), 3),
+        "peak_bytes": peak_memory(raw, out_path),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=rr.BASE,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(base, cur):
+    """기준 결과 대비 규모별 총 시간·피크 메모리 배율 출력 (<1 이면 개선)."""
+    prev = {r["items"]: r for r in base.get("results", [])}
+    for r in cur["results"]:
+        b = prev.get(r["items"])
+        if not b:
+            continue
+        print(f"  {r['items']:>7}건: 시간 ×{r['total_ms'] / max(b['total_ms'], 1e-9):.2f}"
+              f" · 피크 ×{r['peak_bytes'] / max(b['peak_bytes'], 1):.2f}", file=sys.stderr)
+
+
+def main():
+    sizes = [int(x) for x in (rr.arg_value("--sizes") or ",".join(map(str, DEFAULT_SIZES))).split(",") if x]
+    repeat = int(rr.arg_value("--repeat") or 3)
+    os.environ.update(BENCH_ENV)
+    result = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "env": BENCH_ENV,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            r = bench_size(n, repeat, workdir)
+            result["results"].append(r)
+            print(f"{n:>7}건: {r['total_ms']:>10.1f}ms  출력 {r['output_bytes']:>12} bytes  "
+                  f"피크 {r['peak_bytes'] / 1048576:8.1f}MB  {r['ms']}", file=sys.stderr)
+    base_path = rr.arg_value("--compare")
+    if base_path:
+        compare(json.load(open(base_path, encoding="utf-8")), result)
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    out = rr.arg_value("--out")
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
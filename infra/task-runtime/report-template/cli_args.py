@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+툴킷 스크립트 공용 argv 도우미 — 의존성 없음(표준 라이브러리 sys 만).
+
+render_report.py·bench_report.py·export_worker.py 가 같은 `--flag 값` 규칙을 쓴다. export 워커는
+2천 줄짜리 렌더러를 불러오지 않고 이 모듈만 import 해 기동이 가볍다.
+"""
+import sys
+
+
+def arg_value(flag, argv=None):
+    """`--flag 값` 형태 인자 값 (없으면 None). argv 생략 시 sys.argv."""
+    argv = sys.argv[1:] if argv is None else argv
+    if flag in argv:
+        i = argv.index(flag)
+        if i + 1 < len(argv):
+            return argv[i + 1]
+    return None
+
+
+def positional_args(argv=None, value_flags=()):
+    """플래그와 그 값(value_flags 에 든 플래그)을 뺀 위치 인자."""
+    out, skip = [], False
+    for a in (sys.argv[1:] if argv is None else argv):
+        if skip:
+            skip = False
+        elif a.startswith("--"):
+            skip = a in value_flags
+        else:
+            out.append(a)
+    return out
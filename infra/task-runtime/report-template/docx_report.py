@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+보고서 docx — report_outline 블록을 python-docx 문서로 옮긴다.
+
+API 의 docx 변환(docx-script.ts)도 이 모듈의 main() 을 돌린다 — 예약 리포트의 --docx 와 채팅
+아티팩트 내보내기가 같은 구현(generic-report 스펙의 spec_outline)을 쓴다. 레지스트리가 없는 이미지
+(report-templates 빌드 컨텍스트 생략)에서는 내장 API_SPEC 으로 돈다. 표 본문 행은 w:tr/w:tc 를
+lxml 로 바로 붙이고(add_row() 는 행마다 표 XML 을 다시 훑는다), 스타일은 문서당 1회 해석해 재사용한다.
+XML 1.0 에 못 넣는 제어문자는 지운다.
+
+사용:
+  python3 render_report.py data.json report.html --docx report.docx
+  python3 render_report.py data.json report.html --formats html,docx   # report.docx
+  python3 docx_report.py < reportdata.json > report.docx.b64           # API 변환 계약(stdin JSON → base64)
+"""
+import os, io, sys, json, base64
+from copy import deepcopy
+
+import render_report as rr
+from report_outline import outline, require
+
+require("python-docx", "docx", "lxml")
+from docx import Document
+from lxml import etree
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_TR, W_TC, W_P, W_R, W_T, W_BR, W_TAB = (W + n for n in ("tr", "tc", "p", "r", "t", "br", "tab"))
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+CONTROL = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+TABLE_STYLE = "Light Grid Accent 1"
+API_TEMPLATE = "generic-report"  # 채팅 reportdata 의 데이터 계약(config/report-templates.ts)
+# registry.json 이 없는 이미지(report-templates 빌드 컨텍스트 생략)용 generic-report 그룹 스펙 — 개요는
+# 그룹 순서·source·kind 만 읽는다. 레포 registry.json 과 같은지는 tests/test_writers.py 가 본다.
+API_SPEC = {"id": API_TEMPLATE, "groups": {
+    "KPIS": {"source": "kpis", "kind": "flat"},
+    "SECTIONS": {"source": "sections", "kind": "section"},
+    "SOURCES": {"source": "sources", "kind": "source"},
+}}
+
+
+def check(spec=None):
+    """의존성은 import 때 확인(require) — render_file 의 부가 출력 계약만 맞춘다."""
+
+
+def clean(text):
+    return text.translate(CONTROL).replace("\r", "\n")
+
+
+def add_t(r, text):
+    if not text:
+        return
+    t = etree.SubElement(r, W_T)
+    t.text = text
+    if text[:1].isspace() or text[-1:].isspace():
+        t.set(XML_SPACE, "preserve")
+
+
+def add_text(p, text):
+    """cell.text 와 같은 XML — 탭은 w:tab, 줄바꿈은 w:br."""
+    r = etree.SubElement(p, W_R)
+    for i, line in enumerate(clean(text).split("\n")):
+        if i:
+            etree.SubElement(r, W_BR)
+        for j, part in enumerate(line.split("\t")):
+            if j:
+                etree.SubElement(r, W_TAB)
+            add_t(r, part)
+
+
+class DocxWriter:
+    def __init__(self):
+        self.doc = Document()
+        self.styles = {}
+
+    def style(self, name):
+        """문서 스타일 객체 — 이름 조회는 문서당 1회(없는 스타일은 None → 기본 스타일)."""
+        if name not in self.styles:
+            try:
+                self.styles[name] = self.doc.styles[name]
+            except KeyError:
+                self.styles[name] = None
+        return self.styles[name]
+
+    def para(self, text, style=None, bold=False, italic=False):
+        p = self.doc.add_paragraph(clean(text), style=self.style(style) if style else None)
+        if (bold or italic) and p.runs:
+            p.runs[0].bold = bold or None
+            p.runs[0].italic = italic or None
+
+    def table(self, headers, rows):
+        if not headers:
+            return
+        t = self.doc.add_table(rows=1, cols=len(headers))
+        if self.style(TABLE_STYLE) is not None:
+            t.style = self.style(TABLE_STYLE)
+        tbl = t._tbl
+        head = tbl.tr_lst[0].tc_lst
+        for tc, h in zip(head, headers):
+            add_text(tc.p_lst[0], h)
+        # 본문 행 — 머리행 셀 속성(열 너비)을 복제해 w:tr 을 한 번에 조립
+        tc_prs = [tc.tcPr for tc in head]
+        for r in rows:
+            tr = etree.SubElement(tbl, W_TR)
+            for i, pr in enumerate(tc_prs):
+                tc = etree.SubElement(tr, W_TC)
+                tc.append(deepcopy(pr))
+                p = etree.SubElement(tc, W_P)
+                if i < len(r):
+                    add_text(p, r[i])
+
+    def add(self, block):
+        kind = block[0]
+        if kind == "title":
+            self.para(block[1], "Title")
+        elif kind == "heading":
+            self.para(block[2], f"Heading {block[1]}")
+        elif kind == "meta":
+            self.para(block[1], italic=True)
+        elif kind == "para":
+            self.para(block[1])
+        elif kind == "strong":
+            self.para(block[1], bold=True)
+        elif kind == "bullets":
+            for text in block[1]:
+                self.para(text, "List Bullet")
+        elif kind == "table":
+            self.table(block[1], block[2])
+        elif kind == "item":
+            self.para(block[1], bold=True)
+            self.para(block[2], italic=True)
+            self.para(block[3])
+
+
+def build(values, groups, counts, data, spec=None):
+    w = DocxWriter()
+    for block in outline(values, groups, counts, data, spec):
+        w.add(block)
+    return w.doc
+
+
+def write(out_path, values, groups, counts, data, spec=None):
+    """prepare 결과 → .docx 파일. {out, bytes}. 그룹은 읽기만 한다(닫지 않음)."""
+    build(values, groups, counts, data, spec).save(out_path)
+    return {"out": out_path, "bytes": os.path.getsize(out_path)}
+
+
+def api_spec():
+    """API 변환 스펙 — 레지스트리가 있으면 그 generic-report, 없으면 내장 API_SPEC(레지스트리 손상은 RenderError)."""
+    if rr.registry_path() is None:
+        return API_SPEC
+    return rr.template_spec(API_TEMPLATE)[1]
+
+
+def main():
+    """API 변환 계약 — stdin reportdata JSON({"data": {...}} 또는 data 자체) → stdout base64 docx.
+    one-shot(python3 -c)과 상주 워커(export_worker.py) 모두 호출 시점의 sys.stdin/stdout 을 쓴다."""
+    payload = json.load(sys.stdin)
+    data = payload.get("data", payload) if isinstance(payload, dict) else {}
+    buf = io.BytesIO()
+    build({}, {}, {}, data if isinstance(data, dict) else {}, api_spec()).save(buf)
+    sys.stdout.write(base64.b64encode(buf.getvalue()).decode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+상주 export 워커 — 변환 컨테이너 1개를 여러 잡에 재사용(artifact-export-service 의 warm pool).
+
+잡마다 치르던 `docker run` 기동 · 인터프리터 기동 · python-docx/lxml import · 스크립트 컴파일을
+워커 기동 1회로 줄인다. 이후 잡 지연은 변환 시간뿐이다.
+
+프레임: 4바이트 빅엔디언 길이 + UTF-8 JSON. stdin 으로 잡, stdout 으로 결과(잡 순서대로 1:1).
+  잡:   {"id": "...", "script": "<python 소스>", "input": "<스크립트 stdin 텍스트>"}
+  결과: {"id", "ok", "output"(스크립트 stdout) | "code"·"error", "ms", "rss_mb", "recycle"}
+스크립트는 one-shot(`python3 -c`)과 같은 계약 — sys.stdin 에서 읽고 sys.stdout 에 쓴다 — 이라
+docx-script.ts(→ docx_report.main())를 그대로 돌린다. 컴파일 결과는 소스 sha256 별로 캐시(잡마다 새 전역 이름공간).
+
+잡이 --timeout 초를 넘기면 code=TIMEOUT. 시간 초과가 났거나 잡 뒤 RSS 가 --watermark-mb 를 넘으면
+recycle=true 로 응답하고 종료한다(호출측이 새 워커로 교체 — 단편화된 힙을 통째로 버린다).
+stdin EOF 면 정상 종료(호출측 docker CLI 가 죽어도 컨테이너가 남지 않는다).
+
+사용:
+  python3 export_worker.py [--preload docx_report] [--timeout 60] [--watermark-mb 512]
+"""
+import sys, os, io, json, time, signal, hashlib, importlib, traceback, gc
+
+from cli_args import arg_value
+
+FRAME_HEADER = 4
+MAX_FRAME = 256 * 1024 * 1024  # 잡 입력 상한(API inputMaxBytes 보다 넉넉히) — 깨진 길이로 거대 할당 방지
+DEFAULT_TIMEOUT = 60
+DEFAULT_WATERMARK_MB = 512
+CODE_CACHE_ENTRIES = 16
+
+
+class JobTimeout(BaseException):
+    """잡 시간 상한 초과 — SIGALRM 처리기가 스크립트 실행 중에 던진다. BaseException 이라 writer·라이브러리의
+    `except Exception` 이 삼키지 못하고(삼키면 잡이 상한을 넘겨 계속 돈다) Worker.run 까지 올라온다."""
+
+
+def read_frame(stream):
+    """프레임 1개 → dict. EOF(헤더 앞·중간)면 None, 본문이 잘렸거나 상한 초과면 ValueError."""
+    head = stream.read(FRAME_HEADER)
+    if len(head) < FRAME_HEADER:
+        return None
+    size = int.from_bytes(head, "big")
+    if size > MAX_FRAME:
+        raise ValueError(f"프레임 크기 상한 초과: {size} bytes")
+    body = stream.read(size)
+    if len(body) < size:
+        raise ValueError(f"프레임 본문 잘림: {len(body)}/{size} bytes")
+    return json.loads(body)
+
+
+def write_frame(stream, obj):
+    body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    stream.write(len(body).to_bytes(FRAME_HEADER, "big") + body)
+    stream.flush()
+
+
+def rss_mb():
+    """현재 RSS(MB) — /proc 이 없으면 최고점(ru_maxrss)으로 대신한다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _on_alarm(signum, frame):
+    raise JobTimeout()
+
+
+class Worker:
+    def __init__(self, timeout, watermark_mb):
+        self.timeout = timeout
+        self.watermark_mb = watermark_mb
+        self.codes = {}  # 소스 sha256 → 코드 객체(삽입 순 — 넘치면 가장 오래된 것부터 버림)
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    def compiled(self, source):
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        code = self.codes.get(key)
+        if code is None:
+            if len(self.codes) >= CODE_CACHE_ENTRIES:
+                self.codes.pop(next(iter(self.codes)))
+            code = self.codes[key] = compile(source, f"<job-script {key[:12]}>", "exec")
+        return code
+
+    def run(self, job):
+        """잡 1건 실행 → 결과 dict. 스크립트 예외·종료 코드는 결과로만 돌려준다(워커는 계속)."""
+        started = time.perf_counter()
+        result = {"id": job.get("id"), "ok": False}
+        stdin, stdout = sys.stdin, sys.stdout
+        out = io.StringIO()
+        try:
+            code = self.compiled(job["script"])
+            sys.stdin, sys.stdout = io.StringIO(job.get("input") or ""), out
+            signal.setitimer(signal.ITIMER_REAL, self.timeout)
+            try:
+                exec(code, {"__name__": "__main__", "__builtins__": __builtins__})
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    raise RuntimeError(f"스크립트 종료 코드 {e.code}") from None
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            result.update(ok=True, output=out.getvalue())
+        except JobTimeout:
+            result.update(code="TIMEOUT", error=f"잡 시간 상한 초과({self.timeout}s)", recycle=True)
+        except Exception as e:
+            print(traceback.format_exc(limit=-3), file=sys.__stderr__)
+            result.update(code="EXPORT_FAILED", error=f"{type(e).__name__}: {e}"[:500])
+        finally:
+            sys.stdin, sys.stdout = stdin, stdout
+        del out
+        gc.collect()
+        rss = rss_mb()
+        result["ms"] = round((time.perf_counter() - started) * 1000, 3)
+        result["rss_mb"] = round(rss, 1)
+        if rss > self.watermark_mb:
+            result["recycle"] = True
+        result.setdefault("recycle", False)
+        return result
+
+
+def serve(stdin, stdout, worker):
+    """EOF 또는 recycle 까지 잡 처리. 처리한 잡 수 반환."""
+    done = 0
+    while True:
+        try:
+            job = read_frame(stdin)
+        except ValueError as e:
+            # 프레임 경계를 잃었다 — 이후 바이트를 해석할 수 없으므로 알리고 종료
+            write_frame(stdout, {"id": None, "ok": False, "code": "BAD_FRAME", "error": str(e), "recycle": True})
+            return done
+        if job is None:
+            return done
+        if not isinstance(job, dict) or not isinstance(job.get("script"), str):
+            write_frame(stdout, {"id": job.get("id") if isinstance(job, dict) else None, "ok": False,
+                                 "code": "BAD_JOB", "error": "잡은 script(문자열)를 가진 객체여야 합니다.",
+                                 "recycle": False})
+            continue
+        result = worker.run(job)
+        write_frame(stdout, result)
+        done += 1
+        if result["recycle"]:
+            return done
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    for name in filter(None, (arg_value("--preload", argv) or "").split(",")):
+        importlib.import_module(name)  # 무거운 import 를 첫 잡 전에(실패하면 기동 실패로 드러난다)
+    worker = Worker(float(arg_value("--timeout", argv) or DEFAULT_TIMEOUT),
+                    float(arg_value("--watermark-mb", argv) or DEFAULT_WATERMARK_MB))
+    # 프로토콜 스트림은 기동 시 원본을 잡아 둔다 — 잡 실행 중 sys.stdout 을 바꿔도 섞이지 않게.
+    done = serve(sys.stdin.buffer, sys.stdout.buffer, worker)
+    print(f"export 워커 종료: 잡 {done}건, RSS {rss_mb():.1f}MB", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
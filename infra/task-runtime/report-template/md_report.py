@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+보고서 Markdown — report_outline 블록을 파일에 바로 흘려 쓴다(의존성 없음, 메모리는 기사 수와 무관).
+
+본문 문자는 Markdown 문법 문자(\\ ` * _ [ ] < > | # &)를 역슬래시로 이스케이프한다 — 기사 제목의
+'*'·'<script>' 가 서식·HTML 로 해석되지 않는다. 표 칸의 줄바꿈은 공백으로 편다.
+
+사용:
+  python3 render_report.py data.json report.html --md report.md
+  python3 render_report.py data.json report.html --formats html,md   # report.md
+"""
+import os, re
+
+from report_outline import outline
+
+SPECIAL = re.compile(r"([\\`*_\[\]<>|#&])")
+
+
+def check(spec=None):
+    """의존성 없음 — render_file 의 부가 출력 계약만 맞춘다."""
+
+
+def md(text):
+    return SPECIAL.sub(r"\\\1", text).replace("\r", "")
+
+
+def cell(text):
+    return " ".join(md(text).split()) or " "
+
+
+def lines(text):
+    """문단 안 줄바꿈은 강제 줄바꿈(행 끝 공백 2개)."""
+    return "  \n".join(md(text).split("\n"))
+
+
+def table(headers, rows):
+    if not headers:
+        return
+    n = len(headers)
+    yield "| " + " | ".join(cell(h) for h in headers) + " |\n"
+    yield "|" + "---|" * n + "\n"
+    for r in rows:
+        r = list(r[:n]) + [""] * (n - len(r))
+        yield "| " + " | ".join(cell(c) for c in r) + " |\n"
+    yield "\n"
+
+
+def chunks(blocks):
+    for b in blocks:
+        kind = b[0]
+        if kind == "title":
+            yield f"# {cell(b[1])}\n\n"
+        elif kind == "heading":
+            yield f'{"#" * (b[1] + 1)} {cell(b[2])}\n\n'
+        elif kind == "meta":
+            yield f"_{cell(b[1])}_\n\n"
+        elif kind == "para":
+            yield f"{lines(b[1])}\n\n"
+        elif kind == "strong":
+            yield f"**{cell(b[1])}**\n\n"
+        elif kind == "bullets":
+            empty = True
+            for text in b[1]:
+                empty = False
+                yield f"- {cell(text)}\n"
+            if not empty:
+                yield "\n"
+        elif kind == "table":
+            yield from table(b[1], b[2])
+        elif kind == "item":
+            yield f"**{cell(b[1])}**  \n_{cell(b[2])}_  \n{lines(b[3])}\n\n"
+
+
+def write(out_path, values, groups, counts, data, spec=None):
+    """prepare 결과 → .md 파일. {out, bytes}. 그룹은 읽기만 한다(닫지 않음)."""
+    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
+        for chunk in chunks(outline(values, groups, counts, data, spec)):
+            f.write(chunk)
+    return {"out": out_path, "bytes": os.path.getsize(out_path)}
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+AI 트렌드 데일리 PDF — render_report.py 와 같은 data.json 계약을 reportlab 으로 직접 조판.
+
+HTML 을 chromium 으로 인쇄(artifact-export-service 의 컨테이너 기동)하지 않고, 같은 데이터를
+platypus 흐름으로 바로 그린다 — KPI 카드·추세선, 국내/국외 비교 막대, 뉴스 카드(+넘친 기사 목록),
+신호 표, 3관점 렌즈, 전략. 값·그룹(region 분류·중복 병합·정렬 상한·이력)은 render_report.prepare
+결과를 그대로 쓰므로 HTML 과 같은 내용이 나온다. 디자인 정본은 HTML 이고, PDF 는 같은 팔레트의
+인쇄용 요약판이다. 폰트는 task-runtime 이미지의 fonts-nanum(REPORT_PDF_FONT_DIR 로 변경).
+
+출력은 결정적이다(invariant — 생성 시각·문서 ID 고정): 같은 입력·같은 RUN_DATE 면 같은 바이트.
+
+사용:
+  python3 render_report.py data.json report.html --pdf report.pdf   # HTML + PDF(그룹 1회 준비)
+  python3 render_report.py data.json --pdf report.pdf               # PDF 만
+  rr.render_file(nodes, data, None, exports={"pdf": "report.pdf"})   # → 결과["pdf"] = {out, bytes, pages}
+"""
+import os, html, functools
+
+import render_report as rr
+from report_outline import require
+
+require("reportlab", "reportlab")
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.graphics.shapes import Drawing, Line, PolyLine, Rect
+from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether,
+                                HRFlowable)
+
+FONT_DIR = os.environ.get("REPORT_PDF_FONT_DIR", "/usr/share/fonts/truetype/nanum")
+FONT_FILES = {"Nanum": "NanumGothic.ttf", "Nanum-Bold": "NanumGothicBold.ttf"}
+FONT, FONT_BOLD = "Nanum", "Nanum-Bold"
+MARGIN = 14  # mm
+
+# 템플릿 CSS(oklch) 팔레트의 sRGB 근사 — HTML 과 같은 색 역할
+PALETTE = {
+    "ink": "#0e1624", "muted": "#5a616d", "line": "#c8ced8", "paper": "#f6fbff",
+    "accent": "#4260c4", "accent_soft": "#d8e4ff", "dom": "#1666aa", "glo": "#825eb9",
+    "up": "#b33736", "down": "#09659f", "steady": "#15733c",
+    "invest": "#05773b", "exec": "#3a65b8", "founder": "#bd432f",
+}
+NEWS_ROLES = {"NEWS_DOMESTIC": "dom", "NEWS_GLOBAL": "glo"}
+BAR_W, BAR_H = 128, 6  # pt — 비교 막대 트랙(≈45mm)
+SPARK_W, SPARK_H = 102, 24  # pt — KPI 추세선(≈36×8mm)
+
+
+def color(role):
+    return colors.HexColor(PALETTE[role])
+
+
+@functools.lru_cache(maxsize=None)
+def register_fonts():
+    """Nanum 등록(프로세스당 1회) — 굵은체가 없으면 보통체로 대신한다."""
+    regular = os.path.join(FONT_DIR, FONT_FILES[FONT])
+    if not os.path.exists(regular):
+        raise rr.RenderError(f"한글 폰트 없음: {regular} (fonts-nanum 설치 또는 REPORT_PDF_FONT_DIR 지정)")
+    bold = os.path.join(FONT_DIR, FONT_FILES[FONT_BOLD])
+    pdfmetrics.registerFont(TTFont(FONT, regular))
+    pdfmetrics.registerFont(TTFont(FONT_BOLD, bold if os.path.exists(bold) else regular))
+    pdfmetrics.registerFontFamily(FONT, normal=FONT, bold=FONT_BOLD, italic=FONT, boldItalic=FONT_BOLD)
+
+
+@functools.lru_cache(maxsize=None)
+def styles():
+    def style(name, size=9, lead=None, font=FONT, fg="ink", **kw):
+        return ParagraphStyle(name, fontName=font, fontSize=size, leading=lead or size * 1.45,
+                              textColor=color(fg), wordWrap="CJK", **kw)
+    return {
+        "eyebrow": style("eyebrow", 7.5, fg="accent"),
+        "h1": style("h1", 17, 23, FONT_BOLD, spaceAfter=4),
+        "h2": style("h2", 12.5, 17, FONT_BOLD, spaceBefore=8, spaceAfter=3),
+        "deck": style("deck", 9.5, fg="muted"),
+        "summary": style("summary", 10, 15.5),
+        "meta": style("meta", 7.5, fg="muted"),
+        "label": style("label", 8, fg="muted"),
+        "value": style("value", 15, 19, FONT_BOLD),
+        "body": style("body", 9),
+        "bold": style("bold", 9.5, font=FONT_BOLD),
+        "small": style("small", 8),
+        "cell": style("cell", 8),
+        "head": style("head", 8, font=FONT_BOLD, fg="muted"),
+    }
+
+
+def score(value):
+    """CMP_* 값(이스케이프 완료 문자열) → 막대 길이용 0~100. 숫자가 아니면 0."""
+    n = rr.js_number(html.unescape(value))
+    return min(max(n or 0.0, 0.0), 100.0)
+
+
+def spark_drawing(values):
+    """KPI 추세선 — HTML sparkline 과 같은 정규화(평탄하면 가운데 높이, 2점 미만이면 기준선만)."""
+    d = Drawing(SPARK_W, SPARK_H)
+    base, top = SPARK_H * 0.15, SPARK_H * 0.9
+    d.add(Line(0, base, SPARK_W, base, strokeColor=color("line"), strokeWidth=0.6))
+    if len(values) >= 2:
+        lo, hi = rr.series_bounds(values)
+        span, step = hi - lo, SPARK_W / (len(values) - 1)
+        pts = []
+        for i, v in enumerate(values):
+            pts += [step * i, base + ((v - lo) / span * (top - base) if span else (top - base) / 2)]
+        d.add(PolyLine(pts, strokeColor=color("accent"), strokeWidth=1.2))
+    return d
+
+
+def bar_drawing(value, role):
+    d = Drawing(BAR_W, BAR_H)
+    d.add(Rect(0, 0, BAR_W, BAR_H, rx=3, ry=3, fillColor=color("accent_soft"), strokeColor=None))
+    if value > 0:
+        d.add(Rect(0, 0, BAR_W * value / 100, BAR_H, rx=3, ry=3, fillColor=color(role), strokeColor=None))
+    return d
+
+
+def grid(rows, widths, extra=()):
+    t = Table(rows, colWidths=widths)
+    t.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP"),
+                           ("LEFTPADDING", (0, 0), (-1, -1), 5), ("RIGHTPADDING", (0, 0), (-1, -1), 5),
+                           ("TOPPADDING", (0, 0), (-1, -1), 4), ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                           *extra]))
+    return t
+
+
+def header(values, st):
+    v = values.get
+    return [
+        Paragraph("AI Trend Daily Intelligence · 07:00 KST", st["eyebrow"]),
+        Paragraph("국내 vs 국외 AI 트렌드 분석", st["h1"]),
+        Paragraph(v("DECKLINE", "—"), st["deck"]),
+        Spacer(1, 4),
+        Paragraph(f'{v("RUN_DATE", "—")} · 07:00 KST · {v("SOURCE_STATUS", "—")} · '
+                  f'<font name="{FONT_BOLD}" color="{PALETTE["up"]}">{v("HEADLINE_TAG", "—")}</font>', st["meta"]),
+        Spacer(1, 6),
+        Paragraph(v("SUMMARY", "—"), st["summary"]),
+        Spacer(1, 8),
+    ]
+
+
+def kpi_row(values, data, width, st):
+    cap = rr.DEFAULT_LIMITS["chartMaxItems"]
+    cells = []
+    for key, label in rr.KPI_LABELS:
+        cls = html.unescape(values.get(f"{key}_DELTACLASS", ""))
+        fg = PALETTE[cls] if cls in rr.DELTA_CLASSES else PALETTE["muted"]
+        trend = rr.trend_values(data.get(key + rr.TREND_SUFFIX)) or []
+        cells.append([Paragraph(label, st["label"]),
+                      Paragraph(values.get(f"{key}_VALUE", "—"), st["value"]),
+                      Paragraph(f'{values.get(f"{key}_NOTE", "—")} '
+                                f'<font name="{FONT_BOLD}" color="{fg}">{values.get(f"{key}_DELTA", "—")}</font>',
+                                st["small"]),
+                      spark_drawing(tuple(trend[-cap:]))])
+    return grid([cells], [width / 4] * 4, [("BOX", (0, 0), (-1, -1), 0.6, color("line")),
+                                           ("INNERGRID", (0, 0), (-1, -1), 0.6, color("line"))])
+
+
+def comparison(values, width, st):
+    rows = [[Paragraph("국내 vs 국외 모멘텀 비교 · 0-100", st["head"]), "", "", "", ""],
+            ["", Paragraph(f'<font color="{PALETTE["dom"]}">●</font> 국내', st["head"]), "",
+             Paragraph(f'<font color="{PALETTE["glo"]}">●</font> 국외', st["head"]), ""]]
+    for axis, label, *_ in rr.CMP_AXES:
+        dom, glo = values.get(f"CMP_DOM_{axis}", "—"), values.get(f"CMP_GLO_{axis}", "—")
+        rows.append([Paragraph(label, st["cell"]), bar_drawing(score(dom), "dom"), Paragraph(dom, st["cell"]),
+                     bar_drawing(score(glo), "glo"), Paragraph(glo, st["cell"])])
+    bar = BAR_W + 10
+    rest = (width - 2 * bar) / 3
+    return grid(rows, [rest, bar, rest, bar, rest], [("SPAN", (0, 0), (-1, 0)),
+                                                     ("VALIGN", (0, 2), (-1, -1), "MIDDLE"),
+                                                     ("LINEBELOW", (0, 0), (-1, 0), 0.6, color("line"))])
+
+
+def news_item(it, st):
+    """뉴스 카드 — 항목 필드는 원문이라 여기서 이스케이프(Paragraph 마크업 주입 차단)."""
+    f = lambda k: rr.esc(str(it.get(k, "—")))
+    return [KeepTogether([Paragraph(f'{f("src")} · {f("date")}', st["meta"]),
+                          Paragraph(f("title"), st["bold"])]),
+            Paragraph(f("desc"), st["body"]),
+            HRFlowable(width="100%", thickness=0.4, color=color("line"), spaceBefore=4, spaceAfter=4)]
+
+
+def news_panel(name, items, counts, st):
+    title, sub = rr.NEWS_LABELS.get(name, (name, ""))
+    role = NEWS_ROLES.get(name, "accent")
+    out = [Paragraph(f'<font color="{PALETTE[role]}">■</font> {title} '
+                     f'<font size="8" color="{PALETTE["muted"]}">{sub} · {counts.get(name, 0)}건</font>', st["h2"])]
+    empty = True
+    for it in items:
+        empty = False
+        out += news_item(it, st)
+    if empty:
+        out.append(Paragraph("해당 지역의 신규 기사를 확보하지 못했습니다.", st["meta"]))
+    if isinstance(items, rr.RankedItems) and items.overflow:
+        out.append(Paragraph(f"외 {items.overflow}건", st["meta"]))
+        for it in items.rest():
+            out.append(Paragraph(f'• <font name="{FONT_BOLD}">{rr.esc(str(it.get("title", "—")))}</font> '
+                                 f'<font color="{PALETTE["muted"]}">{rr.esc(str(it.get("src", "—")))} · '
+                                 f'{rr.esc(str(it.get("date", "—")))}</font>', st["small"]))
+    return out
+
+
+def signals(values, width, st):
+    rows = [[Paragraph(h, st["head"]) for h in ("구분", "관측 신호", "국내", "국외", "해석")]]
+    for axis, _, badge, signal, note in rr.CMP_AXES:
+        rows.append([Paragraph(badge, st["cell"]), Paragraph(signal, st["cell"]),
+                     Paragraph(values.get(f"CMP_DOM_{axis}", "—"), st["cell"]),
+                     Paragraph(values.get(f"CMP_GLO_{axis}", "—"), st["cell"]),
+                     Paragraph(values.get(note, "—"), st["cell"])])
+    return grid(rows, [w * width for w in (0.12, 0.26, 0.09, 0.09, 0.44)],
+                [("LINEBELOW", (0, 0), (-1, -1), 0.4, color("line")),
+                 ("BACKGROUND", (0, 0), (-1, 0), color("paper"))])
+
+
+def lenses(values, width, st):
+    cells = []
+    for key, role, sub in rr.LENS_LABELS:
+        v = lambda k: values.get(f"LENS_{key}_{k}", "—")
+        cells.append([Paragraph(f'<font name="{FONT_BOLD}" color="{PALETTE[key.lower()]}">{role}</font> '
+                                f'<font size="7" color="{PALETTE["muted"]}">{sub}</font>', st["body"]),
+                      Paragraph(v("TAKE"), st["bold"]),
+                      *(Paragraph(f"• {v(s)}", st["small"]) for s in ("S1", "S2", "S3")),
+                      Spacer(1, 3),
+                      Paragraph(f'<font name="{FONT_BOLD}">오늘의 액션</font> {v("ACTION")}', st["small"])])
+    return grid([cells], [width / 3] * 3, [("BOX", (0, 0), (-1, -1), 0.6, color("line")),
+                                           ("INNERGRID", (0, 0), (-1, -1), 0.6, color("line"))])
+
+
+def strategy(values, width, st):
+    cells = [[Paragraph(label, st["eyebrow"]), Paragraph(values.get(f"STRAT_{key}_TITLE", "—"), st["bold"]),
+              Paragraph(values.get(f"STRAT_{key}_DESC", "—"), st["small"])] for key, label in rr.HORIZON_LABELS]
+    return grid([cells], [width / 3] * 3, [("BACKGROUND", (0, 0), (-1, -1), color("paper")),
+                                           ("INNERGRID", (0, 0), (-1, -1), 0.6, color("line"))])
+
+
+def story(values, groups, counts, data, width):
+    st = styles()
+    out = header(values, st)
+    out += [kpi_row(values, data, width, st), Spacer(1, 10), comparison(values, width, st)]
+    for name, items in groups.items():
+        out += news_panel(name, items, counts, st)
+    out += [Paragraph("관측 신호", st["h2"]), signals(values, width, st),
+            Paragraph("3관점 렌즈", st["h2"]), lenses(values, width, st),
+            Paragraph("향후 전략 · 타임 호라이즌", st["h2"]), strategy(values, width, st)]
+    return out
+
+
+def check(spec=None):
+    """render_file 이 아무것도 쓰기 전에 부른다 — 미지원 템플릿·폰트 부재는 RenderError(reportlab 은 import 때)."""
+    if spec is not None:
+        raise rr.RenderError("--pdf 는 기본 템플릿(ai-trend-daily)에서만 지원합니다.")
+    register_fonts()
+
+
+def write(out_path, values, groups, counts, data, spec=None):
+    """prepare 결과(스칼라 값·그룹) → PDF 파일. {out, bytes, pages}. 그룹은 읽기만 한다(닫지 않음)."""
+    register_fonts()
+    footer = f'{html.unescape(values.get("RUN_DATE", ""))} · PDF · 07:00 KST'
+
+    def on_page(canvas, doc):
+        canvas.saveState()
+        canvas.setFont(FONT, 7)
+        canvas.setFillColor(color("muted"))
+        canvas.drawString(MARGIN * mm, 8 * mm, "AI Trend Daily · ai-trend-daily-v1-open-design")
+        canvas.drawRightString(A4[0] - MARGIN * mm, 8 * mm, f"{footer} · {doc.page}")
+        canvas.restoreState()
+
+    doc = SimpleDocTemplate(out_path, pagesize=A4, leftMargin=MARGIN * mm, rightMargin=MARGIN * mm,
+                            topMargin=MARGIN * mm, bottomMargin=MARGIN * mm + 4 * mm,
+                            title="국내 vs 국외 AI 트렌드 분석", author="AI Trend Daily", invariant=1)
+    doc.build(story(values, groups, counts, data, doc.width), onFirstPage=on_page, onLaterPages=on_page)
+    return {"out": out_path, "bytes": os.path.getsize(out_path), "pages": doc.page}
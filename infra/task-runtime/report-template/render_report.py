@@ -6,14 +6,55 @@ AI 트렌드 데일리 리포트 렌더러 — 고정 디자인 템플릿에 dat
 이 스크립트가 {{TOKEN}} 을 결정적으로 치환해 report.html 을 만든다 → OD 템플릿 픽셀-정합.
 
 뉴스는 개수 고정 슬롯이 아니라 `news` 배열로 받아 지역별로 분류·반복 렌더한다.
+기사가 수천 건이면 data.json 옆의 news.ndjson(한 줄 1기사, 또는 "news": "경로.ndjson")로
+넘기면 한 줄씩 읽어 그룹별 임시 파일로 흘려보내므로 배열 전체를 메모리에 두지 않는다.
 템플릿의 <!-- REPEAT:NAME --> ~ <!-- /REPEAT --> 블록이 항목 수만큼 복제되므로,
 조사한 기사가 몇 건이든 유실되지 않는다(구 NEWS1~3 고정 슬롯은 초과분이 조용히 버려졌다).
+KPI 카드 추세선({{KPI_*_SPARK}})은 data 의 KPI_*_TREND 숫자 배열로 렌더러가 정적 SVG 를 그린다
+(선택 키 — 없으면 템플릿 고유의 고정 장식선).
+
+레지스트리 템플릿: API 채팅 경로(config/report-templates.ts)와 공유하는 registry.json 의
+템플릿은 --template ID 로 고른다. 반복 그룹은 region 이 아니라 스펙의 kind 로 렌더한다 —
+flat(항목 스칼라 필드) · section(paragraphs/bullets/table/chart → 안전 HTML) · source(번호·링크).
+
+라이브러리(같은 인터프리터 안에서 렌더 — 스레드 안전, 전역 가변 상태 없음):
+  from render_report import render
+  r = render(data, now="2026-10-17")   # → RenderResult(html, counts, warnings)
+  r = render(data, template="generic-report")
+render() 는 기사 이력(REPORT_HISTORY)을 읽지도 기록하지도 않는다 — 이력은 CLI(단일·--append·배치·데몬)가
+render_file(history=경로)·append_items 에 명시적으로 넘길 때만 쓴다.
 
 사용:
   python3 render_report.py --keys              # 채워야 할 토큰(키) 목록 출력
+  python3 render_report.py --compile [TPL.html ...]  # 템플릿 → 사전 컴파일 AST(.ast.json)
   python3 render_report.py data.json report.html
+  python3 render_report.py --template generic-report data.json report.html  # 레지스트리 템플릿
+  python3 render_report.py --serve [--socket PATH]   # 상주 렌더 데몬(JSON-lines 잡)
+  python3 render_report.py --batch manifest.json|'GLOB' [--jobs N]  # 다건 렌더(멀티프로세스)
+  python3 render_report.py data.json report.html --index       # + 추가 렌더용 오프셋 인덱스
+  python3 render_report.py --append new.json|new.ndjson report.html  # 새 기사만 끼워 넣기
+  python3 render_report.py data.json [report.html] --pdf R.pdf --xlsx R.xlsx  # + 부가 출력(HTML 생략 가능)
+  python3 render_report.py data.json [report.html] --formats html,docx,md,pdf,xlsx  # 1회 파싱, 동시 기록
+
+공통 옵션: --now ISO8601|@epoch (또는 SOURCE_DATE_EPOCH) 로 실행 시각 고정,
+  --cache-dir DIR (또는 REPORT_CACHE_DIR) 로 동일 입력·동일 고정 시각 재렌더를 캐시에서 즉시 반환,
+  --fragment-cache FILE (또는 REPORT_FRAGMENT_CACHE) 로 뉴스 카드 조각 캐시를 디스크에 유지,
+  REPORT_REGION_FALLBACK=그룹명|region(기본 없음 — 누락+경고)·REPORT_REGION_SRC=0(.kr 국내 추정 끔)으로 region 미상 기사 처리 조정,
+  REPORT_DEDUPE=on|0~1(제목 유사도 임계값, on 은 0.8 — 기본 꺼짐)로 유사 중복 기사 병합,
+  REPORT_HISTORY=PATH.sqlite [REPORT_HISTORY_MODE=mark|suppress, REPORT_HISTORY_DAYS=90] 로 이전 CLI 실행에
+  렌더된 기사를 표시·제외(렌더 성공 시 지문 기록, 보존 기간 지난 지문은 삭제 — 이력이 켜지면 렌더 캐시 미사용),
+  REPORT_GROUP_RANK=NAME=TOP[:date|score|input],... 로 그룹별 카드 상한·정렬 지정(기본은 상한 없이 입력 순),
+  --stats-json PATH|- 로 단계별 시간·바이트·그룹별 건수·경고 코드를 JSON 으로 기록(배치는 잡 배열),
+  --profile DIR [--profile-sample 0~1] 로 cProfile(.pstats)·메모리 최고점 할당 위치(.alloc.txt)·
+  요약(.txt)을 DIR 에 남긴다(배치·데몬은 잡마다 비율 샘플링, 데몬 잡은 "profile" 필드로도 지정).
 """
-import sys, json, re, os, html, datetime
+import sys, json, re, os, math, decimal, importlib, datetime, hashlib, functools, heapq, time, glob, tempfile, shutil, threading, random, contextlib
+import traceback
+import sqlite3, unicodedata, zlib
+from collections import OrderedDict, namedtuple
+
+import cli_args
+from cli_args import arg_value
 
 BASE = os.path.dirname(os.path.abspath(__file__))
 TPL = os.path.join(BASE, "ai-trend-daily.html")
@@ -31,118 +72,2210 @@ GROUPS = {
     "NEWS_DOMESTIC": "국내",
     "NEWS_GLOBAL": "국외",
 }
+# region 별칭 — 정규화(소문자·공백/-/_ 통일)한 값 → 그룹명. 모델이 영문·약어로 적어도 유실되지 않게.
+REGION_ALIASES = {
+    "NEWS_DOMESTIC": ("국내", "한국", "대한민국", "korea", "south korea", "republic of korea", "rok",
+                      "kr", "kor", "domestic", "local"),
+    "NEWS_GLOBAL": ("국외", "해외", "글로벌", "세계", "global", "overseas", "international", "intl",
+                    "foreign", "world", "worldwide"),
+}
+# region 으로 못 정한 기사 — src 도메인이 .kr 이면 국내로 추정한다(REPORT_REGION_SRC=0 이면 끔). 그 외 TLD 는
+# 결정적이지 않아(국내 매체도 naver.com·chosun.com 을 쓴다) 추정하지 않는다. 그래도 모르면 대체 그룹
+# (REPORT_REGION_FALLBACK, 그룹명·region 값 — opt-in, 기본은 누락+UNGROUPED_ITEMS 경고).
+REGION_FALLBACK = ""
+DOMESTIC_TLDS = ("kr",)
+SRC_HOST_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*://)?(?:www\.)?([a-z0-9-]+(?:\.[a-z0-9-]+)*\.([a-z]{2,}))(?:[:/?#]|$)",
+                         re.I)
+# news 배열 대신 쓸 수 있는 NDJSON 입력 — data.json 에 news 키가 없으면 같은 디렉토리에서 찾는다.
+NEWS_NDJSON = "news.ndjson"
+# NDJSON 그룹 스풀의 메모리 상한 — 넘으면 임시 파일로 넘어간다.
+SPOOL_MEMORY = 1024 * 1024
 EMPTY_CARD = '<div class="news-empty">해당 지역의 신규 기사를 확보하지 못했습니다.</div>'
+# 유사 중복 기사 병합 — 같은 사건을 여러 매체에서 모으면 카드가 겹친다. 정규화한 제목의 3-gram
+# Jaccard 가 임계값 이상이고 숫자·첫 단어(주어 — 회사·제품명)가 같으면 먼저 나온 카드 하나로 합치고
+# 출처만 덧붙인다. "삼성전자/LG전자 3분기 실적"·"Gemini 2/3" 처럼 글자는 거의 같아도 다른 기사가 흔해
+# 기본은 꺼짐 — REPORT_DEDUPE=on(DEDUPE_THRESHOLD) 또는 0~1 임계값으로 켠다.
+DEDUPE_THRESHOLD = 0.8
+SHINGLE = 3
+MINHASH_BANDS, MINHASH_ROWS = 8, 2  # 밴드 8 × 행 2 — Jaccard 0.5 쌍도 90% 확률로 후보가 된다
+MINHASH_BINS = MINHASH_BANDS * MINHASH_ROWS
+LSH_BUCKET_CAP = 8  # 버킷당 대표 수 상한 — 비슷한 제목이 몰려도 후보 비교가 O(밴드 × 상한)을 넘지 않게
+TITLE_NOISE_RE = re.compile(r"[\[(【<][^\])】>]{1,10}[\])】>]|[\W_]+")  # [속보]·(종합) 류 머리표, 공백·문장부호
+TITLE_TAG_RE = re.compile(r"[\[(【<][^\])】>]{1,10}[\])】>]")
+TITLE_WORD_RE = re.compile(r"[^\W_]+")
+TITLE_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+# 기사 이력 — 일일 실행 간 "이미 보도한 기사"를 표시(mark)하거나 빼고(suppress) 렌더한다.
+# REPORT_HISTORY=경로.sqlite 로 켜고, 보존 기간(REPORT_HISTORY_DAYS)이 지난 지문은 기록 때 지운다.
+HISTORY_MODES = ("mark", "suppress")
+HISTORY_DAYS = 90
+# 그룹별 카드 상한·정렬 — 상위 top 건만 카드로, 넘친 기사는 카드 아래 간단 목록(제목·출처·날짜)으로.
+# by: date(최신순) | score(높은순, 동점은 최신순) | None(입력 순). top 0 은 상한 없음.
+# 기본은 비어 있다(모든 그룹 상한 없이 입력 순) — REPORT_GROUP_RANK="NEWS_GLOBAL=20:score,NEWS_DOMESTIC=30"
+# 처럼 지정한 그룹만 정렬·상한을 건다.
+GROUP_RANK = {}
+RANK_KEYS = ("date", "score")
+DATE_RE = re.compile(r"(\d{4})\D{1,3}(\d{1,2})\D{1,3}(\d{1,2})(?:\D{1,3}(\d{1,2}):(\d{2}))?")
+# 상대 날짜("3시간 전"·"2 days ago"·"어제") — 실행 시각 기준으로 환산해 절대 날짜와 섞어 정렬한다.
+RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(분|시간|일|min(?:ute)?s?|hours?|days?)\s*(?:전|ago)", re.I)
+RELATIVE_UNITS = {"분": "minutes", "min": "minutes", "시간": "hours", "hour": "hours", "일": "days", "day": "days"}
+RELATIVE_WORDS = {"오늘": 0, "today": 0, "어제": 1, "yesterday": 1, "그제": 2}
+REPRINT_MARK = " · 재보도(첫 보도 "  # mark 모드가 date 뒤에 붙이는 표시 — 정렬은 원래 date 로
+# 템플릿 라벨 — 부가 출력(pdf_report·xlsx_report)이 HTML 카드·표와 같은 이름을 쓰도록.
+KPI_LABELS = (("KPI_GLOBAL", "글로벌 투자 열기"), ("KPI_DOMESTIC", "국내 도입 속도"),
+              ("KPI_POLICY", "정책·규제 명확성"), ("KPI_TALENT", "인재·생태계 압력"))
+# 비교 축 — (CMP_DOM_/CMP_GLO_ 접미사, 막대 라벨, 표 배지, 관측 신호, 해석 키)
+CMP_AXES = (("PRODUCT", "제품화", "Product", "엔터프라이즈 AI 적용 속도", "TBL_PRODUCT_NOTE"),
+            ("INVEST", "투자", "Funding", "대형 라운드·인프라 투자", "TBL_FUNDING_NOTE"),
+            ("POLICY", "정책", "Policy", "규제·공공 조달 명확성", "TBL_POLICY_NOTE"),
+            ("TALENT", "인재", "Talent", "AI 엔지니어 채용 압력", "TBL_TALENT_NOTE"))
+NEWS_LABELS = {"NEWS_DOMESTIC": ("국내 헤드라인", "한국 AI 대표 뉴스"),
+               "NEWS_GLOBAL": ("국외 헤드라인", "글로벌 AI 대표 뉴스")}
+LENS_LABELS = (("INVEST", "투자자", "Investor lens"), ("EXEC", "경영자", "Executive lens"),
+               ("FOUNDER", "창업자", "Founder lens"))
+HORIZON_LABELS = (("NOW", "Now · 1주"), ("NEXT", "Next · 1개월"), ("LATER", "Later · 분기"))
+
 # 짧은 라벨 자리의 길이 상한 — 배지가 길어지면 헤더 그리드에서 제목 컬럼을 밀어낸다.
 # CSS 가 아니라 데이터 단에서 자르므로 어떤 값이 와도 레이아웃이 보장된다.
 MAX_LEN = {"HEADLINE_TAG": 24}
 
 
-def computed():
-    """LLM 이 아니라 렌더러가 결정하는 값 — 모델이 기사 날짜를 실행일로 착각하는 것을 차단."""
+class RenderError(Exception):
+    """data.json 계약 위반 — 렌더 불가(CLI 는 exit 1, 데몬은 ok=false 응답)."""
+
+
+@functools.lru_cache(maxsize=None)
+def report_tz():
+    """리포트 기준 타임존 — 프로세스당 1회 로드(데몬·배치에서 재사용). 실패 시 None."""
     try:
         from zoneinfo import ZoneInfo
-        now = datetime.datetime.now(ZoneInfo(REPORT_TZ))
+        return ZoneInfo(REPORT_TZ)
     except Exception:
         # tzdata 부재 등 — UTC 로컬시간을 그대로 쓰면 날짜가 어긋나므로 실패를 드러낸다.
         print(f"경고 — 타임존 '{REPORT_TZ}' 로드 실패, 로컬시간 사용", file=sys.stderr)
-        now = datetime.datetime.now()
-    return {"RUN_DATE": now.strftime("%Y-%m-%d")}
+        return None
+
+
+def parse_now(value):
+    """--now 값 → aware datetime. datetime · ISO8601(날짜만·TZ 생략 시 리포트 TZ) · @epoch초."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime.datetime):
+        return value if value.tzinfo else value.replace(tzinfo=report_tz())
+    text = str(value).strip()
+    try:
+        if text.startswith("@") or text.isdigit():
+            return datetime.datetime.fromtimestamp(int(text.lstrip("@")), datetime.timezone.utc)
+        dt = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        raise RenderError(f"--now 형식 오류: {value!r} (ISO8601 또는 @epoch초)") from None
+    return dt if dt.tzinfo else dt.replace(tzinfo=report_tz())
+
+
+def pinned_time(now=None):
+    """고정 시각(report_tz) — now(--now), 없으면 SOURCE_DATE_EPOCH. 둘 다 없으면 None(벽시계)."""
+    if now is None:
+        now = parse_now(os.environ.get("SOURCE_DATE_EPOCH") and "@" + os.environ["SOURCE_DATE_EPOCH"])
+    return now.astimezone(report_tz()) if now else None
+
+
+def run_time(now=None):
+    """리포트 기준 시각(report_tz) — 고정 시각(pinned_time)이 있으면 벽시계 대신 그 시각."""
+    return pinned_time(now) or datetime.datetime.now(report_tz())
+
+
+def computed(now=None):
+    """LLM 이 아니라 렌더러가 결정하는 값 — 모델이 기사 날짜를 실행일로 착각하는 것을 차단.
+
+    고정 시각(run_time)이면 재시도·재현 렌더가 같은 바이트를 낸다(렌더 캐시 키가 안정된다).
+    """
+    return {"RUN_DATE": run_time(now).strftime("%Y-%m-%d")}
+
+
+class PhaseTimer:
+    """단계별 누적 시간 — --stats-json 용. 렌더 경로는 timer 가 None 이면 시간을 재지 않는다.
+
+    escape 는 scalar_fill·render 에 이미 포함된 하위 합계다(중복 계산 주의).
+    """
+
+    def __init__(self):
+        self.phases, self.groups = {}, {}
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_group(self, name, seconds):
+        self.groups[name] = self.groups.get(name, 0.0) + seconds
+
+    def as_dict(self):
+        ms = lambda d: {k: round(v * 1000, 3) for k, v in d.items()}
+        return {"phases_ms": ms(self.phases), "groups_ms": ms(self.groups)}
+
+
+# 프로파일 — 요약에 남길 상위 함수·할당 위치 수, tracemalloc 이 기록할 스택 깊이.
+PROFILE_TOP = 25
+PROFILE_FRAMES = 8
+# tracemalloc 은 프로세스 전역이라 데몬 스레드의 프로파일 잡은 한 번에 하나씩만 돈다.
+_profile_lock = threading.Lock()
+
+
+class Profiler(PhaseTimer):
+    """cProfile + tracemalloc 캡처 — with 블록 안의 렌더 1건을 기록한다.
+
+    PhaseTimer 로도 동작해 단계 경계(add)마다 추적 메모리가 최고치면 스냅샷을 갱신한다 —
+    스트리밍 렌더는 끝나면 메모리를 놓으므로 종료 시점 스냅샷으로는 최고점을 볼 수 없다.
+    종료 시 out_dir 에 <label>.pstats · <label>.alloc.txt · <label>.txt 를 기록한다.
+    """
+
+    def __init__(self, out_dir, label):
+        super().__init__()
+        self.out_dir = out_dir
+        self.label = re.sub(r"[^\w.-]+", "_", str(label)).strip("_")[-80:] or "render"
+        self.snapshot, self.snapshot_bytes, self.active = None, -1, False
+
+    def add(self, name, seconds):
+        super().add(name, seconds)
+        if name != "escape":  # 항목마다 불리는 하위 합계 — 스냅샷 비용이 렌더를 압도한다
+            self.checkpoint()
+
+    def checkpoint(self):
+        import tracemalloc
+        if not self.active:
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.snapshot_bytes:
+            self.snapshot, self.snapshot_bytes = tracemalloc.take_snapshot(), current
+
+    def __enter__(self):
+        import cProfile, tracemalloc
+        _profile_lock.acquire()
+        self.profile = cProfile.Profile()
+        tracemalloc.start(PROFILE_FRAMES)
+        self.active, self.started = True, time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        import tracemalloc
+        self.profile.disable()
+        try:
+            self.wall = time.perf_counter() - self.started
+            self.checkpoint()
+            self.peak = tracemalloc.get_traced_memory()[1]
+            self.active = False
+            tracemalloc.stop()
+            self.path = self.save()
+        finally:
+            _profile_lock.release()
+        return False
+
+    def save(self):
+        """pstats · 할당 위치 · 요약 기록 — 요약 파일 경로 반환."""
+        import io, pstats
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, self.label)
+        self.profile.dump_stats(base + ".pstats")
+        top = self.snapshot.statistics("traceback")[:PROFILE_TOP] if self.snapshot else []
+        with open(base + ".alloc.txt", "w", encoding="utf-8") as f:
+            f.write(f"# 추적 메모리 최고점 스냅샷 {self.snapshot_bytes} bytes — 상위 {len(top)}개 할당 위치\n")
+            for stat in top:
+                f.write(f"\n{stat.size / 1024:10.1f} KiB  {stat.count:8d}개\n")
+                f.write("\n".join("    " + line for line in stat.traceback.format()) + "\n")
+        buf = io.StringIO()
+        pstats.Stats(self.profile, stream=buf).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        phases = self.as_dict()
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(f"프로파일: {self.label}\n벽시계 {self.wall * 1000:.1f}ms · 추적 메모리 최고 "
+                    f"{self.peak / 1048576:.1f}MB (스냅샷 {max(self.snapshot_bytes, 0) / 1048576:.1f}MB)\n")
+            f.write(f"단계(ms): {phases['phases_ms']}\n그룹(ms): {phases['groups_ms']}\n")
+            if top:
+                frame = top[0].traceback[-1]
+                f.write(f"최대 할당 위치: {frame.filename}:{frame.lineno} ({top[0].size / 1024:.1f} KiB)\n")
+            f.write("\n" + buf.getvalue())
+        return base + ".txt"
+
+
+def warning(code, message, **extra):
+    """구조화 경고 — code 는 기계 판독용, message 는 사람용(CLI 는 '경고 — ' 로 출력). extra 는 수치 필드."""
+    return {"code": code, "message": message, **extra}
 
 
 def esc(v):
-    """LLM 이 만든 문자열이 마크업으로 해석되지 않게 이스케이프(공개 URL 로 서빙됨)."""
-    return html.escape(str(v), quote=True)
+    """LLM 이 만든 문자열이 마크업으로 해석되지 않게 이스케이프(공개 URL 로 서빙됨).
+    report-renderer.ts 와 같은 엔티티(' → &#39;) — 두 렌더러 출력이 바이트 단위로 같아야 한다."""
+    return (str(v).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;").replace("'", "&#39;"))
+
+
+def _compile_span(text):
+    """반복 블록 없는 구간 → [("text", 문자열) | ("token", 이름)] 노드."""
+    nodes, pos = [], 0
+    for m in TOKEN_RE.finditer(text):
+        if m.start() > pos:
+            nodes.append(("text", text[pos:m.start()]))
+        nodes.append(("token", m.group(1)))
+        pos = m.end()
+    if pos < len(text):
+        nodes.append(("text", text[pos:]))
+    return nodes
+
+
+def compile_template(tpl):
+    """템플릿을 1회 파싱해 평면 노드 리스트로 — 리터럴 구간·토큰 자리·반복 노드.
+
+    렌더는 이 리스트를 한 번 순회하며 조각을 이어붙이므로 O(템플릿 + 데이터)다.
+    치환된 값은 다시 스캔되지 않는다 — 기사 본문에 {{SUMMARY}} 같은 문자열이 있어도
+    재치환되지 않는다(구 replace 루프는 값 안의 토큰까지 다시 치환해 출력이 부풀었다).
+    """
+    nodes, pos = [], 0
+    for m in REPEAT_RE.finditer(tpl):
+        nodes += _compile_span(tpl[pos:m.start()])
+        nodes.append(("repeat", m.group(1), _compile_span(m.group(2))))
+        pos = m.end()
+    nodes += _compile_span(tpl[pos:])
+    return nodes
+
+
+# 사전 컴파일 AST — 이미지 빌드 시 `--compile` 로 템플릿 옆에 <이름>.ast.json 을 굽는다.
+# 언어 중립 JSON(노드는 ["text", s] · ["token", 이름] · ["repeat", 이름, [노드...]])이라
+# TS 렌더러(report-template-ast.ts)도 같은 구조를 그대로 읽는다. 템플릿 sha256 이 다르면 무효.
+AST_FORMAT = 1
+
 
+def ast_path(tpl_path):
+    return os.path.splitext(tpl_path)[0] + ".ast.json"
 
-def blocks(tpl):
-    """템플릿의 반복 블록 {그룹명: 블록 HTML}."""
-    return {m.group(1): m.group(2) for m in REPEAT_RE.finditer(tpl)}
 
+def template_ast(nodes, sha256, source):
+    """컴파일 결과 → AST 문서 (리터럴 구간·토큰 자리·반복 그룹·스칼라 키 목록)."""
+    return {
+        "format": AST_FORMAT,
+        "source": source,
+        "sha256": sha256,
+        "scalars": scalar_tokens(nodes),
+        "groups": list(blocks(nodes)),
+        "nodes": nodes,
+    }
 
-def scalar_tokens(tpl):
+
+def load_template(tpl_path, timer=None):
+    """템플릿 노드 — 해시가 일치하는 사전 컴파일 AST 가 있으면 파싱 없이 그대로 쓴다."""
+    started = time.perf_counter()
+    raw = open(tpl_path, "rb").read()
+    sha = hashlib.sha256(raw).hexdigest()
+    try:
+        ast = json.load(open(ast_path(tpl_path), encoding="utf-8"))
+        if ast.get("format") == AST_FORMAT and ast.get("sha256") == sha:
+            if timer:
+                timer.add("template_load", time.perf_counter() - started)
+            return ast["nodes"]
+    except (OSError, ValueError, AttributeError):
+        pass
+    loaded = time.perf_counter()
+    nodes = compile_template(raw.decode("utf-8"))
+    if timer:
+        timer.add("template_load", loaded - started)
+        timer.add("compile", time.perf_counter() - loaded)
+    return nodes
+
+
+def write_template_ast(tpl_path):
+    """템플릿을 컴파일해 AST 파일로 기록 — 기록한 경로 반환."""
+    raw = open(tpl_path, "rb").read()
+    ast = template_ast(compile_template(raw.decode("utf-8")),
+                       hashlib.sha256(raw).hexdigest(), os.path.basename(tpl_path))
+    out = ast_path(tpl_path)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(ast, f, ensure_ascii=False, separators=(",", ":"))
+    return out
+
+
+def blocks(nodes):
+    """컴파일된 템플릿의 반복 블록 {그룹명: 블록 노드}."""
+    return {n[1]: n[2] for n in nodes if n[0] == "repeat"}
+
+
+def scalar_tokens(nodes):
     """반복 블록 밖의 스칼라 토큰(등장 순서 유지, 중복 제거)."""
-    outside = REPEAT_RE.sub("", tpl)
     seen, out = set(), []
-    for m in TOKEN_RE.finditer(outside):
-        if m.group(1) not in seen:
-            seen.add(m.group(1)); out.append(m.group(1))
+    for n in nodes:
+        if n[0] == "token" and n[1] not in seen:
+            seen.add(n[1]); out.append(n[1])
     return out
 
 
-def render_group(block, items):
-    """블록을 항목 수만큼 복제 — {{ITEM_FIELD}} 를 항목의 field 값으로 치환."""
-    if not items:
-        return EMPTY_CARD
-    out = []
+def data_keys(ks):
+    """LLM 이 data.json 에 채울 키 — 카운트·날짜는 렌더러 계산, 추세선(X_TREND)은 선택 키라 제외."""
+    auto = set(computed())
+    return [k for k in ks if not k.endswith(("_COUNT", SPARK_SUFFIX)) and k not in auto]
+
+
+# 출력 묶음 크기 — 이만큼 모이면 writev 한 번으로 내보낸다(문서 전체를 메모리에 만들지 않음).
+WRITE_BUFFER = 64 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def utf8(text):
+    """템플릿 리터럴의 UTF-8 인코딩 — 데몬·배치 반복 렌더에서 재인코딩하지 않게 캐시."""
+    return text.encode("utf-8")
+
+
+# 카드 조각 캐시 상한 — 메모리 항목 수, 디스크 파일 바이트.
+FRAGMENT_CACHE_ENTRIES = 20000
+FRAGMENT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class FragmentCache:
+    """뉴스 카드 조각 LRU — 키는 (블록 해시, 블록이 쓰는 항목 필드 값). 스레드 안전.
+
+    연속 일간 실행·에이전트 재시도에서 반복되는 기사는 이스케이프·치환 없이 조각을 복사한다.
+    path 를 주면 시작 시 읽고 save() 때 최근 사용 순으로 max_bytes 까지만 남겨 기록한다.
+    """
+
+    def __init__(self, path=None, max_entries=FRAGMENT_CACHE_ENTRIES, max_bytes=FRAGMENT_CACHE_BYTES):
+        self.path, self.max_entries, self.max_bytes = path, max_entries, max_bytes
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+        if path:
+            self.load()
+
+    def get(self, key):
+        with self.lock:
+            card = self.entries.get(key)
+            if card is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return card
+
+    def put(self, key, card):
+        with self.lock:
+            self.entries[key] = card
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    block_id, fields, card = json.loads(line)
+                    self.put((block_id, tuple(fields)), card.encode("utf-8"))
+        except (OSError, ValueError, TypeError):
+            pass  # 캐시 부재·손상은 빈 캐시로 시작
+
+    def save(self):
+        """최근 사용 순으로 max_bytes 까지 남겨 원자적으로 기록(임시 파일 → rename)."""
+        if not self.path:
+            return
+        with self.lock:
+            lines, size = [], 0
+            for (block_id, fields), card in reversed(self.entries.items()):
+                line = json.dumps([block_id, fields, card.decode("utf-8")], ensure_ascii=False) + "\n"
+                size += len(line.encode("utf-8"))
+                if size > self.max_bytes:
+                    break
+                lines.append(line)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(reversed(lines))
+        os.replace(tmp, self.path)
+
+
+def block_id(block):
+    return hashlib.sha1(json.dumps(block, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def card_fields(block, it, values):
+    """카드가 쓰는 치환 원값 — ITEM_* 는 항목 필드 원문, 그 외는 (이스케이프 완료) 스칼라 값."""
+    return tuple(
+        str(it.get(n[1][5:].lower(), "—")) if n[1].startswith("ITEM_") else values.get(n[1], "{{" + n[1] + "}}")
+        for n in block if n[0] == "token"
+    )
+
+
+def spec_card_fields(block, fields, values):
+    """레지스트리 항목(item_fields 결과)의 카드 치환 값 — 필드가 없으면 —."""
+    return tuple(
+        fields.get(n[1], "—") if n[1].startswith("ITEM_") else values.get(n[1], "{{" + n[1] + "}}")
+        for n in block if n[0] == "token"
+    )
+
+
+def render_card(block, fields, timer=None, safe=False):
+    out, f = [], iter(fields)
+    for n in block:
+        if n[0] == "text":
+            out.append(utf8(n[1]))
+        elif n[1].startswith("ITEM_") and not safe:
+            if timer:
+                started = time.perf_counter()
+                out.append(esc(next(f)).encode("utf-8"))
+                timer.add("escape", time.perf_counter() - started)
+            else:
+                out.append(esc(next(f)).encode("utf-8"))
+        else:
+            out.append(next(f).encode("utf-8"))
+    return b"".join(out)
+
+
+def iter_group(block, items, values, fragments=None, timer=None):
+    """블록을 항목 수만큼 복제해 항목 단위 UTF-8 조각으로 — {{ITEM_FIELD}} 는 항목의 field 값,
+    그 외 토큰은 스칼라 값. fragments(FragmentCache)가 있으면 같은 카드는 캐시에서 복사."""
+    empty = True
+    bid = block_id(block) if fragments is not None else None
+    safe = isinstance(items, SpecItems)  # 레지스트리 항목 — 필드가 이미 안전 HTML
     for it in items:
-        chunk = block
-        for tok in set(TOKEN_RE.findall(block)):
-            if not tok.startswith("ITEM_"):
-                continue
-            chunk = chunk.replace("{{" + tok + "}}", esc(it.get(tok[5:].lower(), "—")))
-        out.append(chunk)
-    return "".join(out)
-
-
-def main():
-    tpl = open(TPL, encoding="utf-8").read()
-    ks = scalar_tokens(tpl)
-    if "--keys" in sys.argv:
-        # 카운트·날짜 토큰은 렌더러가 계산하므로 LLM 이 채울 대상에서 제외.
-        auto = set(computed())
-        print("\n".join(k for k in ks if not k.endswith("_COUNT") and k not in auto))
-        print(f"\n[{NEWS_SOURCE_KEY}] 배열 — 조사한 기사를 건수 제한 없이 모두 담는다. "
-              f"항목 필드: region(국내|국외) · src · date · title · desc")
+        empty = False
+        fields = spec_card_fields(block, it, values) if safe else card_fields(block, it, values)
+        card = fragments.get((bid, fields)) if fragments is not None else None
+        if card is None:
+            card = render_card(block, fields, timer, safe)
+            if fragments is not None:
+                fragments.put((bid, fields), card)
+        yield card
+    if empty:
+        yield utf8(items.empty if safe else EMPTY_CARD)
+
+
+def _timed(chunks, timer, name):
+    """그룹 조각 스트림 — 조각을 만드는 시간만(소비자 쪽 기록 시간 제외) 그룹별로 누적."""
+    spent, clock = 0.0, time.perf_counter
+    it = iter(chunks)
+    while True:
+        started = clock()
+        chunk = next(it, None)
+        spent += clock() - started
+        if chunk is None:
+            break
+        yield chunk
+    timer.add_group(name, spent)
+
+
+def iter_render(nodes, values, groups, marks=None, fragments=None, timer=None):
+    """컴파일된 템플릿을 단일 선형 패스로 렌더 — UTF-8 조각 스트림. values 는 이스케이프 완료.
+
+    marks(dict)를 주면 추가 렌더(--append)용 바이트 오프셋을 기록한다 — 그룹별 카드 구간
+    [start, end) 와 *_COUNT 자리의 [offset, 길이] 목록. timer(PhaseTimer)를 주면 그룹별
+    카드 생성 시간과 항목 이스케이프 시간을 기록한다.
+    """
+    pos = 0
+    for n in nodes:
+        if n[0] == "text":
+            chunk = utf8(n[1])
+        elif n[0] == "token":
+            chunk = values[n[1]].encode("utf-8")
+            if marks is not None and n[1].endswith("_COUNT"):
+                marks["slots"].setdefault(n[1], []).append([pos, len(chunk)])
+        else:
+            start = pos
+            items = groups.get(n[1], ())
+            cards = iter_group(n[2], items, values, fragments, timer)
+            for chunk in (_timed(cards, timer, n[1]) if timer else cards):
+                pos += len(chunk)
+                yield chunk
+            # --append 는 카드 끝(간단 목록 앞)에 끼워 넣는다 — 순위·상한은 다시 적용하지 않는다.
+            if marks is not None:
+                marks["groups"][n[1]] = {"start": start, "end": pos, "count": len(items)}
+            if isinstance(items, RankedItems) and items.overflow:
+                more = iter_more(items)
+                for chunk in (_timed(more, timer, n[1]) if timer else more):
+                    pos += len(chunk)
+                    yield chunk
+            continue
+        pos += len(chunk)
+        yield chunk
+
+
+def render_html(nodes, values, groups, fragments=None):
+    """iter_render 를 문자열 하나로 — 메모리에 전체 문서가 필요한 호출부용."""
+    return b"".join(iter_render(nodes, values, groups, fragments=fragments)).decode("utf-8")
+
+
+def _write_all(fd, batch):
+    """조각 묶음을 fd 에 전부 기록(vectored write, 부분 기록 시 나머지 재시도)."""
+    size = sum(len(b) for b in batch)
+    written = os.writev(fd, batch) if hasattr(os, "writev") else 0
+    if written < size:
+        rest = memoryview(b"".join(batch))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+    return size
+
+
+def write_stream(chunks, out_path, timer=None):
+    """UTF-8 조각 스트림 → 파일. WRITE_BUFFER 단위로 묶어 writev — 피크 메모리는 묶음 크기로 고정.
+
+    같은 디렉토리의 임시 파일에 쓰고 끝까지 성공했을 때만 rename 한다 — 렌더 도중 실패해도
+    기존 보고서가 잘린 파일로 바뀌지 않는다.
+    timer 가 있으면 실제 기록 시간은 write, 나머지(조각 생성)는 render 로 나눠 기록한다.
+    """
+    total, batch, pending, spent = 0, [], 0, 0.0
+    started = time.perf_counter()
+    tmp = f"{out_path}.{os.getpid()}.{threading.get_ident()}.tmp"  # 데몬·배치 스레드끼리 겹치지 않게
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            for chunk in chunks:
+                batch.append(chunk)
+                pending += len(chunk)
+                if pending >= WRITE_BUFFER:
+                    t = time.perf_counter()
+                    total += _write_all(fd, batch)
+                    spent += time.perf_counter() - t
+                    batch, pending = [], 0
+            if batch:
+                t = time.perf_counter()
+                total += _write_all(fd, batch)
+                spent += time.perf_counter() - t
+        finally:
+            os.close(fd)
+        os.replace(tmp, out_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    if timer:
+        timer.add("render", time.perf_counter() - started - spent)
+        timer.add("write", spent)
+    return total
+
+
+class SpooledItems:
+    """NDJSON 그룹 항목 스풀 — 원문 줄을 임시 파일에 쌓고, 렌더 시 한 줄씩 다시 읽는다."""
+
+    def __init__(self):
+        self.file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+        self.count = 0
+        self.extra = {}  # 위치 → 병합된 중복 기사의 추가 출처(원문 줄은 그대로 두고 읽을 때 반영)
+
+    def append(self, line):
+        self.file.write(line.rstrip(b"\r\n") + b"\n")
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        self.file.seek(0)
+        for i, line in enumerate(self.file):
+            it = json.loads(line)
+            yield with_sources(it, self.extra[i]) if i in self.extra else it
+
+    def flush(self):
+        """fork 직전 부모에서 부른다 — 버퍼에 남은 줄을 파일로 내려 자식이 끝까지 읽게 한다(자식이 내리면
+        형제마다 같은 꼬리를 공유 오프셋에 중복 기록한다)."""
+        self.file.flush()
+
+    def detach(self):
+        """fork 된 자식에서 부른다 — 디스크 스풀은 파일 오프셋을 부모·형제 프로세스와 공유하므로 같은
+        파일을 독립 핸들로 다시 연다(/proc/self/fd). 메모리 스풀은 자식 사본이라 그대로 두어도 되지만
+        한 경로로 다루려고 먼저 디스크로 내린다(상한 SPOOL_MEMORY)."""
+        self.file.rollover()
+        self.file = open(f"/proc/self/fd/{self.file.fileno()}", "rb")
+
+    def close(self):
+        self.file.close()
+
+
+def close_groups(groups):
+    """그룹별 항목 중 NDJSON 스풀(임시 파일)을 닫는다."""
+    for g in groups.values():
+        if isinstance(g, (SpooledItems, RankedItems)):
+            g.close()
+
+
+def news_ndjson_path(data, data_path):
+    """NDJSON 뉴스 입력 경로 — "news": "x.ndjson" 또는 (news 키 부재 시) data.json 옆 news.ndjson."""
+    base = os.path.dirname(os.path.abspath(data_path)) if isinstance(data_path, str) else os.getcwd()
+    ref = data.get(NEWS_SOURCE_KEY) if isinstance(data, dict) else None
+    if isinstance(ref, str):
+        return os.path.join(base, ref)
+    if ref is None and isinstance(data_path, str):
+        path = os.path.join(base, NEWS_NDJSON)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def norm_region(v):
+    return " ".join(re.split(r"[\s_-]+", str(v).casefold())).strip() if v is not None else ""
+
+
+REGION_TABLE = {norm_region(a): name for name, aliases in REGION_ALIASES.items() for a in aliases}
+
+
+def region_fallback():
+    """대체 그룹명(없으면 None) — REPORT_REGION_FALLBACK 은 그룹명 또는 region 값."""
+    v = os.environ.get("REPORT_REGION_FALLBACK", REGION_FALLBACK).strip()
+    return v if v in GROUPS else REGION_TABLE.get(norm_region(v)) if v else None
+
+
+def group_config():
+    """분류·중복 병합·정렬 설정 — 렌더 캐시 키에 들어간다(설정이 바뀌면 같은 입력도 다른 출력)."""
+    return json.dumps([region_fallback(), os.environ.get("REPORT_REGION_SRC", "1") != "0",
+                       dedupe_threshold(), group_rank()], sort_keys=True)
+
+
+class RegionClassifier:
+    """기사 → 그룹명 O(1) 분류 — region 별칭표, src TLD(.kr), 대체 그룹 순. 템플릿에 있는 그룹만 대상."""
+
+    def __init__(self, names):
+        names = set(names)
+        self.table = {k: n for k, n in REGION_TABLE.items() if n in names}
+        fallback = region_fallback()
+        self.fallback = fallback if fallback in names else None
+        self.domestic = self.table.get("kr") if os.environ.get("REPORT_REGION_SRC", "1") != "0" else None
+        self.inferred = self.fell_back = 0
+
+    def __call__(self, it):
+        if not isinstance(it, dict):
+            return None
+        name = self.table.get(norm_region(it.get("region")))
+        if name:
+            return name
+        if self.domestic:
+            m = SRC_HOST_RE.match(str(it.get("src") or "").strip())
+            if m and m.group(2).lower() in DOMESTIC_TLDS:
+                self.inferred += 1
+                return self.domestic
+        if self.fallback:
+            self.fell_back += 1
+        return self.fallback
+
+    def report(self, warnings):
+        if self.inferred or self.fell_back:
+            parts = [f"src 도메인(.kr)으로 국내 추정 {self.inferred}건"] if self.inferred else []
+            if self.fell_back:
+                parts.append(f"대체 그룹 {self.fallback} 로 {self.fell_back}건")
+            warnings.append(warning("REGION_INFERRED", "region 이 없거나 알 수 없는 기사 — " + ", ".join(parts)))
+
+
+def dedupe_threshold():
+    """중복 병합 Jaccard 임계값 — REPORT_DEDUPE(on 이면 DEDUPE_THRESHOLD, 0~1 은 그 값). 기본·0·off 면 None."""
+    v = os.environ.get("REPORT_DEDUPE", "").strip().lower()
+    if v in ("", "0", "off"):
+        return None
+    if v == "on":
+        return DEDUPE_THRESHOLD
+    try:
+        t = float(v)
+    except ValueError:
+        t = -1.0
+    if not 0 < t <= 1:
+        raise RenderError(f"REPORT_DEDUPE 형식 오류: {v!r} (on 또는 0~1 의 Jaccard 임계값, 0·off 면 끔)")
+    return t
+
+
+def norm_title(title):
+    """비교용 제목 — NFKC·소문자, [속보]·(종합) 류 머리표와 공백·문장부호 제거."""
+    return TITLE_NOISE_RE.sub("", unicodedata.normalize("NFKC", str(title or "")).casefold())
+
+
+def title_shingles(title):
+    """제목 → 문자 3-gram 집합(norm_title 기준)."""
+    text = norm_title(title)
+    if len(text) <= SHINGLE:
+        return frozenset([text]) if text else frozenset()
+    return frozenset({text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)})
+
+
+def title_guard(title):
+    """병합 가드 — (첫 단어, 숫자 목록). 3-gram 이 아무리 겹쳐도 이것이 다르면 다른 기사로 본다."""
+    text = TITLE_TAG_RE.sub(" ", unicodedata.normalize("NFKC", str(title or "")).casefold())
+    first = TITLE_WORD_RE.search(text)
+    return (first.group() if first else "", tuple(TITLE_NUMBER_RE.findall(text)))
+
+
+def minhash(grams):
+    """원-퍼뮤테이션 MinHash — 3-gram 마다 crc32 한 번, 빈(bin)별 최솟값. 빈 칸은 오른쪽 이웃 값을
+    거리만큼 밀어 채운다(rotation densification) — 짧은 제목도 모든 밴드에 서명이 생긴다."""
+    hs = sorted(map(zlib.crc32, (g.encode("utf-8") for g in grams)), reverse=True)
+    mins = dict(zip([h % MINHASH_BINS for h in hs], hs))  # 내림차순으로 덮어써 빈마다 최솟값이 남는다
+    if len(mins) == MINHASH_BINS:
+        return [mins[i] for i in range(MINHASH_BINS)]
+    sig = []
+    for i in range(MINHASH_BINS):
+        d = 0
+        while (i + d) % MINHASH_BINS not in mins:
+            d += 1
+        sig.append((d, mins[(i + d) % MINHASH_BINS]) if d else mins[i])
+    return sig
+
+
+def with_sources(it, sources):
+    """대표 기사 + 병합된 중복의 출처 → src 를 '대표 외 N곳(…)' 로."""
+    return {**it, "src": f"{it.get('src') or '—'} 외 {len(sources)}곳({', '.join(sources)})"}
+
+
+class Deduper:
+    """유사 중복 기사 병합 — 제목 3-gram 집합의 MinHash 서명을 LSH 밴드 버킷에 넣고, 버킷이 겹친
+    후보만 정확한 Jaccard 로 확인한다(전 쌍 비교 없이 대략 선형). 먼저 나온 기사가 대표."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.exact = {}    # 3-gram 집합 → 대표 번호(정규화 제목이 같으면 버킷 상한과 무관하게 병합)
+        self.bands = [{} for _ in range(MINHASH_BANDS)]  # 밴드별 {(title_guard, 서명 조각): [대표 번호]}
+        self.grams = []    # 대표 번호 → 3-gram 집합
+        self.refs = []     # 대표 번호 → (그룹명, 그룹 안 위치)
+        self.sources = []  # 대표 번호 → [대표 출처, 추가 출처…]
+        self.merged = 0
+
+    def add(self, it, ref):
+        """새 기사면 대표로 등록하고 True, 앞선 기사의 중복이면 그 대표에 출처를 합치고 False."""
+        grams = title_shingles(it.get("title"))
+        if not grams:
+            return True
+        cid = self.exact.get(grams)
+        if cid is not None:
+            return self.merge(cid, it)
+        # 가드가 다른 기사는 병합 대상이 아니므로 버킷 키에 넣는다 — 후보 비교 자체가 생기지 않는다
+        guard = title_guard(it.get("title"))
+        keys = [(guard, k) for k in zip(*[iter(minhash(grams))] * MINHASH_ROWS)]
+        seen = set()
+        for band, k in zip(self.bands, keys):
+            for cid in band.get(k, ()):
+                if cid in seen:
+                    continue
+                seen.add(cid)
+                other = self.grams[cid]
+                inter = len(grams & other)
+                if inter >= self.threshold * (len(grams) + len(other) - inter):
+                    return self.merge(cid, it)
+        cid = len(self.refs)
+        self.exact[grams] = cid
+        self.grams.append(grams)
+        self.refs.append(ref)
+        self.sources.append([str(it.get("src") or "").strip()])
+        for band, k in zip(self.bands, keys):
+            bucket = band.setdefault(k, [])
+            if len(bucket) < LSH_BUCKET_CAP:
+                bucket.append(cid)
+        return True
+
+    def merge(self, cid, it):
+        src = str(it.get("src") or "").strip()
+        if src and src not in self.sources[cid]:
+            self.sources[cid].append(src)
+        self.merged += 1
+        return False
+
+    def apply(self, groups, warnings):
+        """대표 기사에 추가 출처 반영 + DUPLICATES_MERGED 경고(count = 병합 건수)."""
+        for (name, pos), sources in zip(self.refs, self.sources):
+            if len(sources) > 1:
+                g = groups[name]
+                if isinstance(g, SpooledItems):
+                    g.extra[pos] = sources[1:]
+                else:
+                    g[pos] = with_sources(g[pos], sources[1:])
+        if self.merged:
+            warnings.append(warning("DUPLICATES_MERGED", f"유사 중복 기사 {self.merged}건을 대표 카드로 병합",
+                                    count=self.merged))
+
+
+class History:
+    """기사 지문(정규화 제목 해시) → 처음 렌더된 RUN_DATE 를 담는 SQLite 저장소.
+
+    열 때 보존 기간 안·오늘 이전의 지문을 dict 로 한 번에 읽어 조회는 O(1). 같은 날 재실행은
+    반복으로 보지 않는다. 이번 실행의 지문은 렌더가 성공한 뒤 commit() 에서만 기록한다
+    (INSERT OR IGNORE — 첫 보도일 유지). 보존 기간이 지난 행은 그때 run_date 인덱스로 지운다.
+    연결은 읽을 때와 기록할 때만 연다 — 렌더 중(부가 출력 fork 포함)에는 열린 SQLite 연결이 없다.
+    """
+
+    def __init__(self, path, run_date, mode="mark", days=HISTORY_DAYS):
+        self.path, self.run_date, self.mode = path, run_date, mode
+        self.cutoff = (datetime.date.fromisoformat(run_date) - datetime.timedelta(days=days)).isoformat()
+        try:
+            with contextlib.closing(sqlite3.connect(path, timeout=30)) as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("CREATE TABLE IF NOT EXISTS seen (fp TEXT PRIMARY KEY, run_date TEXT NOT NULL) WITHOUT ROWID")
+                db.execute("CREATE INDEX IF NOT EXISTS seen_run_date ON seen (run_date)")
+                self.known = dict(db.execute("SELECT fp, run_date FROM seen WHERE run_date >= ? AND run_date < ?",
+                                             (self.cutoff, run_date)))
+        except sqlite3.Error as e:
+            raise RenderError(f"기사 이력 저장소를 열 수 없습니다: {path} ({e})") from None
+        self.pending = set()
+        self.repeats = 0
+
+    def check(self, it):
+        """(남길 항목 | None) — 이전 실행에 렌더된 기사면 표시하거나(mark) 뺀다(suppress)."""
+        text = norm_title(it.get("title"))
+        if not text:
+            return it
+        fp = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        self.pending.add(fp)
+        first = self.known.get(fp)
+        if first is None:
+            return it
+        self.repeats += 1
+        if self.mode == "suppress":
+            return None
+        return {**it, "date": f"{it.get('date') or '—'}{REPRINT_MARK}{first})"}
+
+    def report(self, warnings):
+        if self.repeats:
+            code, verb = ("HISTORY_SUPPRESSED", "제외") if self.mode == "suppress" else ("HISTORY_MARKED", "표시")
+            warnings.append(warning(code, f"이전 실행에 보도된 기사 {self.repeats}건 {verb}", count=self.repeats))
+
+    def commit(self):
+        try:
+            with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as db, db:
+                db.execute("DELETE FROM seen WHERE run_date < ?", (self.cutoff,))
+                db.executemany("INSERT OR IGNORE INTO seen (fp, run_date) VALUES (?, ?)",
+                               ((fp, self.run_date) for fp in self.pending))
+        except sqlite3.Error as e:
+            raise RenderError(f"기사 이력을 기록할 수 없습니다: {self.path} ({e})") from None
+
+
+def history_path():
+    """CLI 가 render_file·append_items 에 넘길 이력 경로(REPORT_HISTORY). 없으면 None."""
+    return os.environ.get("REPORT_HISTORY") or None
+
+
+@contextlib.contextmanager
+def article_history(run_date, path):
+    """path 가 있으면 History — 블록이 예외 없이 끝날 때만 이번 실행 지문을 기록."""
+    if not path or run_date is None:
+        yield None
         return
+    mode = os.environ.get("REPORT_HISTORY_MODE", "mark").strip()
+    days = os.environ.get("REPORT_HISTORY_DAYS", str(HISTORY_DAYS)).strip()
+    if mode not in HISTORY_MODES or not days.isdigit():
+        raise RenderError(f"REPORT_HISTORY_MODE(mark|suppress)·REPORT_HISTORY_DAYS(일수) 형식 오류: {mode!r}, {days!r}")
+    history = History(path, run_date, mode, int(days))
+    yield history
+    history.commit()
 
-    data_path = sys.argv[1] if len(sys.argv) > 1 else "data.json"
-    out_path = sys.argv[2] if len(sys.argv) > 2 else "report.html"
-    data = json.load(open(data_path, encoding="utf-8"))
-    items = data.get(NEWS_SOURCE_KEY) or []
-    if not isinstance(items, list):
-        print(f"오류: '{NEWS_SOURCE_KEY}' 는 배열이어야 합니다.", file=sys.stderr)
-        sys.exit(1)
 
-    html_out = tpl
-    counts = {}
-    for name, block in blocks(tpl).items():
-        region = GROUPS.get(name)
-        group = [i for i in items if isinstance(i, dict) and str(i.get("region", "")).strip() == region]
-        counts[name] = len(group)
-        html_out = REPEAT_RE.sub(
-            lambda m, b=block, g=group: render_group(b, g) if m.group(1) == name else m.group(0),
-            html_out,
-        )
-
-    auto = computed()
+def partition(items, names, warnings, history=None):
+    """기사 → 그룹 1패스 분류(+ 이력 대조·유사 중복 병합). {그룹명: 항목 리스트}, 유효 기사 수
+    (이력 제외·병합분 뺀 값)."""
+    classify = RegionClassifier(names)
+    threshold = dedupe_threshold()
+    dedupe = Deduper(threshold) if threshold else None
+    groups = {n: [] for n in names}
+    dropped = 0
+    for it in items:
+        name = classify(it)
+        if name and history is not None:
+            it = history.check(it)
+            if it is None:
+                dropped += 1
+                continue
+        if name and (dedupe is None or dedupe.add(it, (name, len(groups[name])))):
+            groups[name].append(it)
+    classify.report(warnings)
+    if history is not None:
+        history.report(warnings)
+    if dedupe is not None:
+        dedupe.apply(groups, warnings)
+        dropped += dedupe.merged
+    return groups, len(items) - dropped
+
+
+def partition_ndjson(path, names, warnings, history=None):
+    """NDJSON 기사 → 그룹별 스풀 1패스 분류 (배열 전체를 메모리에 두지 않는다)."""
+    classify = RegionClassifier(names)
+    threshold = dedupe_threshold()
+    dedupe = Deduper(threshold) if threshold else None
+    groups = {n: SpooledItems() for n in names}
+    total = bad = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                it = json.loads(line)
+            except ValueError:
+                bad += 1
+                continue
+            total += 1
+            name = classify(it)
+            if name and history is not None:
+                checked = history.check(it)
+                if checked is None:
+                    total -= 1
+                    continue
+                if checked is not it:
+                    it, line = checked, json.dumps(checked, ensure_ascii=False).encode("utf-8")
+            if name and (dedupe is None or dedupe.add(it, (name, len(groups[name])))):
+                groups[name].append(line)
+    classify.report(warnings)
+    if history is not None:
+        history.report(warnings)
+    if dedupe is not None:
+        dedupe.apply(groups, warnings)
+        total -= dedupe.merged
+    if bad:
+        warnings.append(warning("BAD_NEWS_LINES", f"{os.path.basename(path)} 에서 JSON 이 아닌 줄 {bad}개 무시"))
+    return groups, total
+
+
+def group_rank():
+    """그룹별 {top, by} — GROUP_RANK 에 REPORT_GROUP_RANK(NAME=TOP[:date|score|input],...) 를 덮어쓴 것."""
+    rank = {k: dict(v) for k, v in GROUP_RANK.items()}
+    for part in filter(None, (p.strip() for p in os.environ.get("REPORT_GROUP_RANK", "").split(","))):
+        name, _, conf = part.partition("=")
+        top, _, by = conf.partition(":")
+        if not top.strip().isdigit() or by.strip() not in RANK_KEYS + ("input", ""):
+            raise RenderError(f"REPORT_GROUP_RANK 형식 오류: {part!r} (NAME=TOP[:date|score|input])")
+        entry = rank.setdefault(name.strip(), {"top": 0, "by": "date"})
+        entry["top"] = int(top)
+        if by.strip():
+            entry["by"] = None if by.strip() == "input" else by.strip()
+    return rank
+
+
+def date_key(v, now=None):
+    """기사 date → 비교 가능한 정수 튜플(연·월·일[·시·분]). 못 읽으면 가장 오래된 것으로.
+
+    mark 모드의 재보도 표시는 떼고 읽는다. 상대 날짜는 now(실행 시각)가 있을 때만 환산한다.
+    """
+    text = str(v or "").split(REPRINT_MARK, 1)[0]
+    m = DATE_RE.search(text)
+    if m:
+        return tuple(int(x) for x in m.groups() if x is not None)
+    if now is not None:
+        m = RELATIVE_DATE_RE.search(text)
+        if m:
+            unit = RELATIVE_UNITS[m.group(2).lower().rstrip("s").replace("minute", "min")]
+            at = now - datetime.timedelta(**{unit: int(m.group(1))})
+            return (at.year, at.month, at.day, at.hour, at.minute)
+        days = RELATIVE_WORDS.get(text.strip().lower())
+        if days is not None:
+            at = now - datetime.timedelta(days=days)
+            return (at.year, at.month, at.day)
+    return (0,)
+
+
+def rank_key(by, now=None):
+    if by == "score":
+        def key(it):
+            n = js_number(it.get("score")) if it.get("score") is not None else None
+            return (float("-inf") if n is None else n, date_key(it.get("date"), now))
+        return key
+    return lambda it: date_key(it.get("date"), now)
+
+
+class RankedItems:
+    """그룹 항목의 상위 top 건(순위순) + 넘친 항목(입력 순, 원본을 다시 순회).
+
+    heapq.nlargest 로 (키, -입력 순번) 기준 상위 top 건만 힙에 유지 — 전체 정렬 없이 O(n log top),
+    메모리 O(top). NDJSON 스풀도 그대로 감싼다(넘친 항목은 렌더 시 스풀을 한 번 더 읽는다).
+    """
+
+    def __init__(self, items, top, by, now=None):
+        self.source = items
+        self.total = len(items)
+        key = rank_key(by, now)
+        if by is None:
+            picked = list(zip(range(top or self.total), items))
+        else:
+            picked = heapq.nlargest(top or self.total, enumerate(items), key=lambda p: (key(p[1]), -p[0]))
+        self.top = [it for _, it in picked]
+        self.picked = {i for i, _ in picked}
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        return iter(self.top)
+
+    @property
+    def overflow(self):
+        return self.total - len(self.top)
+
+    def rest(self):
+        return (it for i, it in enumerate(self.source) if i not in self.picked)
+
+    def flush(self):
+        if isinstance(self.source, SpooledItems):
+            self.source.flush()
+
+    def detach(self):
+        if isinstance(self.source, SpooledItems):
+            self.source.detach()
+
+    def close(self):
+        if isinstance(self.source, SpooledItems):
+            self.source.close()
+
+
+def rank_groups(groups, warnings, now=None):
+    """설정된 region 그룹에만 정렬·상한 적용(나머지는 입력 순 그대로). 상한을 넘은 그룹은 GROUP_CAPPED 경고."""
+    rank = group_rank()
+    if not rank:
+        return groups
+    out = {}
+    for name, items in groups.items():
+        conf = rank.get(name)
+        if not conf or (not conf["top"] and conf["by"] is None):
+            out[name] = items
+            continue
+        ranked = RankedItems(items, conf["top"], conf["by"], run_time(now))
+        if ranked.overflow:
+            warnings.append(warning("GROUP_CAPPED", f"{name} {ranked.total}건 중 상위 {len(ranked.top)}건만 카드로, "
+                                                    f"나머지 {ranked.overflow}건은 목록으로"))
+        out[name] = ranked
+    return out
+
+
+def iter_more(items):
+    """넘친 기사 간단 목록 — 제목·출처·날짜만(본문 생략). 항목 단위 UTF-8 조각."""
+    yield utf8(f'              <div class="news-more"><div class="meta-line">외 {items.overflow}건</div><ol>\n')
+    for it in items.rest():
+        yield (f'<li><strong>{esc(str(it.get("title", "—")))}</strong> '
+               f'<span>{esc(str(it.get("src", "—")))} · {esc(str(it.get("date", "—")))}</span></li>\n').encode("utf-8")
+    yield utf8("</ol></div>\n")
+
+
+# 공유 템플릿 레지스트리 — apps/api/src/report-templates/registry.json 이 원본. 이미지에는
+# 빌드 컨텍스트 report-templates 로 templates/ 에, 레포 체크아웃에서는 원본을 직접 읽는다.
+DEFAULT_TEMPLATE = "ai-trend-daily"
+REGISTRY_FILE = "registry.json"
+REGISTRY_DIRS = (
+    os.path.join(BASE, "templates"),
+    os.path.join(BASE, "..", "..", "..", "apps", "api", "src", "report-templates"),
+)
+DEFAULT_LIMITS = {"tableMaxRows": 50, "chartMaxItems": 24}
+DELTA_CLASSES = ("up", "down", "steady")
+
+
+def registry_path():
+    """registry.json 위치 — REPORT_REGISTRY, 이미지 templates/, 레포 원본 순. 없으면 None."""
+    env = os.environ.get("REPORT_REGISTRY")
+    if env:
+        return env
+    for d in REGISTRY_DIRS:
+        path = os.path.join(d, REGISTRY_FILE)
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _registry_at(path, mtime_ns):
+    return json.load(open(path, encoding="utf-8"))
+
+
+def template_spec(template_id):
+    """--template ID → (템플릿 경로, 그룹 스펙). 기본 템플릿(ai-trend-daily)은 스펙 None(region 분류)."""
+    if not template_id or template_id == DEFAULT_TEMPLATE:
+        return TPL, None
+    path = registry_path()
+    if not path:
+        raise RenderError("템플릿 레지스트리(registry.json)를 찾을 수 없습니다 — REPORT_REGISTRY 로 지정하세요.")
+    try:
+        reg = _registry_at(path, os.stat(path).st_mtime_ns)
+        spec = reg["templates"].get(template_id)
+    except (OSError, ValueError, KeyError, AttributeError) as e:
+        raise RenderError(f"템플릿 레지스트리 손상: {path} ({e})") from None
+    if not isinstance(spec, dict):
+        raise RenderError(f"알 수 없는 보고서 템플릿: {template_id}")
+    spec = {**spec, "id": template_id, "limits": {**DEFAULT_LIMITS, **reg.get("limits", {})}}
+    return os.path.join(os.path.dirname(path), spec["file"]), spec
+
+
+def resolve_template(template):
+    """템플릿 지정 → (노드, 스펙). 경로(.html)·load_template 결과·레지스트리 ID 모두 허용."""
+    if isinstance(template, str) and not template.endswith(".html"):
+        path, spec = template_spec(template)
+        return template_nodes(path), spec
+    return template_nodes(template), None
+
+
+# 레지스트리 kind 렌더 — report-renderer.ts 와 같은 규칙·같은 출력(값 표기는 JS String() 기준).
+def js_str(v):
+    """JS String(v) 표기 — 정수값 float 는 소수점 없이, bool 은 소문자, None 은 ''."""
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, float):
+        return js_float(v)
+    if isinstance(v, list):
+        return ",".join(js_str(x) for x in v)
+    if isinstance(v, dict):
+        return "[object Object]"
+    return str(v)
+
+
+def js_float(v):
+    """JS Number#toString — 최단 자릿수, 지수 표기는 1e21 이상·1e-7 미만에서만(e+21 · e-7 꼴)."""
+    if v != v:
+        return "NaN"
+    if v in (float("inf"), float("-inf")):
+        return "Infinity" if v > 0 else "-Infinity"
+    if v.is_integer() and abs(v) < 2 ** 53:
+        return str(int(v))
+    r = repr(v)
+    if "e" not in r:
+        return r[:-2] if r.endswith(".0") else r
+    mantissa, exp = r.split("e")
+    exp = int(exp)
+    if -7 < exp < 21:
+        return format(decimal.Decimal(r), "f")
+    return f"{mantissa}e{'+' if exp > 0 else '-'}{abs(exp)}"
+
+
+def js_number(v):
+    """JS Number(v) — 유한 숫자면 float, 아니면 None."""
+    if v is None:
+        return 0.0
+    if isinstance(v, (bool, int, float)):
+        n = float(v)
+    else:
+        text = str(v).strip()
+        try:
+            n = float(text) if text else 0.0
+        except ValueError:
+            return None
+    return n if n == n and n not in (float("inf"), float("-inf")) else None
+
+
+def js_round1(x):
+    """Math.round(x * 10) / 10 — 동점은 +∞ 방향(파이썬 round 의 짝수 반올림과 다름)."""
+    x10 = x * 10
+    r = math.floor(x10)
+    return (r + 1 if x10 - r >= 0.5 else r) / 10
+
+
+def js_fixed1(x):
+    """Number#toFixed(1) — double 의 정확한 십진값 기준, 동점은 올림."""
+    return str(decimal.Decimal(x).quantize(decimal.Decimal("0.1"), rounding=decimal.ROUND_HALF_UP))
+
+
+def numeric_series(labels, values, cap):
+    out = []
+    for i in range(min(len(labels), len(values), cap)):
+        n = js_number(values[i])
+        if n is not None:
+            out.append((js_str(labels[i]), n))
+    return tuple(out)
+
+
+def series_bounds(values):
+    """(최솟값, 최댓값) — 한 번 순회."""
+    it = iter(values)
+    lo = hi = next(it)
+    for v in it:
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
+# 차트 SVG/HTML 은 시리즈(튜플 — 해시가 곧 키)별로 1회만 좌표를 계산한다. 같은 프로세스의
+# 재렌더·데몬 잡·배치 변형은 캐시 적중. 반환값은 불변 문자열이라 스레드 간 공유해도 안전.
+CHART_CACHE_ENTRIES = 1024
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_ENTRIES)
+def bar_chart(series, unit):
+    """가로 막대 — 최대 절댓값 대비 % track/fill (템플릿 CSS 재사용)."""
+    top = max([abs(v) for _, v in series] + [1e-9])
+    return "".join(
+        f'<div class="metric-line"><span class="name">{esc(label)}</span>'
+        f'<span class="track"><span class="fill" style="width:{js_fixed1(max(0.0, min(100.0, abs(v) / top * 100)))}%">'
+        f'</span></span><span class="score">{esc(js_str(v))}{esc(unit)}</span></div>'
+        for label, v in series)
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_ENTRIES)
+def line_chart(series, unit):
+    """라인 차트 — 순수 SVG polyline (JS·외부 자산 없음)."""
+    w, h, pad_x, pad_y = 560, 140, 8, 14
+    lo, hi = series_bounds(v for _, v in series)
+    span = hi - lo or 1
+    step = (w - pad_x * 2) / (len(series) - 1) if len(series) > 1 else 0
+    pts = [(js_str(js_round1(pad_x + step * i)), js_str(js_round1(h - pad_y - (v - lo) / span * (h - pad_y * 2))))
+           for i, (_, v) in enumerate(series)]
+    dots = "".join(f'<circle class="pt" cx="{x}" cy="{y}" r="2.6"></circle>' for x, y in pts)
+    return (f'<svg class="linechart" viewBox="0 0 {w} {h}" role="img">'
+            f'<line class="base" x1="0" y1="{h - pad_y}" x2="{w}" y2="{h - pad_y}"></line>'
+            f'<polyline points="{" ".join(f"{x},{y}" for x, y in pts)}"></polyline>{dots}'
+            f'<text x="{pad_x}" y="{h - 2}">{esc(series[0][0])}</text>'
+            f'<text x="{w - pad_x}" y="{h - 2}" text-anchor="end">{esc(series[-1][0])}</text>'
+            f'<text x="{w - pad_x}" y="10" text-anchor="end">max {esc(js_str(hi))}{esc(unit)}</text>'
+            f'</svg>')
+
+
+# KPI 추세선 — 템플릿의 X_SPARK 자리는 data 의 X_TREND(숫자 배열, 오래된→최신)로 그린다.
+SPARK_SUFFIX = "_SPARK"
+TREND_SUFFIX = "_TREND"
+SPARK_W, SPARK_H, SPARK_BASE, SPARK_TOP = 180, 42, 34, 6
+
+
+# X_TREND 가 없을 때의 장식용 추세선 — 템플릿에 있던 고정 polyline 그대로.
+SPARK_STATIC = {
+    "KPI_GLOBAL_SPARK": "0,34 25,30 50,29 75,21 100,18 125,13 150,12 180,6",
+    "KPI_DOMESTIC_SPARK": "0,29 28,25 52,26 78,21 104,19 132,15 154,14 180,11",
+    "KPI_POLICY_SPARK": "0,27 24,29 50,26 74,23 98,25 124,20 150,19 180,18",
+    "KPI_TALENT_SPARK": "0,24 25,22 50,18 75,19 100,15 126,12 151,10 180,9",
+}
+
+
+def trend_key(token):
+    """KPI_GLOBAL_SPARK → KPI_GLOBAL_TREND."""
+    return token[: -len(SPARK_SUFFIX)] + TREND_SUFFIX
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_ENTRIES)
+def sparkline(values, static=None):
+    """KPI 카드 스파크라인 — 정적 SVG(.spark CSS 재사용). 2점 미만이면 기준선만(static 은 고정 points)."""
+    poly = f'<polyline points="{static}"></polyline>' if static else ""
+    if len(values) >= 2:
+        lo, hi = series_bounds(values)
+        span, height = hi - lo, SPARK_BASE - SPARK_TOP
+        step = SPARK_W / (len(values) - 1)
+        # 평탄한 시리즈는 기준선에 붙지 않게 가운데 높이로
+        pts = " ".join(
+            f"{js_str(js_round1(step * i))},"
+            f"{js_str(js_round1(SPARK_BASE - ((v - lo) / span * height if span else height / 2)))}"
+            for i, v in enumerate(values))
+        poly = f'<polyline points="{pts}"></polyline>'
+    return (f'<svg class="spark" viewBox="0 0 {SPARK_W} {SPARK_H}" role="img">'
+            f'<line class="base" x1="0" y1="{SPARK_BASE}" x2="{SPARK_W}" y2="{SPARK_BASE}"></line>{poly}</svg>')
+
+
+def trend_values(raw):
+    """X_TREND 배열 → 숫자만(null·비숫자 제외). 배열이 아니면 None."""
+    if not isinstance(raw, list):
+        return None
+    return [n for n in (js_number(v) for v in raw if v is not None and not isinstance(v, (dict, list)))
+            if n is not None]
+
+
+def spark_fill(token, data, limits, warnings):
+    """X_SPARK 토큰 값 — X_TREND 의 숫자만 최근 chartMaxItems 개로 그린다. X_TREND 는 선택 키라
+    없으면 템플릿의 고정 추세선(MISSING_KEYS 아님)."""
+    key = trend_key(token)
+    values = trend_values(data.get(key))
+    if values is None:
+        return sparkline((), SPARK_STATIC.get(token))
+    cap = limits["chartMaxItems"]
+    if len(values) > cap:
+        warnings.append(warning("CHART_TRUNCATED", f"{key} {len(values)}개 중 최근 {cap}개만 렌더(상한 절단)"))
+        values = values[-cap:]
+    if len(values) < 2:
+        warnings.append(warning("CHART_EMPTY", f"{key} 숫자 값이 2개 미만이라 추세선 생략"))
+    return sparkline(tuple(values))
+
+
+def build_table(table, warnings, limits):
+    headers = table.get("headers") if isinstance(table.get("headers"), list) else []
+    rows = table.get("rows") if isinstance(table.get("rows"), list) else []
+    cap = limits["tableMaxRows"]
+    if len(rows) > cap:
+        warnings.append(warning("TABLE_TRUNCATED", f"표 행 {len(rows)}개 중 {cap}개만 렌더(상한 절단)"))
+        rows = rows[:cap]
+    thead = "<thead><tr>" + "".join(f"<th>{esc(js_str(h))}</th>" for h in headers) + "</tr></thead>"
+    tbody = "".join("<tr>" + "".join(f"<td>{esc(js_str(c))}</td>" for c in (r if isinstance(r, list) else [r]))
+                    + "</tr>" for r in rows)
+    return f'<div class="table-wrap"><table>{thead}<tbody>{tbody}</tbody></table></div>'
+
+
+def build_chart(chart, warnings, limits):
+    labels = chart.get("labels") if isinstance(chart.get("labels"), list) else []
+    values = chart.get("values") if isinstance(chart.get("values"), list) else []
+    series = numeric_series(labels, values, limits["chartMaxItems"])
+    if not series:
+        warnings.append(warning("CHART_EMPTY", "차트 데이터가 비었거나 숫자가 아니어서 생략"))
+        return ""
+    unit = chart.get("unit") if isinstance(chart.get("unit"), str) else ""
+    title = chart.get("title")
+    title = f'<div class="chart-title">{esc(title)}</div>' if isinstance(title, str) and title else ""
+    body = line_chart(series, unit) if chart.get("type") == "line" and len(series) >= 2 else bar_chart(series, unit)
+    return f'<div class="chart">{title}{body}</div>'
+
+
+def section_body(item, warnings, limits):
+    """섹션 본문 — LLM 은 구조화 데이터만 주고, HTML 은 전부 여기서 만든다."""
+    parts = []
+    if isinstance(item.get("paragraphs"), list):
+        parts += [f"<p>{esc(js_str(p))}</p>" for p in item["paragraphs"]]
+    if isinstance(item.get("bullets"), list) and item["bullets"]:
+        parts.append("<ul>" + "".join(f"<li>{esc(js_str(b))}</li>" for b in item["bullets"]) + "</ul>")
+    if isinstance(item.get("table"), dict):
+        parts.append(build_table(item["table"], warnings, limits))
+    if isinstance(item.get("chart"), dict):
+        parts.append(build_chart(item["chart"], warnings, limits))
+    if not parts:
+        heading = item.get("heading")
+        warnings.append(warning("EMPTY_SECTION", f'섹션 "{js_str("?" if heading is None else heading)}" 본문이 비어 있음'))
+    return "".join(parts)
+
+
+def source_link(item):
+    """출처 링크 — http(s) URL 만 anchor, 그 외 스킴은 텍스트로 강등(스킴 주입 차단)."""
+    title = esc(js_str(item.get("title") or item.get("url") or "—"))
+    url = js_str(item.get("url"))
+    if re.match(r"https?://", url, re.I):
+        return f'<a href="{esc(url)}" target="_blank" rel="noopener noreferrer">{title}</a>'
+    return title
+
+
+def item_fields(kind, item, index, warnings, limits):
+    """레지스트리 그룹 항목 1개 → {ITEM_* 토큰: 안전 HTML}."""
+    if kind == "section":
+        kicker, heading = item.get("kicker"), item.get("heading")
+        return {
+            "ITEM_KICKER": esc(js_str(f"Section {index + 1}" if kicker is None else kicker)),
+            "ITEM_HEADING": esc(js_str("—" if heading is None else heading)),
+            "ITEM_BODY": section_body(item, warnings, limits),
+        }
+    if kind == "source":
+        return {"ITEM_NUM": f"{index + 1:02d}", "ITEM_LINK": source_link(item)}
+    # flat — 스칼라 필드 전부 escape. deltaclass 류 class 주입은 whitelist.
+    out = {}
+    for k, v in item.items():
+        if v is None or isinstance(v, (dict, list)):
+            continue
+        out["ITEM_" + k.upper()] = (
+            (js_str(v) if js_str(v) in DELTA_CLASSES else "steady") if k.lower() == "deltaclass" else esc(js_str(v)))
+    return out
+
+
+class SpecItems(list):
+    """레지스트리 그룹 항목 — 원소는 item_fields 결과(안전 HTML), empty 는 빈 그룹 대체 HTML."""
+
+    def __init__(self, items=(), empty=""):
+        super().__init__(items)
+        self.empty = empty
+
+
+def spec_groups(nodes, data, spec, warnings):
+    """레지스트리 스펙 → 그룹별 SpecItems. 스펙에 없는 반복 그룹은 블록째 제거."""
+    groups = {}
+    for name, block in blocks(nodes).items():
+        gspec = spec["groups"].get(name)
+        if not gspec:
+            warnings.append(warning("UNKNOWN_GROUP", f"레지스트리에 없는 반복 그룹 {name} — 블록 제거"))
+            groups[name] = SpecItems()
+            continue
+        raw = data.get(gspec["source"])
+        items = SpecItems((), gspec.get("emptyHtml", ""))
+        for i, it in enumerate(raw if isinstance(raw, list) else []):
+            items.append(item_fields(gspec["kind"], it if isinstance(it, dict) else {}, i, warnings, spec["limits"]))
+        need = [n[1] for n in block if n[0] == "token" and n[1].startswith("ITEM_")]
+        lacking = sorted({t for f in items for t in need if t not in f})
+        if lacking:
+            warnings.append(warning("MISSING_ITEM_FIELD",
+                                    f"반복 블록 토큰 {', '.join(lacking)} 에 대응하는 항목 필드 없음(—로 채움)"))
+        groups[name] = items
+    return groups
+
+
+def prepare(nodes, data, news_path=None, now=None, timer=None, spec=None, history=None):
+    """data dict → (스칼라 값, 그룹별 항목, 그룹별 건수, 경고 목록). 계약 위반은 RenderError.
+
+    렌더 전에 필요한 값·경고를 모두 확정해 두므로, 본문은 그 뒤 스트리밍으로 내보낼 수 있다.
+    news_path 가 주어지면 기사는 data["news"] 대신 그 NDJSON 파일에서 스트리밍으로 읽는다.
+    spec(레지스트리 템플릿 스펙)이 있으면 region 분류 대신 그룹 kind 로 항목을 조립한다.
+    history(History)가 있으면 이전 실행에 렌더된 기사를 표시하거나 뺀다.
+    """
+    if not isinstance(data, dict):
+        raise RenderError("data.json 최상위는 객체여야 합니다.")
+    ks = scalar_tokens(nodes)
+    warnings = []
+    started = time.perf_counter()
+    if spec is not None:
+        groups = spec_groups(nodes, data, spec, warnings)
+        total = sum(len(g) for g in groups.values())
+    elif news_path:
+        groups, total = partition_ndjson(news_path, blocks(nodes), warnings, history)
+    else:
+        items = data.get(NEWS_SOURCE_KEY) or []
+        if not isinstance(items, list):
+            raise RenderError(f"'{NEWS_SOURCE_KEY}' 는 배열이어야 합니다.")
+        groups, total = partition(items, blocks(nodes), warnings, history)
+    if spec is None:
+        groups = rank_groups(groups, warnings, now)
+    counts = {name: len(g) for name, g in groups.items()}
+    grouped_at = time.perf_counter()
+
+    auto = computed(now)
+    values, missing = {}, []
     for k in ks:
         if k.endswith("_COUNT"):
             val = counts.get(k[: -len("_COUNT")], 0)
         elif k in auto:
             val = auto[k]
+        elif k.endswith(SPARK_SUFFIX):
+            val = spark_fill(k, data, spec["limits"] if spec else DEFAULT_LIMITS, warnings)
         else:
-            raw = str(data.get(k, "—"))
-            cap = MAX_LEN.get(k)
+            v = data.get(k)
+            # 부재·null·객체·배열은 채울 스칼라가 없다 — —로 채우고 경고(report-renderer.ts 와 같은 계약)
+            if v is None or isinstance(v, (dict, list)):
+                missing.append(k)
+                raw = "—"
+            else:
+                raw = js_str(v) if spec else str(v)
+            cap = ((spec.get("maxLen") or {}) if spec else MAX_LEN).get(k)
             if cap and len(raw) > cap:
-                print(f"경고 — {k} 가 {cap}자를 초과해 잘림({len(raw)}자)")
+                warnings.append(warning("TRUNCATED", f"{k} 가 {cap}자를 초과해 잘림({len(raw)}자)"))
                 raw = raw[: cap - 1] + "…"
-            val = esc(raw)
-        html_out = html_out.replace("{{" + k + "}}", str(val))
+            if timer:
+                t = time.perf_counter()
+                val = esc(raw)
+                timer.add("escape", time.perf_counter() - t)
+            else:
+                val = esc(raw)
+        values[k] = str(val)
+    if timer:
+        timer.add("group", grouped_at - started)
+        timer.add("scalar_fill", time.perf_counter() - grouped_at)
 
-    open(out_path, "w", encoding="utf-8").write(html_out)
-
-    grouped = sum(counts.values())
-    print(f"렌더 완료: {out_path} ({len(html_out)} bytes, 토큰 {len(ks)}개, "
-          f"기사 {grouped}건 {counts})")
-    missing = [k for k in ks if not k.endswith("_COUNT") and k not in auto and k not in data]
     if missing:
-        print("경고 — data.json 미제공 키(—로 채움): " + ", ".join(missing))
+        warnings.append(warning("MISSING_KEYS", "data.json 미제공 키(—로 채움): " + ", ".join(missing)))
     # 역방향 검사: 템플릿이 쓰지 않는 데이터는 조용히 버려진다(구 고정 슬롯 사고의 원인).
-    unused = [k for k in data if k != NEWS_SOURCE_KEY and k not in ks]
+    sources = {g["source"] for g in spec["groups"].values()} if spec else {NEWS_SOURCE_KEY}
+    used = set(ks) | {trend_key(k) for k in ks if k.endswith(SPARK_SUFFIX)}
+    unused = [k for k in data if k not in sources and k not in used]
     if unused:
-        print("경고 — 템플릿이 사용하지 않아 버려진 키: " + ", ".join(unused))
-    if grouped < len(items):
-        print(f"경고 — region 이 '국내'/'국외' 가 아니어서 누락된 기사 {len(items) - grouped}건")
+        warnings.append(warning("UNUSED_KEYS", "템플릿이 사용하지 않아 버려진 키: " + ", ".join(unused)))
+    grouped = sum(counts.values())
+    if grouped < total:
+        warnings.append(warning(
+            "UNGROUPED_ITEMS",
+            f"region·src 로 그룹을 정하지 못해 누락된 기사 {total - grouped}건"
+            f"(REPORT_REGION_FALLBACK 으로 대체 그룹 지정 가능)"))
+    return values, groups, counts, warnings
+
+
+RenderResult = namedtuple("RenderResult", ["html", "counts", "warnings"])
+
+
+@functools.lru_cache(maxsize=16)
+def _template_at(path, mtime_ns, size):
+    return load_template(path)
+
+
+def template_nodes(template):
+    """템플릿 경로 또는 이미 로드한 노드 목록 → 노드 목록. 경로는 (경로, mtime, 크기)별로 1회만
+    로드해 재사용한다 — 반환 노드는 여러 스레드가 공유하므로 읽기 전용으로 다룬다."""
+    if not isinstance(template, str):
+        return template
+    st = os.stat(template)
+    return _template_at(os.path.abspath(template), st.st_mtime_ns, st.st_size)
+
+
+def render(data, template=TPL, now=None, fragments=None):
+    """data dict → RenderResult(html, 그룹별 건수, 경고 목록). 계약 위반은 RenderError.
+
+    프로세스 안에서 쓰는 공개 API — sys.argv·stdout·작업 디렉토리 파일을 건드리지 않고 호출마다
+    상태를 새로 만들므로 여러 스레드에서 동시에 불러도 된다. template 은 경로 · load_template
+    결과 · 레지스트리 ID(예: "generic-report"), now 는 datetime · ISO8601 · @epoch 문자열
+    (생략 시 SOURCE_DATE_EPOCH·벽시계). 기본 템플릿에서 data["news"] 가 NDJSON 경로 문자열이면
+    현재 디렉토리 기준으로 스트리밍해 읽는다.
+    fragments(FragmentCache)를 넘기면 호출 간 카드 조각을 공유한다(캐시는 자체 잠금).
+    """
+    nodes, spec = resolve_template(template)
+    news_path = news_ndjson_path(data, None) if spec is None else None
+    now = parse_now(now)
+    values, groups, counts, warnings = prepare(nodes, data, news_path, now, spec=spec)
+    try:
+        html = render_html(nodes, values, groups, fragments)
+    finally:
+        close_groups(groups)
+    return RenderResult(html, counts, warnings)
+
+
+# 추가 렌더 인덱스 — report.html 옆 사이드카(<out>.idx.json). 렌더된 파일의 크기·mtime 으로
+# 짝을 검증하고, 불일치(다른 경로로 재작성됨)면 추가를 거부해 전체 재렌더를 요구한다.
+INDEX_FORMAT = 1
+
+
+def index_path(out_path):
+    return out_path + ".idx.json"
+
+
+def write_index(out_path, marks, values, nodes):
+    st = os.stat(out_path)
+    # 반복 블록 안의 스칼라 토큰 값만 — 추가 카드도 같은 값으로 채운다. RUN_DATE 는 이력 대조 기준.
+    # (SUMMARY·추세선 SVG 같은 블록 밖 값까지 담으면 인덱스가 보고서만큼 커진다.)
+    used = {n[1] for block in blocks(nodes).values() for n in block if n[0] == "token"} | {"RUN_DATE"}
+    marks.update(format=INDEX_FORMAT, size=st.st_size, mtime_ns=st.st_mtime_ns,
+                 values={k: v for k, v in values.items() if k in used and not k.endswith("_COUNT")})
+    with open(index_path(out_path), "w", encoding="utf-8") as f:
+        json.dump(marks, f, ensure_ascii=False)
+
+
+# 렌더 캐시 — 키는 렌더러 코드 + 템플릿 + 입력 데이터 + 고정 시각 전체의 해시. 시각은 날짜가 아니라
+# 초·오프셋까지 넣는다 — 상대 날짜("3시간 전") 정렬처럼 같은 날에도 시각에 따라 출력이 달라진다.
+# 벽시계 렌더(--now·SOURCE_DATE_EPOCH 없음)는 캐시하지 않는다. 같은 입력의 재시도는 캐시된 HTML 을
+# 그대로 쓰고, 대상 파일이 이미 같으면 쓰기 자체를 생략한다(mtime 이 안 바뀌어 하류 산출물 export 가
+# 다시 트리거되지 않는다). 대상 파일 교체는 write_stream 처럼 임시 파일 → rename.
+@functools.lru_cache(maxsize=1)
+def renderer_sha():
+    return hashlib.sha256(open(os.path.abspath(__file__), "rb").read()).hexdigest()
+
+
+def file_sha(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_key(nodes, data_bytes, news_path, at, spec=None):
+    """at 은 고정 시각(pinned_time) — 날짜만이 아니라 시각 전체가 키에 들어간다."""
+    h = hashlib.sha256()
+    for part in (renderer_sha(), json.dumps(nodes, ensure_ascii=False), REPORT_TZ, group_config(), at.isoformat(),
+                 json.dumps(spec, ensure_ascii=False, sort_keys=True)):
+        h.update(part.encode("utf-8") + b"\0")
+    h.update(data_bytes + b"\0")
+    if news_path:
+        h.update(file_sha(news_path).encode("ascii"))
+    return h.hexdigest()
+
+
+def cache_lookup(cache_dir, key, out_path):
+    """캐시 적중 시 대상 파일을 맞추고 결과 dict 반환(쓰기 생략 여부 포함). 미스면 None."""
+    html_path = os.path.join(cache_dir, key + ".html")
+    try:
+        meta = json.load(open(os.path.join(cache_dir, key + ".json"), encoding="utf-8"))
+        size = os.path.getsize(html_path)
+    except (OSError, ValueError):
+        return None
+    unchanged = (os.path.isfile(out_path) and os.path.getsize(out_path) == size
+                 and file_sha(out_path) == meta.get("sha256"))
+    if not unchanged:
+        tmp = f"{out_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(html_path, tmp)
+            os.replace(tmp, out_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+    meta.pop("sha256", None)
+    meta.update(out=out_path, bytes=size, cache="hit", written=not unchanged)
+    return meta
+
+
+def cache_store(cache_dir, key, out_path, result):
+    """렌더 산출물을 캐시에 원자적으로 기록(임시 파일 → rename)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = os.path.join(cache_dir, f".{key}.{os.getpid()}.tmp")
+    shutil.copyfile(out_path, tmp)
+    os.replace(tmp, os.path.join(cache_dir, key + ".html"))
+    meta = {k: result[k] for k in ("tokens", "counts", "warnings")}
+    meta["sha256"] = file_sha(out_path)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp, os.path.join(cache_dir, key + ".json"))
+
+
+# 부가 출력 — --FORMAT PATH. 모듈은 check(spec)·write(경로, 값, 그룹, 건수, data, spec) 를 제공하고,
+# 선택 의존성(reportlab·openpyxl·python-docx)이 있어 요청 때만 로드한다 — 부재는 로드 시 RenderError
+# (report_outline.require).
+EXPORT_FORMATS = {"pdf": "pdf_report", "xlsx": "xlsx_report", "docx": "docx_report", "md": "md_report"}
+EXPORT_UNITS = {"pages": "쪽", "rows": "행"}
+_EXPORT_MODEL = None  # fork 된 부가 출력 자식이 물려받는 준비 결과(피클하지 않는다)
+
+
+def export_module(fmt):
+    """부가 출력 모듈 지연 로드 — 스크립트 실행(__main__)이어도 모듈이 이 모듈 객체를 보게 한다
+    (RenderError·RankedItems 가 둘로 갈라지지 않도록)."""
+    sys.modules.setdefault("render_report", sys.modules[__name__])
+    return importlib.import_module(EXPORT_FORMATS[fmt])
+
+
+def format_outputs(formats, out_path):
+    """--formats html,docx,md → (HTML 경로 | None, {형식: 경로}). 경로는 out_path(기본 report.html)의
+    확장자만 바꾼다."""
+    names = [f.strip().lower() for f in formats.split(",") if f.strip()]
+    unknown = [f for f in names if f != "html" and f not in EXPORT_FORMATS]
+    if unknown or not names:
+        raise RenderError(f"알 수 없는 출력 형식: {', '.join(unknown) or repr(formats)} "
+                          f"(html, {', '.join(EXPORT_FORMATS)} 중에서)")
+    out_path = out_path or "report.html"
+    base = os.path.splitext(out_path)[0]
+    return out_path if "html" in names else None, {f: f"{base}.{f}" for f in names if f != "html"}
+
+
+def _run_export(fmt, path):
+    values, groups, counts, data, spec = _EXPORT_MODEL
+    for g in groups.values():
+        if isinstance(g, (SpooledItems, RankedItems)):
+            g.detach()
+    started = time.perf_counter()
+    return export_module(fmt).write(path, values, groups, counts, data, spec), time.perf_counter() - started
+
+
+def export_pool(exports, model):
+    """부가 출력마다 fork 자식 1개 — 준비 결과(model)는 fork 로 물려받으므로 한 번 파싱·준비한 것을
+    그대로 쓴다. 부모는 그동안 HTML 을 쓴다. fork·/proc 이 없는 환경이면 None(순차 실행).
+    fork 전에 스풀 버퍼를 비운다. 기사 이력(History)은 읽기·기록 때만 연결을 여므로 이때 열린 연결이 없다."""
+    global _EXPORT_MODEL
+    if not hasattr(os, "fork") or not os.path.isdir("/proc/self/fd"):
+        return None
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    for g in model[1].values():
+        if isinstance(g, (SpooledItems, RankedItems)):
+            g.flush()
+    _EXPORT_MODEL = model
+    pool = ProcessPoolExecutor(len(exports), mp_context=multiprocessing.get_context("fork"))
+    try:
+        # fork 컨텍스트는 첫 submit 에 자식을 모두 띄운다 — 그 뒤로는 모델을 놓아도 된다
+        return pool, {fmt: pool.submit(_run_export, fmt, path) for fmt, path in exports.items()}
+    finally:
+        _EXPORT_MODEL = None
+
+
+def render_file(nodes, data_path, out_path, index=False, now=None, cache_dir=None, fragments=None,
+                timer=None, spec=None, exports=None, parallel=False, history=None):
+    """data.json(경로 또는 이미 읽은 dict) → report.html(+ 부가 출력). 결과 요약 dict 반환.
+
+    index=True 면 --append 로 새 기사만 끼워 넣을 수 있게 오프셋 인덱스를 함께 기록한다.
+    cache_dir 가 있으면 같은 입력·같은 고정 시각(--now·SOURCE_DATE_EPOCH)의 재렌더를 캐시에서 반환한다
+    (인덱스 렌더·벽시계 렌더 제외).
+    fragments(FragmentCache)를 주면 바뀌지 않은 뉴스 카드는 조각 캐시에서 복사한다.
+    timer(PhaseTimer)를 주면 단계별 시간을 기록하고 결과에 입력 바이트(input_bytes)를 더한다.
+    spec 은 레지스트리 템플릿 스펙(template_spec) — 뉴스 NDJSON·추가 렌더 인덱스는 기본 템플릿 전용.
+    exports({형식: 경로}, EXPORT_FORMATS)가 있으면 같은 준비 결과로 부가 출력도 쓴다 — 결과의 형식별
+    필드, 렌더 캐시 미사용. out_path 가 None 이면 HTML 은 쓰지 않는다. parallel=True 면 출력이 둘
+    이상일 때 부가 출력을 fork 자식에서 HTML 과 동시에 쓴다(export_pool — 단계 시간은 겹친다).
+    스레드를 띄운 프로세스(데몬)에서는 fork 하지 않도록 CLI 만 켠다.
+    history(이력 sqlite 경로, 기본 템플릿 전용)가 있으면 이전 실행 기사를 표시·제외하고 성공 시 지문을 기록한다.
+    """
+    exports = exports or {}
+    if spec is not None and index:
+        raise RenderError("--index/--append 는 기본 템플릿(ai-trend-daily)에서만 지원합니다.")
+    if index and out_path is None:
+        raise RenderError("--index 는 HTML 출력이 있어야 합니다.")
+    writers = {fmt: export_module(fmt) for fmt in exports}
+    for w in writers.values():
+        w.check(spec)  # 의존성·폰트 부재·미지원 템플릿은 아무것도 쓰기 전에 실패
+    started = time.perf_counter()
+    if isinstance(data_path, dict):
+        data = data_path
+        raw = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    else:
+        raw = open(data_path, "rb").read()
+        data = json.loads(raw)
+    input_bytes = len(raw)
+    if timer:
+        timer.add("json_parse", time.perf_counter() - started)
+    news_path = news_ndjson_path(data, data_path) if spec is None else None
+    key = None
+    # 이력이 켜져 있으면 출력이 이전 실행에 따라 달라진다 — 렌더 캐시를 쓰지 않는다.
+    at = pinned_time(now)
+    if cache_dir and at and not index and not exports and not (spec is None and history):
+        key = cache_key(nodes, raw, news_path, at, spec)
+        hit = cache_lookup(cache_dir, key, out_path)
+        if hit:
+            if timer:
+                hit["input_bytes"] = input_bytes
+            return hit
+    del raw
+    with article_history(computed(now)["RUN_DATE"] if spec is None else None, history) as seen:
+        values, groups, counts, warnings = prepare(nodes, data, news_path, now, timer, spec, seen)
+        marks = {"groups": {}, "slots": {}} if index else None
+        hits, misses = (fragments.hits, fragments.misses) if fragments else (0, 0)
+        pool = None
+        if parallel and len(exports) + (out_path is not None) > 1:
+            pool = export_pool(exports, (values, groups, counts, data, spec))
+        try:
+            size = 0
+            if out_path is not None:
+                size = write_stream(iter_render(nodes, values, groups, marks, fragments, timer), out_path, timer)
+            written = {}
+            for fmt, w in writers.items():
+                if pool:
+                    written[fmt], secs = pool[1][fmt].result()
+                else:
+                    t = time.perf_counter()
+                    written[fmt] = w.write(exports[fmt], values, groups, counts, data, spec)
+                    secs = time.perf_counter() - t
+                if timer:
+                    timer.add(fmt, secs)
+        finally:
+            if pool:
+                pool[0].shutdown(cancel_futures=True)
+            close_groups(groups)
+    if index:
+        write_index(out_path, marks, values, nodes)
+    result = {"out": out_path, "bytes": size, "tokens": len(scalar_tokens(nodes)),
+              "counts": counts, "warnings": warnings}
+    if fragments:
+        result["fragments"] = {"hits": fragments.hits - hits, "misses": fragments.misses - misses}
+    result.update(written)
+    if timer:
+        result["input_bytes"] = input_bytes
+        if news_path:
+            result["input_bytes"] += os.path.getsize(news_path)
+    if key:
+        cache_store(cache_dir, key, out_path, result)
+        result.update(cache="miss", written=True)
+    return result
+
+
+def load_new_items(source, names, warnings, history=None):
+    """--append 입력 → 그룹별 새 기사. 기사 배열·{"news": [...]} 객체·NDJSON 파일 모두 허용."""
+    if isinstance(source, str) and source.endswith(".ndjson"):
+        return partition_ndjson(source, names, warnings, history)
+    items = json.load(open(source, encoding="utf-8")) if isinstance(source, str) else source
+    if isinstance(items, dict):
+        items = items.get(NEWS_SOURCE_KEY)
+    if not isinstance(items, list):
+        raise RenderError(f"추가 입력은 기사 배열 또는 {{\"{NEWS_SOURCE_KEY}\": [...]}} 이어야 합니다.")
+    return partition(items, names, warnings, history)
+
+
+def append_items(nodes, source, out_path, history=None):
+    """렌더된 report.html 에 새 기사 카드만 끼워 넣고 *_COUNT 자리를 고친다 — O(새 기사).
+
+    인덱스의 그룹 끝 오프셋에 새 카드를 삽입(빈 그룹이면 빈 안내 카드를 대체)하고,
+    수정 지점 뒤쪽 바이트만 다시 쓴다. 인덱스 오프셋은 편집량만큼 이동해 다시 기록한다.
+    history(이력 sqlite 경로)가 있으면 새 기사도 이력과 대조한다.
+    """
+    try:
+        idx = json.load(open(index_path(out_path), encoding="utf-8"))
+    except (OSError, ValueError):
+        raise RenderError(f"{index_path(out_path)} 가 없습니다 — 먼저 --index 로 전체 렌더하세요.") from None
+    st = os.stat(out_path)
+    if idx.get("format") != INDEX_FORMAT or (idx.get("size"), idx.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+        raise RenderError(f"{out_path} 가 인덱스 이후 변경됨 — --index 로 전체 재렌더가 필요합니다.")
+    warnings = []
+    block_of = blocks(nodes)
+    # 새 기사도 이력과 대조 — 리포트의 RUN_DATE 기준, 파일 편집이 끝난 뒤에만 지문을 기록한다.
+    with article_history(idx["values"].get("RUN_DATE"), history) as seen:
+        new, total = load_new_items(source, [n for n in idx["groups"] if n in block_of], warnings, seen)
+
+        edits = []  # (offset, 기존 길이, 새 바이트)
+        added = {}
+        try:
+            for name, items in new.items():
+                if not len(items):
+                    continue
+                cards = b"".join(iter_group(block_of[name], items, idx["values"]))
+                g = idx["groups"][name]
+                if g["count"]:
+                    edits.append((g["end"], 0, cards))
+                else:
+                    edits.append((g["start"], g["end"] - g["start"], cards))
+                added[name] = len(items)
+        finally:
+            close_groups(new)
+        for name, n in added.items():
+            count = str(idx["groups"][name]["count"] + n).encode("utf-8")
+            for off, length in idx["slots"].get(name + "_COUNT", []):
+                edits.append((off, length, count))
+        if total > sum(added.values()):
+            warnings.append(warning(
+                "UNGROUPED_ITEMS",
+                f"region·src 로 그룹을 정하지 못해 누락된 기사 {total - sum(added.values())}건"
+                f"(REPORT_REGION_FALLBACK 으로 대체 그룹 지정 가능)"))
+        if not edits:
+            return {"out": out_path, "bytes": st.st_size, "added": added, "warnings": warnings}
+
+        edits.sort(key=lambda e: e[0])
+        first = edits[0][0]
+        with open(out_path, "r+b") as f:
+            f.seek(first)
+            tail = f.read()
+            parts, pos = [], first
+            for off, length, data in edits:
+                parts.append(tail[pos - first:off - first])
+                parts.append(data)
+                pos = off + length
+            parts.append(tail[pos - first:])
+            f.seek(first)
+            f.writelines(parts)
+            f.truncate()
+
+    # 편집이 끝난 지점 이후의 오프셋만 편집량만큼 이동 — 그룹 끝 삽입은 그 그룹의 end 를 민다.
+    def shift(p):
+        return p + sum(len(d) - ln for off, ln, d in edits if off + ln <= p)
+
+    for name, g in idx["groups"].items():
+        g["start"], g["end"] = shift(g["start"]), shift(g["end"])
+        g["count"] += added.get(name, 0)
+    for name, slots in idx["slots"].items():
+        group = idx["groups"].get(name[: -len("_COUNT")])
+        for slot in slots:
+            slot[0] = shift(slot[0])
+            if group is not None and name[: -len("_COUNT")] in added:
+                slot[1] = len(str(group["count"]).encode("utf-8"))
+    st = os.stat(out_path)
+    idx.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+    with open(index_path(out_path), "w", encoding="utf-8") as f:
+        json.dump(idx, f, ensure_ascii=False)
+    return {"out": out_path, "bytes": st.st_size, "added": added, "warnings": warnings}
+
+
+# 잡 필드 타입 — 잘못된 타입이 렌더 깊숙이(write_stream·scalar_tokens)에서 TypeError 로 터지기 전에 거른다.
+JOB_FIELD_TYPES = {"data": (str, dict), "out": (str,), "template": (str,), "append": (str, list),
+                   "cache_dir": (str,), "profile": (str,), "history": (str,)}
+
+
+def check_job(job):
+    """잡 형식 검사 — 위반은 RenderError(해당 잡만 ok=false)."""
+    if not isinstance(job, dict):
+        raise RenderError("잡은 JSON 객체여야 합니다.")
+    for key, types in JOB_FIELD_TYPES.items():
+        if job.get(key) is not None and not isinstance(job[key], types):
+            names = "·".join({"str": "문자열", "dict": "객체", "list": "배열"}[t.__name__] for t in types)
+            raise RenderError(f"잡 필드 '{key}' 의 타입이 잘못됐습니다(허용: {names}).")
+
+
+def serve_job(nodes, job, defaults=None, fragments=None):
+    """데몬 잡 1건 — {"id", "data": 경로|객체, "out", "template", "index", "now", "cache_dir", "stats",
+    "profile", "profile_sample", "history"} 또는 {"id", "append": 경로|기사 배열, "out", "history"} → 구조화
+    결과(예외도 응답으로). defaults 는 데몬·배치 기동 옵션(--template·--now·--cache-dir·--stats-json·--profile,
+    REPORT_HISTORY) — 잡 필드가 우선한다.
+    "stats" 가 참이면 결과에 단계별 시간(phases_ms·groups_ms)과 input_bytes 를 더한다.
+    "profile" 디렉토리가 있으면 profile_sample(기본 1) 비율로 뽑힌 잡만 프로파일해 요약 경로를 더한다.
+    예기치 못한 예외도 그 잡의 ok=false 응답으로 끝낸다 — 잡 하나가 데몬과 뒤에 쌓인 잡을 죽이지 않게."""
+    started = time.perf_counter()
+    job_id = job.get("id") if isinstance(job, dict) else None
+    if isinstance(job, dict) and defaults:
+        job = {**defaults, **job}
+    try:
+        check_job(job)
+        spec = None
+        if job.get("template"):
+            nodes, spec = resolve_template(job["template"])
+        if "append" in job:
+            if spec is not None:
+                raise RenderError("--index/--append 는 기본 템플릿(ai-trend-daily)에서만 지원합니다.")
+            result = append_items(nodes, job["append"], job.get("out") or "report.html", job.get("history"))
+        elif "data" not in job:
+            raise RenderError("잡은 {\"data\": 경로|객체, \"out\": 경로} 형식이어야 합니다.")
+        else:
+            out = job.get("out") or "report.html"
+            profiled = job.get("profile") and random.random() < float(job.get("profile_sample", 1))
+            timer = (Profiler(job["profile"], f"{job_id if job_id is not None else 'job'}-{os.getpid()}-"
+                                              f"{time.time_ns()}") if profiled
+                     else PhaseTimer() if job.get("stats") else None)
+            with timer if profiled else contextlib.nullcontext():
+                result = render_file(nodes, job["data"], out, bool(job.get("index")),
+                                     parse_now(job.get("now")), job.get("cache_dir"), fragments, timer, spec,
+                                     history=job.get("history"))
+            if profiled:
+                result["profile"] = timer.path
+            if timer and job.get("stats"):
+                result.update(timer.as_dict())
+        result.update(id=job_id, ok=True)
+    except (RenderError, OSError, ValueError) as e:
+        result = {"id": job_id, "ok": False, "error": str(e)}
+    except Exception as e:
+        print(traceback.format_exc(limit=-3), file=sys.stderr)
+        result = {"id": job_id, "ok": False, "error": f"{type(e).__name__}: {e}"[:500]}
+    result["ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def serve_lines(nodes, lines, write, defaults=None, fragments=None):
+    """JSON-lines 잡 스트림 처리 — 한 줄 입력당 한 줄 결과."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            result = {"id": None, "ok": False, "error": f"잘못된 JSON: {e}"}
+        else:
+            result = serve_job(nodes, job, defaults, fragments)
+        write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def serve(nodes, socket_path=None, defaults=None, fragments=None):
+    """상주 렌더 데몬 — 컴파일된 템플릿·타임존·카드 조각 캐시를 메모리에 유지하고 잡을 반복 처리.
+
+    컨테이너가 task 수명 내내 살아 있으므로, docker exec 마다 인터프리터 기동·import·
+    템플릿 로드를 반복하지 않게 한다. socket_path 가 없으면 stdin/stdout JSON-lines.
+    조각 캐시는 종료 시 디스크에 저장한다(경로가 있을 때).
+    """
+    report_tz()
+    fragments = fragments if fragments is not None else FragmentCache()
+    try:
+        _serve(nodes, socket_path, defaults, fragments)
+    finally:
+        fragments.save()
+
+
+def _serve(nodes, socket_path, defaults, fragments):
+    if not socket_path:
+        serve_lines(nodes, sys.stdin, lambda s: (sys.stdout.write(s), sys.stdout.flush()), defaults, fragments)
+        return
+    import signal, socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            lines = (raw.decode("utf-8") for raw in self.rfile)
+            serve_lines(nodes, lines, lambda s: (self.wfile.write(s.encode("utf-8")), self.wfile.flush()),
+                        defaults, fragments)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    # docker stop/kill(SIGTERM)에도 finally 가 돌아 소켓 파일을 치우도록 정상 종료로 변환.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+        print(f"렌더 데몬 대기: {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def cpu_limit():
+    """컨테이너 --cpus 한도(cgroup v2 cpu.max) → 정수 코어 수. 한도 없으면 가용 CPU 수."""
+    try:
+        quota, period = open("/sys/fs/cgroup/cpu.max").read().split()[:2]
+        if quota != "max":
+            return max(1, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def batch_jobs(spec):
+    """--batch 인자 → 잡 목록. manifest(.json 파일) 또는 data 파일 glob.
+
+    manifest: [{"data": 경로, "out": 경로}, ...] 또는 data 경로 문자열 배열.
+    out 생략 시 data.json → 같은 디렉토리의 report.html, 그 외 x.json → x.html.
+    """
+    if spec.endswith(".json") and os.path.isfile(spec):
+        entries = json.load(open(spec, encoding="utf-8"))
+        if not isinstance(entries, list):
+            raise RenderError("batch manifest 는 배열이어야 합니다.")
+        base = os.path.dirname(os.path.abspath(spec))
+    else:
+        entries, base = sorted(glob.glob(spec)), os.getcwd()
+    jobs = []
+    for e in entries:
+        job = {"data": e} if isinstance(e, str) else dict(e) if isinstance(e, dict) else {}
+        data = job.get("data")
+        if isinstance(data, str):
+            data = job["data"] = os.path.join(base, data)
+            if not job.get("out"):
+                job["out"] = (os.path.join(os.path.dirname(data), "report.html")
+                              if os.path.basename(data) == "data.json" else os.path.splitext(data)[0] + ".html")
+        if isinstance(job.get("out"), str):
+            job["out"] = os.path.join(base, job["out"])
+        job.setdefault("id", data if isinstance(data, str) else len(jobs))
+        jobs.append(job)
+    return jobs
+
+
+# 배치 워커 프로세스의 컴파일된 템플릿·조각 캐시 — initializer 로 1회 주입(잡마다 피클링하지 않음).
+_worker_nodes = None
+_worker_fragments = None
+
+
+def _init_batch_worker(nodes, fragment_path):
+    global _worker_nodes, _worker_fragments
+    _worker_nodes = nodes
+    # 워커별 메모리 캐시 — 디스크 캐시는 읽기만(여러 프로세스가 같은 파일에 쓰지 않도록).
+    _worker_fragments = FragmentCache(fragment_path)
+    _worker_fragments.path = None
+
+
+def _run_batch_job(job):
+    return serve_job(_worker_nodes, job, fragments=_worker_fragments)
+
+
+def run_batch(nodes, jobs, workers, fragment_path=None):
+    """잡 목록을 프로세스 풀로 분산 렌더 — 결과는 잡 순서대로."""
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        fragments = FragmentCache(fragment_path)
+        try:
+            return [serve_job(nodes, j, fragments=fragments) for j in jobs]
+        finally:
+            fragments.save()
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers, initializer=_init_batch_worker, initargs=(nodes, fragment_path)) as pool:
+        return list(pool.map(_run_batch_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+# 값을 받는 플래그 — 위치 인자(data.json report.html) 판별 시 그 값까지 건너뛴다.
+VALUE_FLAGS = {"--socket", "--batch", "--jobs", "--append", "--now", "--cache-dir", "--fragment-cache",
+               "--stats-json", "--profile", "--profile-sample", "--template", "--formats"} | {"--" + f for f in EXPORT_FORMATS}
+
+
+def positional_args(argv=None):
+    """플래그와 그 값을 뺀 위치 인자."""
+    return cli_args.positional_args(argv, VALUE_FLAGS)
+
+
+# --stats-json 문서 포맷 버전 — 필드 의미가 바뀌면 올린다(스케줄 러너 차트가 이 값으로 분기).
+STATS_FORMAT = 1
+
+
+def write_stats(path, doc):
+    """통계 문서 기록 — path 가 '-' 면 stdout(이때 사람용 출력은 stderr 로 간다)."""
+    text = json.dumps({"format": STATS_FORMAT, **doc}, ensure_ascii=False)
+    if path == "-":
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+
+
+def main(argv=None):
+    """CLI — render()·render_file() 위의 얇은 래퍼. argv 생략 시 sys.argv[1:]."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if "--compile" in argv:
+        # 기본: 내장 템플릿 + 레지스트리 템플릿(이미지 templates/)
+        bundled = [TPL] + sorted(glob.glob(os.path.join(BASE, "templates", "*.html")))
+        for path in [a for a in argv if a != "--compile"] or bundled:
+            print(f"컴파일 완료: {write_template_ast(path)}")
+        return
+
+    started = time.perf_counter()
+    stats_path = arg_value("--stats-json", argv)
+    profile_dir = arg_value("--profile", argv)
+    timer = PhaseTimer() if stats_path or profile_dir else None
+    # 통계를 stdout 으로 내보낼 때는 사람용 요약을 stderr 로 돌려 JSON 과 섞이지 않게 한다.
+    say = functools.partial(print, file=sys.stderr) if stats_path == "-" else print
+    template_id = arg_value("--template", argv)
+    try:
+        tpl_path, spec = template_spec(template_id)
+        nodes = load_template(tpl_path, timer)
+    except (RenderError, OSError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    ks = scalar_tokens(nodes)
+    if "--keys" in argv and spec is not None:
+        print("\n".join(data_keys(ks)))
+        for name, g in spec["groups"].items():
+            print(f"\n[{g['source']}] 배열 ({g['kind']}) — 반복 그룹 {name}")
+        return
+    if "--keys" in argv:
+        print("\n".join(data_keys(ks)))
+        if any(k.endswith(SPARK_SUFFIX) for k in ks):
+            print(f"\n[*{TREND_SUFFIX}] 숫자 배열(오래된→최신, 최근 {DEFAULT_LIMITS['chartMaxItems']}개까지) "
+                  f"— KPI 카드 추세선(선택: 없으면 고정 장식선)")
+        print(f"\n[{NEWS_SOURCE_KEY}] 배열 — 조사한 기사를 건수 제한 없이 모두 담는다. "
+              f"항목 필드: region(국내|국외 — Korea·global 등 별칭도 인식) · src · date · title · desc "
+              f"(수천 건이면 data.json 옆 {NEWS_NDJSON} 에 한 줄 1기사로)")
+        return
+    # 렌더 공통 옵션 — 데몬·배치에서는 잡별 기본값이 된다.
+    cache_dir = arg_value("--cache-dir", argv) or os.environ.get("REPORT_CACHE_DIR")
+    defaults = {k: v for k, v in (("template", template_id),
+                                  ("now", arg_value("--now", argv)),
+                                  ("cache_dir", cache_dir),
+                                  ("stats", bool(stats_path)),
+                                  ("profile", profile_dir),
+                                  ("profile_sample", arg_value("--profile-sample", argv)),
+                                  ("history", history_path()))
+                if v}
+    fragment_path = arg_value("--fragment-cache", argv) or os.environ.get("REPORT_FRAGMENT_CACHE")
+    if "--serve" in argv:
+        serve(nodes, arg_value("--socket", argv), defaults, FragmentCache(fragment_path))
+        return
+    if "--batch" in argv:
+        try:
+            jobs = batch_jobs(arg_value("--batch", argv) or "")
+        except (RenderError, OSError, ValueError) as e:
+            print(f"오류: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not jobs:
+            print("오류: --batch 대상 data 파일이 없습니다.", file=sys.stderr)
+            sys.exit(1)
+        workers = int(arg_value("--jobs", argv) or cpu_limit())
+        results = run_batch(nodes, [{**defaults, **j} for j in jobs], workers, fragment_path)
+        failed = [r for r in results if not r["ok"]]
+        for r in results:
+            if r["ok"]:
+                say(f"✓ {r['out']} ({r['bytes']} bytes, 기사 {sum(r['counts'].values())}건, "
+                    f"경고 {len(r['warnings'])}건, {r['ms']}ms)")
+                for w in r["warnings"]:
+                    say("  경고 — " + w["message"])
+            else:
+                say(f"✗ {r['id']}: {r['error']}")
+        workers = max(1, min(workers, len(jobs)))
+        say(f"배치 완료: {len(results) - len(failed)}/{len(results)}건 성공, "
+            f"워커 {workers}개, {time.perf_counter() - started:.2f}s")
+        if stats_path:
+            write_stats(stats_path, {"ok": not failed, "workers": workers, **timer.as_dict(),
+                                     "total_ms": round((time.perf_counter() - started) * 1000, 3),
+                                     "jobs": results})
+        if failed:
+            sys.exit(1)
+        return
+
+    args = positional_args(argv)
+    if "--append" in argv:
+        out_path = args[0] if args else "report.html"
+        try:
+            if spec is not None:
+                raise RenderError("--index/--append 는 기본 템플릿(ai-trend-daily)에서만 지원합니다.")
+            r = append_items(nodes, arg_value("--append", argv), out_path, defaults.get("history"))
+        except (RenderError, OSError, ValueError) as e:
+            print(f"오류: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"추가 완료: {out_path} ({r['bytes']} bytes, 추가 기사 {sum(r['added'].values())}건 {r['added']})")
+        for w in r["warnings"]:
+            print("경고 — " + w["message"])
+        return
+
+    data_path = args[0] if args else "data.json"
+    exports = {f: arg_value("--" + f, argv) for f in EXPORT_FORMATS if arg_value("--" + f, argv)}
+    # 부가 출력만 요청(위치 인자 1개)이면 HTML 은 쓰지 않는다
+    out_path = args[1] if len(args) > 1 else (None if exports else "report.html")
+    if arg_value("--formats", argv):
+        try:
+            out_path, listed = format_outputs(arg_value("--formats", argv), args[1] if len(args) > 1 else None)
+        except RenderError as e:
+            print(f"오류: {e}", file=sys.stderr)
+            sys.exit(1)
+        exports = {**listed, **exports}  # --FORMAT PATH 가 있으면 그 경로가 우선
+    fragments = FragmentCache(fragment_path) if fragment_path else None
+    if profile_dir:
+        profiler = Profiler(profile_dir, os.path.splitext(os.path.basename(out_path or data_path))[0])
+        profiler.phases.update(timer.phases)  # 템플릿 로드는 프로파일 밖에서 이미 끝났다
+        timer = profiler
+    try:
+        with timer if profile_dir else contextlib.nullcontext():
+            r = render_file(nodes, data_path, out_path, "--index" in argv,
+                            parse_now(defaults.get("now")), defaults.get("cache_dir"), fragments, timer, spec,
+                            exports, parallel=True, history=defaults.get("history"))
+    except (RenderError, OSError, ValueError) as e:
+        if stats_path:
+            write_stats(stats_path, {"ok": False, "error": str(e)})
+        print(f"오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    if fragments:
+        fragments.save()
+    if profile_dir:
+        r["profile"] = timer.path
+    if stats_path:
+        write_stats(stats_path, {"ok": True, **r, **timer.as_dict(),
+                                 "total_ms": round((time.perf_counter() - started) * 1000, 3)})
+
+    cached = {"hit": " · 캐시 적중", "miss": " · 캐시 저장"}.get(r.get("cache"), "")
+    if not r.get("written", True):
+        cached += "(동일 파일 — 쓰기 생략)"
+    if cache_dir and "cache" not in r and not pinned_time(parse_now(defaults.get("now"))):
+        cached = " · 캐시 미사용(벽시계 — --now 또는 SOURCE_DATE_EPOCH 로 시각 고정)"
+    if out_path is not None:
+        say(f"렌더 완료: {out_path} ({r['bytes']} bytes, 토큰 {r['tokens']}개, "
+            f"{'항목' if spec else '기사'} {sum(r['counts'].values())}건 {r['counts']}{cached})")
+    else:
+        say(f"준비 완료: {'항목' if spec else '기사'} {sum(r['counts'].values())}건 {r['counts']}")
+    for fmt in exports:
+        e = r[fmt]
+        extra = "".join(f", {v}{EXPORT_UNITS[k]}" for k, v in e.items() if k in EXPORT_UNITS)
+        say(f"{fmt.upper()} 완료: {e['out']} ({e['bytes']} bytes{extra})")
+    for w in r["warnings"]:
+        say("경고 — " + w["message"])
+    if profile_dir:
+        say(f"프로파일: {r['profile']}")
 
 
 if __name__ == "__main__":
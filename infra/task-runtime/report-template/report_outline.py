@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+부가 출력 writer 공용 — 문서형 출력(docx_report·md_report)의 보고서 개요와 선택 의존성 확인(require).
+
+개요는 prepare 결과를 블록 순서열로 편다.
+
+블록(튜플, 텍스트는 HTML 이스케이프를 푼 평문):
+  ("title", 글)  ("meta", 글)  ("heading", 단계, 글)  ("para", 글)  ("strong", 글)
+  ("bullets", 글 반복자)  ("table", 머리글, 행 반복자)  ("item", 제목, 메타, 본문)
+개요는 생성기다 — 뉴스 그룹(NDJSON 스풀)·넘친 기사 목록도 한 건씩 흘려보내므로 writer 가 스트리밍으로
+쓰면 메모리가 기사 수와 무관하다. 기본 템플릿은 HTML 과 같은 라벨(render_report.KPI_LABELS 등),
+레지스트리 템플릿은 data 의 원 배열을 docx-script.ts(API 의 docx 변환)와 같은 순서·문구로 편다.
+"""
+import html, importlib.util
+
+import render_report as rr
+
+EMPTY_NEWS = "해당 지역의 신규 기사를 확보하지 못했습니다."
+CAPTIONS = {"deltaclass"}  # flat 항목 중 표에 싣지 않는 키(CSS 클래스)
+# 열이 고정된 flat 그룹(원 배열 키 → 열 키) — API docx 변환이 예전부터 쓰던 KPI 표 열(Label·Value·Note·Delta).
+# 그 외 flat 그룹은 항목 스칼라 키가 처음 나온 순서대로 열.
+FLAT_COLUMNS = {"kpis": ("label", "value", "note", "delta")}
+
+
+def require(package, *modules):
+    """writer 모듈 첫머리에서 부른다 — 선택 의존성(modules)이 없으면 RenderError. task-runtime 이미지
+    (/opt/pyenv)에는 모두 있고 로컬 개발 환경에서만 빠진다. render_file 은 부가 출력 모듈을 아무것도
+    쓰기 전에 불러오므로 부재가 그때 드러난다."""
+    missing = [m for m in modules if importlib.util.find_spec(m) is None]
+    if missing:
+        raise rr.RenderError(f"{package} 미설치({', '.join(missing)}) — task-runtime 이미지(/opt/pyenv)에서 "
+                             f"실행하거나 설치하세요.")
+
+
+def field(it, key):
+    v = it.get(key)
+    return "—" if v is None else str(v)
+
+
+def default_outline(values, groups, counts):
+    v = lambda k: html.unescape(values.get(k, "—"))
+    yield ("meta", "AI Trend Daily Intelligence · 07:00 KST")
+    yield ("title", "국내 vs 국외 AI 트렌드 분석")
+    yield ("para", v("DECKLINE"))
+    yield ("meta", f'{v("RUN_DATE")} · 07:00 KST · {v("SOURCE_STATUS")} · {v("HEADLINE_TAG")}')
+    yield ("heading", 1, "요약")
+    yield ("para", v("SUMMARY"))
+    yield ("heading", 1, "핵심 지표")
+    yield ("table", ("지표", "값", "메모", "변화"),
+           [(label, v(f"{key}_VALUE"), v(f"{key}_NOTE"), v(f"{key}_DELTA")) for key, label in rr.KPI_LABELS])
+    yield ("heading", 1, "국내 vs 국외 비교 · 0-100")
+    yield ("table", ("축", "관측 신호", "국내", "국외", "해석"),
+           [(label, signal, v(f"CMP_DOM_{axis}"), v(f"CMP_GLO_{axis}"), v(note))
+            for axis, label, _, signal, note in rr.CMP_AXES])
+    for name, items in groups.items():
+        title, _ = rr.NEWS_LABELS.get(name, (name, ""))
+        yield ("heading", 1, f"{title} · {counts.get(name, 0)}건")
+        empty = True
+        for it in items:
+            empty = False
+            yield ("item", field(it, "title"), f'{field(it, "src")} · {field(it, "date")}', field(it, "desc"))
+        if empty:
+            yield ("para", EMPTY_NEWS)
+        if isinstance(items, rr.RankedItems) and items.overflow:
+            yield ("strong", f"외 {items.overflow}건")
+            yield ("bullets", (f'{field(it, "title")} — {field(it, "src")} · {field(it, "date")}'
+                               for it in items.rest()))
+    yield ("heading", 1, "3관점 렌즈")
+    for key, role, sub in rr.LENS_LABELS:
+        yield ("heading", 2, f"{role} · {sub}")
+        yield ("strong", v(f"LENS_{key}_TAKE"))
+        yield ("bullets", [v(f"LENS_{key}_{s}") for s in ("S1", "S2", "S3")])
+        yield ("para", f'오늘의 액션: {v(f"LENS_{key}_ACTION")}')
+    yield ("heading", 1, "향후 전략 · 타임 호라이즌")
+    for key, label in rr.HORIZON_LABELS:
+        yield ("heading", 2, label)
+        yield ("strong", v(f"STRAT_{key}_TITLE"))
+        yield ("para", v(f"STRAT_{key}_DESC"))
+
+
+def dicts(raw):
+    return [it for it in raw if isinstance(it, dict)] if isinstance(raw, list) else []
+
+
+def flat_table(items, keys=None):
+    if keys is None:
+        keys = [k for k in dict.fromkeys(k for it in items for k, v in it.items() if not isinstance(v, (dict, list)))
+                if k.lower() not in CAPTIONS]
+    return ("table", [k.capitalize() for k in keys],
+            [[rr.js_str(it.get(k)) for k in keys] for it in items])
+
+
+def section_blocks(sec):
+    yield ("heading", 1, rr.js_str(sec.get("heading")))
+    for p in sec.get("paragraphs") if isinstance(sec.get("paragraphs"), list) else []:
+        yield ("para", rr.js_str(p))
+    bullets = sec.get("bullets") if isinstance(sec.get("bullets"), list) else []
+    if bullets:
+        yield ("bullets", [rr.js_str(b) for b in bullets])
+    table = sec.get("table")
+    if isinstance(table, dict):
+        headers = table.get("headers") if isinstance(table.get("headers"), list) else []
+        rows = table.get("rows") if isinstance(table.get("rows"), list) else []
+        yield ("table", [rr.js_str(h) for h in headers],
+               ([rr.js_str(c) for c in (r if isinstance(r, list) else [r])] for r in rows))
+    chart = sec.get("chart")
+    labels = chart.get("labels") if isinstance(chart, dict) and isinstance(chart.get("labels"), list) else []
+    if labels:
+        values = chart.get("values") if isinstance(chart.get("values"), list) else []
+        unit = rr.js_str(chart.get("unit"))
+        line = ", ".join(f"{rr.js_str(l)}={rr.js_str(v)}{unit}" for l, v in zip(labels, values))
+        yield ("para", (f'{rr.js_str(chart["title"])}: ' if chart.get("title") else "") + line)
+
+
+def spec_outline(values, data, spec):
+    """레지스트리 템플릿 — 제목·요약은 data 스칼라, 그룹은 스펙 순서대로 kind 별 블록."""
+    s = lambda k: rr.js_str(data.get(k))
+    yield ("title", s("REPORT_TITLE") or "Report")
+    if data.get("SUBTITLE"):
+        yield ("para", s("SUBTITLE"))
+    run_date = html.unescape(values["RUN_DATE"]) if "RUN_DATE" in values else s("RUN_DATE")
+    meta = " - ".join(t for t in (s("KICKER"), run_date, s("TOPLINE")) if t)
+    if meta:
+        yield ("para", meta)
+    if data.get("SUMMARY"):
+        yield ("heading", 1, "Executive Summary")
+        yield ("para", s("SUMMARY"))
+    for gspec in spec["groups"].values():
+        items = dicts(data.get(gspec["source"]))
+        if not items:
+            continue
+        if gspec["kind"] == "section":
+            for sec in items:
+                yield from section_blocks(sec)
+        elif gspec["kind"] == "source":
+            yield ("heading", 1, "Sources")
+            for i, src in enumerate(items, 1):
+                yield ("para", f'{i}. {rr.js_str(src.get("title"))} - {rr.js_str(src.get("url"))}')
+        else:
+            yield flat_table(items, FLAT_COLUMNS.get(gspec["source"]))
+
+
+def outline(values, groups, counts, data, spec=None):
+    """prepare 결과 → 블록 생성기. 그룹은 읽기만 한다(닫지 않음)."""
+    if spec is None:
+        return default_outline(values, groups, counts)
+    return spec_outline(values, data, spec)
@@ -0,0 +1,23 @@
+"""render_report 테스트 공통 — 모듈 디렉토리를 import 경로에, 렌더 동작을 바꾸는 환경변수는 비운다."""
+import json, os, sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+NOW = "2026-10-17T07:00:00+09:00"
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for k in list(os.environ):
+        if k.startswith("REPORT_") or k == "SOURCE_DATE_EPOCH":
+            monkeypatch.delenv(k)
+
+
+def article(title, date="2026-10-16", region="국외", src="Src", **extra):
+    return {"region": region, "src": src, "date": date, "title": title, "desc": f"{title} 요약", **extra}
+
+
+def write_ndjson(path, items, extra=b""):
+    path.write_bytes(b"".join(json.dumps(it, ensure_ascii=False).encode("utf-8") + b"\n" for it in items) + extra)
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+NODES = rr.load_template(rr.TPL)
+
+
+def test_render_matches_render_file(tmp_path):
+    data = {"SUMMARY": "요약 <b>", "news": [article("국외 기사"), article("국내 기사", region="korea")]}
+    r = rr.render_file(NODES, data, str(tmp_path / "o.html"), now=rr.parse_now(NOW))
+    result = rr.render(data, now=NOW)
+    assert (tmp_path / "o.html").read_text(encoding="utf-8") == result.html
+    assert result.counts == r["counts"] == {"NEWS_DOMESTIC": 1, "NEWS_GLOBAL": 1}
+    assert "요약 &lt;b&gt;" in result.html
+
+
+def test_render_has_no_process_side_effects(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rr.render({"news": [article("x")]}, rr.TPL, now=NOW)
+    assert os.listdir(tmp_path) == []
+
+
+def test_render_accepts_now_forms(monkeypatch):
+    data = {"news": []}
+    expected = rr.render(data, now="2026-10-17T07:00:00+09:00").html
+    assert rr.render(data, now=rr.parse_now(NOW)).html == expected
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", str(int(rr.parse_now(NOW).timestamp())))
+    assert rr.render(data).html == expected
+
+
+def test_render_contract_errors():
+    with pytest.raises(rr.RenderError):
+        rr.render({"news": []}, "no-such-report", now=NOW)
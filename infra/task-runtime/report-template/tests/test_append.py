@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article, write_ndjson
+
+NODES = rr.load_template(rr.TPL)
+ITEMS = [article("국외 기사 1"), article("국내 기사 1", region="국내"), article("국외 기사 2", src="a.com")]
+MORE = [article("국내 기사 2", region="한국"), article("국외 기사 3", region="global")]
+
+
+def html(data):
+    return rr.render(data, now=NOW).html
+
+
+def render(tmp_path, data, **kw):
+    rr.render_file(NODES, data, str(tmp_path / "report.html"), now=rr.parse_now(NOW), **kw)
+    return tmp_path / "report.html"
+
+
+def test_append_matches_full_render(tmp_path):
+    out = render(tmp_path, {"SUMMARY": "요약", "news": ITEMS}, index=True)
+    assert os.path.isfile(rr.index_path(str(out)))
+    added = rr.append_items(NODES, MORE, str(out))
+    assert added["added"] == {"NEWS_DOMESTIC": 1, "NEWS_GLOBAL": 1}
+    assert out.read_text(encoding="utf-8") == html({"SUMMARY": "요약", "news": ITEMS + MORE})
+    # 인덱스 오프셋이 편집량만큼 옮겨져 두 번째 추가도 전체 렌더와 같다
+    last = article("국내 기사 3", region="domestic")
+    write_ndjson(tmp_path / "more.ndjson", [last])
+    rr.append_items(NODES, str(tmp_path / "more.ndjson"), str(out))
+    assert out.read_text(encoding="utf-8") == html({"SUMMARY": "요약", "news": ITEMS + MORE + [last]})
+
+
+def test_append_into_empty_group(tmp_path):
+    out = render(tmp_path, {"news": [article("국외만")]}, index=True)
+    rr.append_items(NODES, {"news": [article("국내 첫 기사", region="kr")]}, str(out))
+    assert out.read_text(encoding="utf-8") == html({"news": [article("국외만"), article("국내 첫 기사", region="kr")]})
+
+
+def test_append_refuses_changed_report(tmp_path):
+    out = render(tmp_path, {"news": ITEMS}, index=True)
+    with open(out, "ab") as f:
+        f.write(b"\n")
+    with pytest.raises(rr.RenderError, match="인덱스 이후 변경됨"):
+        rr.append_items(NODES, MORE, str(out))
+
+
+def test_append_requires_index(tmp_path):
+    out = render(tmp_path, {"news": ITEMS})
+    with pytest.raises(rr.RenderError, match="--index"):
+        rr.append_items(NODES, MORE, str(out))
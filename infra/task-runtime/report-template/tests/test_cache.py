@@ -0,0 +1,101 @@
+import os, shutil
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+
+def test_fragment_cache_lru_eviction():
+    cache = rr.FragmentCache(max_entries=2)
+    cache.put("a", b"A")
+    cache.put("b", b"B")
+    assert cache.get("a") == b"A"  # a 가 최근 사용 → b 가 가장 오래됨
+    cache.put("c", b"C")
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (b"A", b"C")
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_fragment_cache_save_keeps_recent_within_bytes(tmp_path):
+    path = str(tmp_path / "frag.jsonl")
+    cache = rr.FragmentCache(path, max_bytes=120)
+    for i in range(5):
+        cache.put((f"block{i}", ("f",)), f"<div>{i}</div>".encode("utf-8"))
+    cache.save()
+    loaded = rr.FragmentCache(path)
+    kept = [k[0] for k in loaded.entries]
+    assert kept and kept == [f"block{i}" for i in range(5 - len(kept), 5)]
+    assert loaded.get((kept[-1], ("f",))) == f"<div>{kept[-1][-1]}</div>".encode("utf-8")
+
+
+def test_fragment_cache_reuses_cards(tmp_path):
+    data = {"news": [article(f"기사 {i}") for i in range(3)]}
+    frags = rr.FragmentCache()
+    first = rr.render(data, now=NOW, fragments=frags).html
+    assert (frags.hits, frags.misses) == (0, 3)
+    assert rr.render(data, now=NOW, fragments=frags).html == first
+    assert frags.hits == 3
+
+
+NODES = rr.load_template(rr.TPL)
+
+
+def cached_render(tmp_path, data, now=NOW, **kw):
+    return rr.render_file(NODES, data, str(tmp_path / "o.html"), now=rr.parse_now(now),
+                          cache_dir=str(tmp_path / "cache"), **kw)
+
+
+def test_cache_hit_skips_write(tmp_path):
+    out = tmp_path / "o.html"
+    data = {"SUMMARY": "요약", "news": [article("기사")]}
+    first = cached_render(tmp_path, data)
+    assert first["cache"] == "miss"
+    mtime = out.stat().st_mtime_ns
+    hit = cached_render(tmp_path, data)
+    assert (hit["cache"], hit["written"], hit["counts"]) == ("hit", False, first["counts"])
+    assert out.stat().st_mtime_ns == mtime
+    out.write_bytes(b"tampered")
+    again = cached_render(tmp_path, data)
+    assert (again["cache"], again["written"]) == ("hit", True)
+    assert out.read_text(encoding="utf-8") == rr.render(data, now=NOW).html
+    assert sorted(os.listdir(tmp_path)) == ["cache", "o.html"]
+
+
+def test_cache_hit_replaces_atomically(tmp_path, monkeypatch):
+    data = {"news": [article("기사")]}
+    cached_render(tmp_path, data)
+    out = tmp_path / "o.html"
+    out.write_bytes(b"previous")
+
+    def torn_copy(src, dst):
+        with open(dst, "wb") as f:
+            f.write(b"<!DOCTYPE")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copyfile", torn_copy)
+    with pytest.raises(OSError):
+        cached_render(tmp_path, data)
+    assert out.read_bytes() == b"previous"
+    assert sorted(os.listdir(tmp_path)) == ["cache", "o.html"]
+
+
+def test_cache_key_covers_time_of_day_and_config(tmp_path, monkeypatch):
+    # 같은 날 다른 시각 — 상대 날짜 정렬이 달라지므로 적중하면 안 된다
+    monkeypatch.setenv("REPORT_GROUP_RANK", "NEWS_GLOBAL=3:date")
+    data = {"news": [article("이틀 전", date="2일 전"), article("3시간 전", date="3시간 전"),
+                     article("어제 밤", date="2026-10-16 23:00")]}
+    morning = cached_render(tmp_path, data, "2026-10-17T01:00:00+09:00")
+    evening = cached_render(tmp_path, data, "2026-10-17T23:00:00+09:00")
+    assert (morning["cache"], evening["cache"]) == ("miss", "miss")
+    late = rr.render(data, now="2026-10-17T23:00:00+09:00").html
+    assert late != rr.render(data, now="2026-10-17T01:00:00+09:00").html
+    assert (tmp_path / "o.html").read_text(encoding="utf-8") == late
+    assert cached_render(tmp_path, data, "2026-10-17T23:00:00+09:00")["cache"] == "hit"
+    monkeypatch.setenv("REPORT_DEDUPE", "on")
+    assert cached_render(tmp_path, data, "2026-10-17T23:00:00+09:00")["cache"] == "miss"
+
+
+def test_wall_clock_render_is_not_cached(tmp_path):
+    r = rr.render_file(NODES, {"news": []}, str(tmp_path / "o.html"), cache_dir=str(tmp_path / "cache"))
+    assert "cache" not in r and not (tmp_path / "cache").exists()
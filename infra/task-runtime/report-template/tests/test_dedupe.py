@@ -0,0 +1,65 @@
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+# 글자는 거의 같지만 다른 기사 — 회사·제품명(첫 단어)이나 숫자가 다르다
+DISTINCT = [
+    ("삼성전자 3분기 실적 발표", "LG전자 3분기 실적 발표"),
+    ("Google releases Gemini 2", "Google releases Gemini 3"),
+    ("네이버, 하이퍼클로바X 기업용 요금제 공개", "카카오, 하이퍼클로바X 기업용 요금제 공개"),
+    ("Nvidia unveils Blackwell Ultra chips at GTC", "Nvidia unveils Blackwell Ultra chips at GTC 2026"),
+]
+# 같은 기사 — 머리표·문장부호·어미 차이
+SAME = [
+    ("[속보] 삼성전자, 3분기 영업이익 10조 돌파", "삼성전자 3분기 영업이익 10조 돌파(종합)"),
+    ("Anthropic raises new funding round led by Google", "Anthropic raises new funding round, led by Google"),
+    ("Samsung Electronics posts record third-quarter profit as chip demand surges",
+     "Samsung Electronics posts record third quarter profit as AI chip demand surges"),
+]
+
+
+def grouped(titles):
+    groups, total = rr.partition([article(t, src=f"S{i}") for i, t in enumerate(titles)], ["NEWS_GLOBAL"], [])
+    return [it["title"] for it in groups["NEWS_GLOBAL"]], total
+
+
+def test_dedupe_off_by_default():
+    assert rr.dedupe_threshold() is None
+    assert grouped([SAME[0][0], SAME[0][0]]) == ([SAME[0][0], SAME[0][0]], 2)
+
+
+@pytest.mark.parametrize("value, expected", [("on", rr.DEDUPE_THRESHOLD), ("0.7", 0.7), ("off", None), ("0", None)])
+def test_dedupe_env(monkeypatch, value, expected):
+    monkeypatch.setenv("REPORT_DEDUPE", value)
+    assert rr.dedupe_threshold() == expected
+
+
+@pytest.mark.parametrize("value", ["1.5", "-1", "yes"])
+def test_dedupe_env_invalid(monkeypatch, value):
+    monkeypatch.setenv("REPORT_DEDUPE", value)
+    with pytest.raises(rr.RenderError):
+        rr.dedupe_threshold()
+
+
+@pytest.mark.parametrize("a, b", DISTINCT)
+@pytest.mark.parametrize("threshold", ["on", "0.5"])
+def test_distinct_stories_stay_separate(monkeypatch, threshold, a, b):
+    monkeypatch.setenv("REPORT_DEDUPE", threshold)
+    assert grouped([a, b]) == ([a, b], 2)
+
+
+@pytest.mark.parametrize("a, b", SAME)
+def test_same_story_merges(monkeypatch, a, b):
+    monkeypatch.setenv("REPORT_DEDUPE", "on")
+    assert grouped([a, b]) == ([a], 1)
+
+
+def test_merged_card_lists_sources(monkeypatch):
+    monkeypatch.setenv("REPORT_DEDUPE", "on")
+    a, b = SAME[1]
+    res = rr.render({"news": [article(a, src="Reuters"), article(b, src="Bloomberg"),
+                              article(DISTINCT[1][0]), article(DISTINCT[1][1])]}, now=NOW)
+    assert res.counts["NEWS_GLOBAL"] == 3
+    assert "Reuters 외 1곳(Bloomberg)" in res.html
+    assert [w["count"] for w in res.warnings if w["code"] == "DUPLICATES_MERGED"] == [1]
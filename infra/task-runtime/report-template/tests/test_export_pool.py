@@ -0,0 +1,104 @@
+import base64, io, json, os, sys
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+NODES = rr.load_template(rr.TPL)
+
+
+def write_news(tmp_path, n):
+    news = tmp_path / "news.ndjson"
+    with open(news, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps(article(f"기사 {i}", region="국내" if i % 2 else "국외"), ensure_ascii=False) + "\n")
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps({"SUMMARY": "요약"}), encoding="utf-8")
+    return str(data)
+
+
+def test_parallel_export_reads_full_disk_spool(tmp_path, monkeypatch):
+    # 스풀이 디스크로 넘어간 뒤 버퍼에 남은 꼬리도 fork 자식이 읽어야 한다
+    monkeypatch.setattr(rr, "SPOOL_MEMORY", 256)
+    data = write_news(tmp_path, 300)
+    now = rr.parse_now(NOW)
+    rr.render_file(NODES, data, str(tmp_path / "a.html"), now=now, exports={"md": str(tmp_path / "seq.md")})
+    r = rr.render_file(NODES, data, str(tmp_path / "b.html"), now=now, exports={"md": str(tmp_path / "par.md")},
+                       parallel=True)
+    assert r["counts"] == {"NEWS_DOMESTIC": 150, "NEWS_GLOBAL": 150}
+    assert (tmp_path / "par.md").read_bytes() == (tmp_path / "seq.md").read_bytes()
+    assert (tmp_path / "a.html").read_bytes() == (tmp_path / "b.html").read_bytes()
+
+
+def test_no_history_connection_open_at_fork(tmp_path, monkeypatch):
+    db = str(tmp_path / "h.sqlite")
+    pool = rr.export_pool
+    open_at_fork = []
+
+    def spy(exports, model):
+        fds = os.listdir("/proc/self/fd")
+        open_at_fork.extend(p for p in (os.path.realpath(f"/proc/self/fd/{fd}") for fd in fds) if p.startswith(db))
+        return pool(exports, model)
+
+    monkeypatch.setattr(rr, "export_pool", spy)
+    r = rr.render_file(NODES, {"news": [article("이력 기사")]}, str(tmp_path / "r.html"), now=rr.parse_now(NOW),
+                       exports={"md": str(tmp_path / "r.md")}, parallel=True, history=db)
+    assert r["md"]["bytes"] > 0
+    assert open_at_fork == []
+    with rr.article_history("2026-10-18", db) as h:
+        assert h.check(article("이력 기사"))["date"].endswith("재보도(첫 보도 2026-10-17)")
+
+
+def docx_main(monkeypatch, data):
+    import docx_report
+    from docx import Document
+
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"data": data})))
+    monkeypatch.setattr(sys, "stdout", out)
+    docx_report.main()
+    return Document(io.BytesIO(base64.b64decode(out.getvalue())))
+
+
+def test_docx_main_contract(monkeypatch):
+    pytest.importorskip("docx")
+    data = {"REPORT_TITLE": "제목", "SUMMARY": "요약", "RUN_DATE": "2026-10-17",
+            "kpis": [{"label": "매출", "value": 12.0, "note": "전년 대비", "delta": "+3%", "deltaclass": "up"}],
+            "sections": [{"heading": "본문", "paragraphs": ["문단\x01"], "bullets": ["하나"],
+                          "table": {"headers": ["열"], "rows": [["\t값\n둘째 줄"]]}}],
+            "sources": [{"title": "출처", "url": "https://example.com"}]}
+    doc = docx_main(monkeypatch, data)
+    texts = [p.text for p in doc.paragraphs]
+    assert texts[:2] == ["제목", "2026-10-17"]
+    assert {"Executive Summary", "본문", "문단", "하나", "Sources", "1. 출처 - https://example.com"} <= set(texts)
+    kpi, table = doc.tables
+    assert [c.text for c in kpi.rows[0].cells] == ["Label", "Value", "Note", "Delta"]
+    assert [c.text for c in kpi.rows[1].cells] == ["매출", "12", "전년 대비", "+3%"]
+    assert table.rows[1].cells[0].text == "\t값\n둘째 줄"
+
+
+def test_docx_main_keeps_fixed_kpi_columns(monkeypatch):
+    pytest.importorskip("docx")
+    doc = docx_main(monkeypatch, {"kpis": [{"delta": "-1", "extra": "x", "label": "A", "value": 1},
+                                           {"label": "B", "note": "n"}]})
+    kpi, = doc.tables
+    assert [[c.text for c in r.cells] for r in kpi.rows] == [["Label", "Value", "Note", "Delta"],
+                                                             ["A", "1", "", "-1"], ["B", "", "n", ""]]
+
+
+def test_docx_main_without_registry(tmp_path, monkeypatch):
+    # report-templates 빌드 컨텍스트 없이 만든 이미지 — templates/ 가 비어 있어도 API 변환은 돈다
+    pytest.importorskip("docx")
+    import docx_report
+
+    # 내장 스펙은 레포 레지스트리의 generic-report 와 같은 그룹 순서·source·kind
+    _, spec = rr.template_spec(docx_report.API_TEMPLATE)
+    assert [(n, g["source"], g["kind"]) for n, g in spec["groups"].items()] == \
+        [(n, g["source"], g["kind"]) for n, g in docx_report.API_SPEC["groups"].items()]
+    monkeypatch.setattr(rr, "REGISTRY_DIRS", (str(tmp_path),))
+    assert rr.registry_path() is None
+    doc = docx_main(monkeypatch, {"REPORT_TITLE": "제목", "kpis": [{"label": "A", "value": 1}],
+                                  "sections": [{"heading": "본문"}], "sources": [{"title": "출처", "url": "u"}]})
+    assert [p.text for p in doc.paragraphs] == ["제목", "본문", "Sources", "1. 출처 - u"]
+    assert len(doc.tables) == 1
@@ -0,0 +1,52 @@
+import io, os, subprocess, sys
+
+import export_worker as ew
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def frames(*jobs):
+    buf = io.BytesIO()
+    for job in jobs:
+        ew.write_frame(buf, job)
+    buf.seek(0)
+    return buf
+
+
+def results(buf):
+    buf.seek(0)
+    out = []
+    while (r := ew.read_frame(buf)) is not None:
+        out.append(r)
+    return out
+
+
+def test_jobs_run_in_order_with_stdin_stdout_contract():
+    out = io.BytesIO()
+    done = ew.serve(frames({"id": 1, "script": "import sys; sys.stdout.write(sys.stdin.read().upper())", "input": "ab"},
+                           {"id": 2, "script": "raise ValueError('bad')"},
+                           {"id": 3}),
+                    out, ew.Worker(5, 4096))
+    r1, r2, r3 = results(out)
+    assert done == 2
+    assert (r1["id"], r1["ok"], r1["output"], r1["recycle"]) == (1, True, "AB", False)
+    assert (r2["ok"], r2["code"], r2["error"]) == (False, "EXPORT_FAILED", "ValueError: bad")
+    assert (r3["id"], r3["code"]) == (3, "BAD_JOB")
+
+
+def test_timeout_is_not_swallowed_by_except_exception():
+    # writer·라이브러리의 except Exception 안에서 알람이 울려도 잡은 상한에서 끝나고 워커는 교체된다
+    # (회귀해도 테스트가 멈추지 않게 스크립트는 5초 뒤 스스로 끝난다 — 그러면 ok=True 로 실패)
+    script = ("import time\nend = time.time() + 5\nwhile time.time() < end:\n"
+              "    try:\n        sum(range(1000))\n    except Exception:\n        pass\n")
+    out = io.BytesIO()
+    assert ew.serve(frames({"id": "t", "script": script}, {"id": "after", "script": "pass"}), out,
+                    ew.Worker(0.2, 4096)) == 1
+    r, = results(out)
+    assert (r["id"], r["ok"], r["code"], r["recycle"]) == ("t", False, "TIMEOUT", True)
+
+
+def test_worker_does_not_import_renderer():
+    code = "import sys, export_worker; print('render_report' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BASE, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
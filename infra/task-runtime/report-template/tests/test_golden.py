@@ -0,0 +1,18 @@
+import glob, json, os
+
+import pytest
+
+import render_report as rr
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..",
+                      "apps", "api", "src", "services", "report", "__tests__", "golden")
+CASES = sorted(glob.glob(os.path.join(GOLDEN, "*.json")))
+
+
+@pytest.mark.skipif(not CASES, reason="레포 골든 코퍼스 없음(이미지 안)")
+@pytest.mark.parametrize("case", CASES, ids=lambda p: os.path.basename(p)[:-5])
+def test_golden_corpus_byte_equal(case):
+    # report-renderer.ts 와 같은 입력 → 같은 바이트
+    c = json.load(open(case, encoding="utf-8"))
+    expected = open(case[:-5] + ".html", encoding="utf-8").read()
+    assert rr.render(c["data"], c.get("template", "generic-report"), c.get("now")).html == expected
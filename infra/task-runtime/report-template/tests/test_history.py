@@ -0,0 +1,72 @@
+import json, sqlite3
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+NODES = rr.load_template(rr.TPL)
+
+
+def run(tmp_path, titles, now=NOW, **kw):
+    data = {"news": [article(t) for t in titles]}
+    return rr.render_file(NODES, data, str(tmp_path / "report.html"), now=rr.parse_now(now), **kw)
+
+
+def fingerprints(path):
+    with sqlite3.connect(path) as db:
+        return sorted(r[0] for r in db.execute("SELECT run_date FROM seen"))
+
+
+def test_render_has_no_history_side_effect(tmp_path, monkeypatch):
+    db = tmp_path / "h.sqlite"
+    monkeypatch.setenv("REPORT_HISTORY", str(db))
+    rr.render({"news": [article("OpenAI 신모델 공개")]}, now=NOW)
+    run(tmp_path, ["OpenAI 신모델 공개"])
+    assert not db.exists()
+
+
+def test_render_file_marks_repeats(tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    first = run(tmp_path, ["OpenAI 신모델 공개"], now="2026-10-16T07:00:00+09:00", history=db)
+    assert not [w for w in first["warnings"] if w["code"] == "HISTORY_MARKED"]
+    second = run(tmp_path, ["OpenAI 신모델 공개", "새 기사"], history=db)
+    assert [w["count"] for w in second["warnings"] if w["code"] == "HISTORY_MARKED"] == [1]
+    assert "재보도(첫 보도 2026-10-16)" in (tmp_path / "report.html").read_text(encoding="utf-8")
+    assert fingerprints(db) == ["2026-10-16", "2026-10-17"]
+
+
+def test_suppress_mode_drops_repeats(tmp_path, monkeypatch):
+    db = str(tmp_path / "h.sqlite")
+    monkeypatch.setenv("REPORT_HISTORY_MODE", "suppress")
+    run(tmp_path, ["OpenAI 신모델 공개"], now="2026-10-16T07:00:00+09:00", history=db)
+    r = run(tmp_path, ["OpenAI 신모델 공개", "새 기사"], history=db)
+    assert r["counts"]["NEWS_GLOBAL"] == 1
+    assert [w["count"] for w in r["warnings"] if w["code"] == "HISTORY_SUPPRESSED"] == [1]
+
+
+def test_retention_drops_old_fingerprints(tmp_path, monkeypatch):
+    db = str(tmp_path / "h.sqlite")
+    monkeypatch.setenv("REPORT_HISTORY_DAYS", "30")
+    run(tmp_path, ["오래된 기사"], now="2026-08-01T07:00:00+09:00", history=db)
+    r = run(tmp_path, ["오래된 기사"], history=db)
+    assert not [w for w in r["warnings"] if w["code"].startswith("HISTORY_")]
+    assert fingerprints(db) == ["2026-10-17"]
+
+
+def test_failed_render_records_nothing(tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    with pytest.raises(OSError):
+        rr.render_file(NODES, {"news": [article("쓰기 실패")]}, str(tmp_path / "no" / "report.html"),
+                       now=rr.parse_now(NOW), history=db)
+    assert fingerprints(db) == []
+
+
+def test_daemon_job_history_field(tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    job = {"id": 1, "data": {"news": [article("데몬 기사")]}, "out": str(tmp_path / "d.html"),
+           "now": NOW, "history": db}
+    assert rr.serve_job(NODES, job)["ok"]
+    assert fingerprints(db) == ["2026-10-17"]
+    assert rr.serve_job(NODES, {**job, "history": 3})["ok"] is False
+    assert json.dumps(rr.serve_job(NODES, {k: v for k, v in job.items() if k != "history"}))
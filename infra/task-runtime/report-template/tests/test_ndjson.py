@@ -0,0 +1,41 @@
+import json
+
+import render_report as rr
+from conftest import NOW, article, write_ndjson
+
+NODES = rr.load_template(rr.TPL)
+ITEMS = [article("국외 기사 1"), article("국내 기사 1", region="국내"), article("국외 기사 2", src="a.com")]
+
+
+def render(tmp_path, data, data_path):
+    data_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    r = rr.render_file(NODES, str(data_path), str(tmp_path / "report.html"), now=rr.parse_now(NOW))
+    return r, (tmp_path / "report.html").read_text(encoding="utf-8")
+
+
+def test_ndjson_next_to_data_matches_array(tmp_path, monkeypatch):
+    monkeypatch.setattr(rr, "SPOOL_MEMORY", 16)  # 디스크 스풀 경로도 지난다
+    write_ndjson(tmp_path / rr.NEWS_NDJSON, ITEMS)
+    r, out = render(tmp_path, {"SUMMARY": "요약"}, tmp_path / "data.json")
+    assert out == rr.render({"SUMMARY": "요약", "news": ITEMS}, now=NOW).html
+    assert r["counts"] == {"NEWS_DOMESTIC": 1, "NEWS_GLOBAL": 2}
+
+
+def test_ndjson_named_in_data(tmp_path):
+    (tmp_path / "in").mkdir()
+    write_ndjson(tmp_path / "in" / "today.ndjson", ITEMS)
+    _, out = render(tmp_path, {"news": "today.ndjson"}, tmp_path / "in" / "data.json")
+    assert out == rr.render({"news": ITEMS}, now=NOW).html
+
+
+def test_ndjson_bad_lines_warn(tmp_path):
+    path = tmp_path / "n.ndjson"
+    write_ndjson(path, ITEMS, b"{not json\n\n")
+    warnings = []
+    groups, total = rr.partition_ndjson(str(path), list(rr.GROUPS), warnings)
+    try:
+        assert total == 3
+        assert [it["title"] for it in groups["NEWS_GLOBAL"]] == ["국외 기사 1", "국외 기사 2"]
+    finally:
+        rr.close_groups(groups)
+    assert [w["code"] for w in warnings] == ["BAD_NEWS_LINES"]
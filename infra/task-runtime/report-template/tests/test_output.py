@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+import render_report as rr
+
+
+def test_write_stream_joins_chunks(tmp_path):
+    out = tmp_path / "o.html"
+    chunks = [b"a" * rr.WRITE_BUFFER, "한글".encode("utf-8"), b"", b"z"]
+    assert rr.write_stream(iter(chunks), str(out)) == len(b"".join(chunks))
+    assert out.read_bytes() == b"".join(chunks)
+
+
+def test_write_stream_keeps_old_file_on_failure(tmp_path):
+    out = tmp_path / "o.html"
+    out.write_bytes(b"previous")
+
+    def chunks():
+        yield b"x" * (rr.WRITE_BUFFER + 1)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        rr.write_stream(chunks(), str(out))
+    assert out.read_bytes() == b"previous"
+    assert os.listdir(tmp_path) == ["o.html"]
@@ -0,0 +1,84 @@
+import render_report as rr
+from conftest import NOW, article
+
+
+def titles(items):
+    return [it["title"] for it in items]
+
+
+def test_groups_keep_input_order_uncapped_by_default():
+    news = [article(f"기사 {i}", date=f"2026-10-{1 + i % 28:02d}") for i in range(40)]
+    res = rr.render({"news": news}, now=NOW)
+    assert res.counts["NEWS_GLOBAL"] == 40
+    assert not [w for w in res.warnings if w["code"] == "GROUP_CAPPED"]
+    assert 'class="news-more"' not in res.html
+    pos = [res.html.index(f"기사 {i}<") for i in range(40)]
+    assert pos == sorted(pos)
+
+
+def test_rank_only_configured_group(monkeypatch):
+    monkeypatch.setenv("REPORT_GROUP_RANK", "NEWS_GLOBAL=2")
+    _, groups, _, _ = rr.prepare(rr.load_template(rr.TPL), {"news": [
+        article("g1", "2026-10-01"), article("g2", "2026-10-03"), article("g3", "2026-10-02"),
+        article("d1", region="국내"), article("d2", region="국내")]}, now=rr.parse_now(NOW))
+    assert isinstance(groups["NEWS_GLOBAL"], rr.RankedItems)
+    assert titles(groups["NEWS_GLOBAL"]) == ["g2", "g3"]
+    assert titles(groups["NEWS_DOMESTIC"]) == ["d1", "d2"]
+    rr.close_groups(groups)
+
+
+def test_nlargest_ties_keep_input_order():
+    items = [article(f"t{i}", "2026-10-05") for i in range(6)] + [article("new", "2026-10-09")]
+    ranked = rr.RankedItems(items, 4, "date")
+    assert titles(ranked) == ["new", "t0", "t1", "t2"]
+    assert ranked.overflow == 3
+    assert titles(ranked.rest()) == ["t3", "t4", "t5"]
+
+
+def test_score_ties_fall_back_to_date_then_input_order():
+    items = [article("a", "2026-10-01", score=5), article("b", "2026-10-03", score=5),
+             article("c", "2026-10-03", score=5), article("d", score=9), article("e")]
+    assert titles(rr.RankedItems(items, 0, "score")) == ["d", "b", "c", "a", "e"]
+
+
+def test_overflow_renders_compact_list(monkeypatch):
+    monkeypatch.setenv("REPORT_GROUP_RANK", "NEWS_GLOBAL=2:input")
+    res = rr.render({"news": [article(f"기사 {i}") for i in range(5)]}, now=NOW)
+    assert [w for w in res.warnings if w["code"] == "GROUP_CAPPED"]
+    assert res.counts["NEWS_GLOBAL"] == 5
+    more = res.html[res.html.index('class="news-more"'):]
+    assert "외 3건" in more
+    assert [t for t in ("기사 0", "기사 1") if t in more] == []
+    assert [more.index(f"<strong>기사 {i}</strong>") for i in (2, 3, 4)] == sorted(
+        more.index(f"<strong>기사 {i}</strong>") for i in (2, 3, 4))
+
+
+def test_date_key_relative_and_reprint():
+    now = rr.parse_now(NOW).astimezone(rr.report_tz())
+    assert rr.date_key("3시간 전", now) == (2026, 10, 17, 4, 0)
+    assert rr.date_key("2 days ago", now)[:3] == (2026, 10, 15)
+    assert rr.date_key("어제", now) == (2026, 10, 16)
+    assert rr.date_key("3시간 전") == (0,)
+    assert rr.date_key("—") == (0,)
+    # mark 모드 재보도 표시의 첫 보도일은 정렬 키가 아니다
+    assert rr.date_key(f"5시간 전{rr.REPRINT_MARK}2026-10-20)", now) == (2026, 10, 17, 2, 0)
+    assert rr.date_key(f"2026-10-01{rr.REPRINT_MARK}2026-09-01)") == (2026, 10, 1)
+
+
+def test_relative_dates_rank_against_run_time(monkeypatch):
+    monkeypatch.setenv("REPORT_GROUP_RANK", "NEWS_GLOBAL=2")
+    _, groups, _, _ = rr.prepare(rr.load_template(rr.TPL), {"news": [
+        article("old", "2026-10-10"), article("fresh", "1시간 전"), article("nodate", None)]},
+        now=rr.parse_now(NOW))
+    assert titles(groups["NEWS_GLOBAL"]) == ["fresh", "old"]
+    rr.close_groups(groups)
+
+
+def test_bad_group_rank_is_render_error(monkeypatch):
+    monkeypatch.setenv("REPORT_GROUP_RANK", "NEWS_GLOBAL=abc")
+    try:
+        rr.render({"news": [article("x")]}, now=NOW)
+    except rr.RenderError as e:
+        assert "REPORT_GROUP_RANK" in str(e)
+    else:
+        raise AssertionError("RenderError expected")
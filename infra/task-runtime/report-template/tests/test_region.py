@@ -0,0 +1,46 @@
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+
+@pytest.mark.parametrize("region, group", [("국내", "NEWS_DOMESTIC"), ("Korea", "NEWS_DOMESTIC"),
+                                           ("south_korea", "NEWS_DOMESTIC"), (" KR ", "NEWS_DOMESTIC"),
+                                           ("해외", "NEWS_GLOBAL"), ("WORLD", "NEWS_GLOBAL"),
+                                           ("Over_seas", None), ("중동", None)])
+def test_region_aliases(region, group):
+    assert rr.RegionClassifier(list(rr.GROUPS))(article("x", region=region)) == group
+
+
+def test_only_kr_tld_is_inferred():
+    # .kr 만 결정적 — 국내 매체도 .com 을 쓰므로 그 외 TLD 는 추정하지 않고 누락+경고
+    warnings = []
+    items = [article("a", region=None, src="https://news.example.co.kr/1"),
+             article("b", region="", src="news.naver.com"), article("c", region="?", src="reuters.com")]
+    groups, total = rr.partition(items, list(rr.GROUPS), warnings)
+    assert {n: [it["title"] for it in g] for n, g in groups.items()} == {"NEWS_DOMESTIC": ["a"], "NEWS_GLOBAL": []}
+    assert total == 3
+    assert [w["code"] for w in warnings] == ["REGION_INFERRED"]
+
+
+def test_unknown_region_dropped_with_warning_by_default():
+    r = rr.render({"news": [article("a", region="중동", src="chosun.com"), article("b")]}, now=NOW)
+    assert r.counts == {"NEWS_DOMESTIC": 0, "NEWS_GLOBAL": 1}
+    assert [w["code"] for w in r.warnings if w["code"] == "UNGROUPED_ITEMS"] == ["UNGROUPED_ITEMS"]
+
+
+def test_region_src_inference_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("REPORT_REGION_SRC", "0")
+    groups, _ = rr.partition([article("a", region=None, src="x.kr")], list(rr.GROUPS), [])
+    assert [len(g) for g in groups.values()] == [0, 0]
+
+
+@pytest.mark.parametrize("fallback, group", [("NEWS_GLOBAL", "NEWS_GLOBAL"), ("국내", "NEWS_DOMESTIC"),
+                                             ("", None), ("nowhere", None)])
+def test_region_fallback_is_opt_in(monkeypatch, fallback, group):
+    monkeypatch.setenv("REPORT_REGION_FALLBACK", fallback)
+    warnings = []
+    groups, total = rr.partition([article("a", region="중동", src="chosun.com")], list(rr.GROUPS), warnings)
+    assert {n for n, g in groups.items() if g} == ({group} if group else set())
+    assert total == 1
+    assert [w["code"] for w in warnings] == (["REGION_INFERRED"] if group else [])
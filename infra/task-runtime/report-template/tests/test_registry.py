@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+import render_report as rr
+from conftest import NOW
+
+
+def test_registry_group_kinds():
+    _, spec = rr.template_spec("generic-report")
+    assert {n: g["kind"] for n, g in spec["groups"].items()} == {"KPIS": "flat", "SECTIONS": "section",
+                                                                "SOURCES": "source"}
+    data = {"kpis": [{"label": "매출 <b>", "value": 3, "deltaClass": "up"}],
+            "sections": [{"heading": "개요", "paragraphs": ["본문"], "table": {"headers": ["a"], "rows": [[1]]}}],
+            "sources": [{"title": "출처", "url": "https://example.com"}]}
+    page = rr.render(data, "generic-report", now=NOW).html
+    assert "매출 &lt;b&gt;" in page and "매출 <b>" not in page
+    assert "개요" in page and "https://example.com" in page
+    assert spec["groups"]["SOURCES"]["emptyHtml"] not in page
+    assert spec["groups"]["SOURCES"]["emptyHtml"] in rr.render({}, "generic-report", now=NOW).html
+
+
+def test_unknown_template():
+    with pytest.raises(rr.RenderError, match="알 수 없는 보고서 템플릿"):
+        rr.template_spec("no-such-report")
+
+
+
+
+def test_registry_from_env(tmp_path, monkeypatch):
+    (tmp_path / "t.html").write_text("<h1>{{REPORT_TITLE}}</h1><!-- REPEAT:ROWS --><i>{{ITEM_NAME}}</i><!-- /REPEAT -->",
+                                     encoding="utf-8")
+    (tmp_path / "registry.json").write_text(json.dumps({"templates": {"t": {
+        "file": "t.html", "groups": {"ROWS": {"source": "rows", "kind": "flat"}}}}}), encoding="utf-8")
+    monkeypatch.setenv("REPORT_REGISTRY", str(tmp_path / "registry.json"))
+    page = rr.render({"REPORT_TITLE": "제목", "rows": [{"name": "a"}, {"name": "<b>"}]}, "t", now=NOW).html
+    assert page == "<h1>제목</h1><i>a</i><i>&lt;b&gt;</i>"
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+NODES = rr.load_template(rr.TPL)
+
+
+@pytest.mark.parametrize("job, error", [
+    ([1, 2], "JSON 객체"),
+    ({"id": 1, "data": 3}, "'data'"),
+    ({"id": 1, "data": {}, "out": ["x"]}, "'out'"),
+    ({"id": 1, "history": 1, "data": {}}, "'history'"),
+    ({"id": 1, "out": "x.html"}, "형식"),
+])
+def test_malformed_job_fails_alone(job, error):
+    r = rr.serve_job(NODES, job)
+    assert r["ok"] is False and error in r["error"]
+    assert r["id"] == (job.get("id") if isinstance(job, dict) else None)
+
+
+def test_unexpected_exception_stays_in_job(tmp_path, monkeypatch):
+    def boom(*a, **kw):
+        raise TypeError("unexpected")
+
+    monkeypatch.setattr(rr, "render_file", boom)
+    r = rr.serve_job(NODES, {"id": "a", "data": {}, "out": str(tmp_path / "a.html")})
+    assert (r["id"], r["ok"], r["error"]) == ("a", False, "TypeError: unexpected")
+
+
+def test_serve_lines(tmp_path):
+    out = tmp_path / "r.html"
+    lines = ["{bad\n", "\n", json.dumps({"id": 7, "data": {"news": [article("x")]}, "out": str(out),
+                                         "now": NOW}) + "\n"]
+    written = []
+    rr.serve_lines(NODES, lines, written.append)
+    results = [json.loads(w) for w in written]
+    assert len(results) == 2
+    assert results[0]["ok"] is False and results[0]["error"].startswith("잘못된 JSON")
+    assert (results[1]["id"], results[1]["ok"]) == (7, True)
+    assert out.read_text(encoding="utf-8") == rr.render({"news": [article("x")]}, now=NOW).html
+
+
+def test_defaults_and_job_fields(tmp_path):
+    r = rr.serve_job(NODES, {"id": 1, "data": {"news": []}, "out": str(tmp_path / "r.html"), "stats": True},
+                     defaults={"now": NOW, "template": "generic-report"})
+    assert r["ok"] and "phases_ms" in r
+    assert "source-line" in (tmp_path / "r.html").read_text(encoding="utf-8")
+
+
+def test_run_batch_in_order(tmp_path):
+    frag = str(tmp_path / "frag.jsonl")
+    jobs = [{"id": i, "data": {"news": [article(f"기사 {i}")]}, "out": str(tmp_path / f"{i}.html"), "now": NOW}
+            for i in range(3)] + [{"id": 3, "data": 1}]
+    results = rr.run_batch(NODES, jobs, 1, frag)
+    assert [(r["id"], r["ok"]) for r in results] == [(0, True), (1, True), (2, True), (3, False)]
+    assert len(rr.FragmentCache(frag).entries) == 3
@@ -0,0 +1,56 @@
+import hashlib, json, shutil
+
+import render_report as rr
+
+TPL = 'a {{X}} <!-- REPEAT:NEWS_GLOBAL --><i>{{ITEM_TITLE}}</i><!-- /REPEAT --> {{NEWS_GLOBAL_COUNT}} {{RUN_DATE}}'
+
+
+def test_compile_nodes():
+    nodes = rr.compile_template(TPL)
+    # REPEAT 마커 앞 공백은 마커와 함께 사라진다
+    assert nodes[:2] == [("text", "a "), ("token", "X")]
+    assert nodes[2] == ("repeat", "NEWS_GLOBAL", [("text", "<i>"), ("token", "ITEM_TITLE"), ("text", "</i>")])
+    assert rr.scalar_tokens(nodes) == ["X", "NEWS_GLOBAL_COUNT", "RUN_DATE"]
+    assert rr.data_keys(rr.scalar_tokens(nodes)) == ["X"]
+    assert list(rr.blocks(nodes)) == ["NEWS_GLOBAL"]
+
+
+def test_values_are_not_rescanned():
+    # 값 안의 {{TOKEN}} 은 재치환하지 않는다 — 출력이 부풀지 않는다
+    html = rr.render({"X": "{{X}} {{RUN_DATE}}", "news": []}, rr.compile_template(TPL), now="2026-10-17").html
+    assert html.startswith("a {{X}} {{RUN_DATE}}<div")
+    assert html.endswith(" 0 2026-10-17")
+
+
+def test_ast_written_and_used_when_hash_matches(tmp_path):
+    tpl = tmp_path / "t.html"
+    tpl.write_text(TPL, encoding="utf-8")
+    out = rr.write_template_ast(str(tpl))
+    ast = json.load(open(out, encoding="utf-8"))
+    assert ast["format"] == rr.AST_FORMAT
+    assert ast["sha256"] == hashlib.sha256(tpl.read_bytes()).hexdigest()
+    assert ast["scalars"] == ["X", "NEWS_GLOBAL_COUNT", "RUN_DATE"] and ast["groups"] == ["NEWS_GLOBAL"]
+    # 해시가 맞으면 AST 노드를 그대로 쓴다(파싱 생략)
+    ast["nodes"] = [["text", "from-ast"]]
+    json.dump(ast, open(out, "w", encoding="utf-8"))
+    assert rr.load_template(str(tpl)) == [["text", "from-ast"]]
+
+
+def test_ast_ignored_when_template_changes(tmp_path):
+    tpl = tmp_path / "t.html"
+    tpl.write_text(TPL, encoding="utf-8")
+    rr.write_template_ast(str(tpl))
+    tpl.write_text("b {{Y}}", encoding="utf-8")
+    assert rr.load_template(str(tpl)) == [("text", "b "), ("token", "Y")]
+    (tmp_path / "t.ast.json").write_text("{broken", encoding="utf-8")
+    assert rr.load_template(str(tpl)) == [("text", "b "), ("token", "Y")]
+
+
+def test_bundled_template_ast_roundtrip(tmp_path):
+    tpl = tmp_path / "ai-trend-daily.html"
+    shutil.copyfile(rr.TPL, tpl)
+    rr.write_template_ast(str(tpl))
+    from_ast = rr.load_template(str(tpl))
+    assert json.loads(json.dumps(rr.compile_template(tpl.read_text(encoding="utf-8")))) == from_ast
+    data = {"SUMMARY": "요약", "news": [{"region": "국내", "title": "t", "src": "s", "date": "d", "desc": "x"}]}
+    assert rr.render(data, from_ast, now="2026-10-17").html == rr.render(data, now="2026-10-17").html
@@ -0,0 +1,114 @@
+import glob, importlib.util, os, sys
+
+import pytest
+
+import render_report as rr
+from conftest import NOW, article
+
+NODES = rr.load_template(rr.TPL)
+
+
+@pytest.mark.parametrize("fmt, module", [("xlsx", "openpyxl"), ("docx", "docx"), ("pdf", "reportlab")])
+def test_missing_optional_dependency_fails_before_writing(tmp_path, monkeypatch, fmt, module):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *a: None if name == module else find_spec(name, *a))
+    monkeypatch.delitem(sys.modules, rr.EXPORT_FORMATS[fmt], raising=False)
+    out = tmp_path / "r.html"
+    with pytest.raises(rr.RenderError, match="미설치"):
+        rr.render_file(NODES, {"news": [article("x")]}, str(out), now=rr.parse_now(NOW),
+                       exports={fmt: str(tmp_path / f"r.{fmt}")})
+    assert list(tmp_path.iterdir()) == []
+
+
+TRICKY = [article("*굵게* <script>alert(1)</script> | [링크](x)", region="국내"),
+          article("=HYPERLINK(\"http://evil\")", src="=1+1"), article("보통 기사 # 1"),
+          article("@SUM(A1)", src="+cmd|' /C calc'!A0", desc="-2+3")]
+DATA = {"SUMMARY": "요약 & 전망", "KPI_GLOBAL_VALUE": "72", "CMP_DOM_PRODUCT": "64", "news": TRICKY}
+
+
+def export(tmp_path, fmt, data=DATA, template=None):
+    nodes, spec = rr.resolve_template(template) if template else (NODES, None)
+    out = tmp_path / f"r.{fmt}"
+    r = rr.render_file(nodes, data, None, now=rr.parse_now(NOW), spec=spec, exports={fmt: str(out)})
+    assert r[fmt]["out"] == str(out) and r[fmt]["bytes"] == out.stat().st_size
+    return r, out
+
+
+def test_md_escapes_markdown(tmp_path):
+    _, out = export(tmp_path, "md")
+    text = out.read_text(encoding="utf-8")
+    assert r"\*굵게\* \<script\>alert(1)\</script\> \| \[링크\](x)" in text
+    assert "요약 \\& 전망" in text and "## 국내 헤드라인 · 1건" in text
+    assert "<script>" not in text
+
+
+def test_md_registry_template(tmp_path):
+    _, out = export(tmp_path, "md", {"REPORT_TITLE": "주간", "sections": [{"heading": "개요", "bullets": ["a_b"]}],
+                                     "sources": [{"title": "S", "url": "https://x"}]}, "generic-report")
+    text = out.read_text(encoding="utf-8")
+    assert text.startswith("# 주간\n\n") and "- a\\_b\n" in text and "1. S - https://x" in text
+
+
+def test_xlsx_rows_numbers_and_formula_injection(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    r, out = export(tmp_path, "xlsx")
+    wb = openpyxl.load_workbook(out)
+    assert wb.sheetnames == ["KPI", "비교", "뉴스"]
+    assert r["xlsx"]["rows"] == sum(ws.max_row - 1 for ws in wb.worksheets)
+    assert wb["KPI"]["B2"].value == 72 and wb["비교"]["D2"].value == 64
+    news = {row[4].value: row for row in wb["뉴스"].iter_rows(min_row=2)}
+    # = + - @ 로 시작하는 문자열은 따옴표 접두 문자열 셀 — 수식으로 평가되지 않는다
+    cells = [*news['=HYPERLINK("http://evil")'][2:5], *news["@SUM(A1)"][2:6]]
+    assert [c.value[0] for c in cells if c.value[0] in "=+-@"] == ["=", "=", "+", "@", "-"]
+    assert all(c.data_type == "s" and c.quotePrefix for c in cells if c.value[0] in "=+-@")
+    assert not news["보통 기사 # 1"][4].quotePrefix
+
+
+def test_docx_via_render_file(tmp_path):
+    docx = pytest.importorskip("docx")
+    export(tmp_path, "docx")
+    doc = docx.Document(str(tmp_path / "r.docx"))
+    texts = [p.text for p in doc.paragraphs]
+    assert "국내 vs 국외 AI 트렌드 분석" in texts and "요약 & 전망" in texts
+    assert TRICKY[0]["title"] in texts
+    assert doc.tables[0].rows[1].cells[1].text == "72"
+
+
+def test_docx_table_rows_built_in_bulk(tmp_path):
+    docx = pytest.importorskip("docx")
+    rows = [[f"r{i}", i, "탭\t줄\n바꿈\x01"] for i in range(300)]
+    export(tmp_path, "docx", {"sections": [{"heading": "표", "table": {"headers": ["a", "b", "c"], "rows": rows}}]},
+           "generic-report")
+    table = docx.Document(str(tmp_path / "r.docx")).tables[0]
+    assert len(table.rows) == 301
+    assert [c.text for c in table.rows[300].cells] == ["r299", "299", "탭\t줄\n바꿈"]
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    """PDF 한글 폰트 — 이미지의 fonts-nanum, 없으면 시스템 TTF 를 Nanum 이름으로 빌려 쓴다."""
+    pdf_report = pytest.importorskip("pdf_report")
+    if not os.path.exists(os.path.join(pdf_report.FONT_DIR, pdf_report.FONT_FILES[pdf_report.FONT])):
+        ttf = next(iter(sorted(glob.glob("/usr/share/fonts/**/*.ttf", recursive=True))), None)
+        if ttf is None:
+            pytest.skip("TTF 폰트 없음")
+        for name in pdf_report.FONT_FILES.values():
+            os.symlink(ttf, tmp_path / name)
+        monkeypatch.setattr(pdf_report, "FONT_DIR", str(tmp_path))
+    pdf_report.register_fonts.cache_clear()
+    yield
+    pdf_report.register_fonts.cache_clear()
+
+
+def test_pdf_is_deterministic(tmp_path, font_dir):
+    a, out = export(tmp_path, "pdf")
+    first = out.read_bytes()
+    b, _ = export(tmp_path, "pdf")
+    assert out.read_bytes() == first and first.startswith(b"%PDF")
+    assert a["pdf"]["pages"] == b["pdf"]["pages"] >= 1
+
+
+def test_pdf_rejects_registry_template(tmp_path, font_dir):
+    with pytest.raises(rr.RenderError, match="기본 템플릿"):
+        export(tmp_path, "pdf", {}, "generic-report")
+    assert list(tmp_path.glob("r.*")) == []
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+보고서 xlsx — render_report.py 의 준비 결과(값·그룹)를 openpyxl write_only 로 시트에 흘려 쓴다.
+
+HTML 에서 KPI·CMP_* 숫자를 손으로 옮겨 적던 일을 대신한다. 기본 템플릿(ai-trend-daily):
+  KPI   — 지표·값·메모·변화·방향 + 추세(KPI_*_TREND, 열 하나에 점 하나)
+  비교  — 축·관측 신호·국내·국외·해석 (CMP_DOM_*/CMP_GLO_*, 0-100 은 숫자 셀)
+  뉴스  — 그룹·구분(카드/목록)·출처·날짜·제목·요약·URL. region 분류·중복 병합·정렬 상한·이력은
+          HTML 과 같고, 상한을 넘은 기사도 "목록" 행으로 모두 싣는다.
+레지스트리 템플릿(--template): flat 그룹은 그룹 이름의 시트(항목 키가 열), section 그룹의 표·차트는
+"표" 시트, source 그룹은 "출처" 시트. 표는 HTML 의 tableMaxRows 상한 없이 전부 싣는다.
+
+write_only 워크북은 행을 만드는 즉시 임시 파일로 내보낸다 — 뉴스 그룹(NDJSON 스풀)도 한 건씩
+읽어 쓰므로 10만 행 아카이브여도 메모리는 행 수와 무관하다. 셀 값은 HTML 이스케이프를 풀고,
+"="·"+"·"-"·"@" 로 시작하는 문자열(FORMULA_PREFIXES)은 수식이 아닌 문자열 셀에 따옴표 접두(quotePrefix)를
+붙여 둔다 — 수식 주입 차단, 사용자가 셀을 편집해 확정해도 수식으로 바뀌지 않는다.
+
+사용:
+  python3 render_report.py data.json report.html --xlsx report.xlsx   # HTML + xlsx(그룹 1회 준비)
+  python3 render_report.py data.json --xlsx report.xlsx               # xlsx 만
+"""
+import os, re, html
+
+import render_report as rr
+from report_outline import require
+
+require("openpyxl", "openpyxl")
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?")  # 앞자리 0('007' 같은 코드)은 문자열로 둔다
+NEWS_KIND = {True: "카드", False: "목록"}
+FORMULA_PREFIXES = ("=", "+", "-", "@")  # Excel·LibreOffice 가 수식으로 읽는 첫 글자(CSV/XLSX 주입 집합)
+# 시트별 (머리글, 열 너비)
+KPI_COLUMNS = (("지표", 18), ("값", 10), ("메모", 28), ("변화", 12), ("방향", 8))
+CMP_COLUMNS = (("축", 8), ("구분", 10), ("관측 신호", 26), ("국내", 8), ("국외", 8), ("해석", 48))
+NEWS_COLUMNS = (("그룹", 16), ("구분", 6), ("출처", 20), ("날짜", 14), ("제목", 48), ("요약", 60), ("URL", 32))
+
+
+def check(spec=None):
+    """의존성은 import 때 확인(require) — render_file 의 부가 출력 계약만 맞춘다."""
+
+
+def number(text):
+    """정수·소수 표기만 숫자로 — 나머지('72점', '—')는 그대로."""
+    if not NUMBER.fullmatch(text):
+        return text
+    return float(text) if "." in text else int(text)
+
+
+class Sheet:
+    """write_only 시트 — 굵은 머리글·틀 고정·열 너비, 행은 바로 내보낸다."""
+
+    def __init__(self, wb, title, columns, bold):
+        self.ws = wb.create_sheet(title)
+        self.bold = bold
+        self.rows = 0
+        for i, (_, width) in enumerate(columns):
+            self.ws.column_dimensions[get_column_letter(i + 1)].width = width
+        self.ws.freeze_panes = "A2"  # 머리글 고정 — 첫 행을 쓰기 전에 정해야 한다
+        self.head([h for h, _ in columns if h])
+
+    def cell(self, value, bold=False):
+        if isinstance(value, bool) or value is None:
+            value = rr.js_str(value)
+        if isinstance(value, str):
+            value = ILLEGAL_CHARACTERS_RE.sub("", value)
+        c = WriteOnlyCell(self.ws, value)
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            c.data_type = "s"
+            c.quotePrefix = True
+        if bold:
+            c.font = self.bold
+        return c
+
+    def head(self, values):
+        self.ws.append([self.cell(v, True) for v in values])
+
+    def row(self, values):
+        self.ws.append([self.cell(v) for v in values])
+        self.rows += 1
+
+
+def text(values, key):
+    """prepare 값(HTML 이스케이프) → 셀 문자열."""
+    return html.unescape(values.get(key, "—"))
+
+
+def raw(v, default="—"):
+    """원문 값 → 셀 값(숫자는 숫자, 객체·배열은 JS 표기)."""
+    if v is None:
+        return default
+    return v if isinstance(v, (int, float)) and not isinstance(v, bool) else rr.js_str(v)
+
+
+def figure(v):
+    """표·KPI 원문 값 — 숫자 표기 문자열('870.1')도 숫자 셀로."""
+    v = raw(v, "")
+    return number(v) if isinstance(v, str) else v
+
+
+def kpi_sheet(wb, values, data, bold):
+    trends = {key: rr.trend_values(data.get(key + rr.TREND_SUFFIX)) or [] for key, _ in rr.KPI_LABELS}
+    width = max(map(len, trends.values()), default=0)
+    sheet = Sheet(wb, "KPI", KPI_COLUMNS + tuple((f"추세 {i + 1}", 7) for i in range(width)), bold)
+    for key, label in rr.KPI_LABELS:
+        sheet.row([label, number(text(values, f"{key}_VALUE")), text(values, f"{key}_NOTE"),
+                   text(values, f"{key}_DELTA"), text(values, f"{key}_DELTACLASS"), *trends[key]])
+    return sheet.rows
+
+
+def cmp_sheet(wb, values, bold):
+    sheet = Sheet(wb, "비교", CMP_COLUMNS, bold)
+    for axis, label, badge, signal, note in rr.CMP_AXES:
+        sheet.row([label, badge, signal, number(text(values, f"CMP_DOM_{axis}")),
+                   number(text(values, f"CMP_GLO_{axis}")), text(values, note)])
+    return sheet.rows
+
+
+def news_sheet(wb, groups, bold):
+    """그룹별 카드(상위) 다음 넘친 기사(입력 순) — 그룹 항목을 한 건씩 읽어 바로 쓴다."""
+    sheet = Sheet(wb, "뉴스", NEWS_COLUMNS, bold)
+    for name, items in groups.items():
+        parts = [(True, items)]
+        if isinstance(items, rr.RankedItems) and items.overflow:
+            parts.append((False, items.rest()))
+        for top, part in parts:
+            for it in part:
+                sheet.row([name, NEWS_KIND[top], raw(it.get("src")), raw(it.get("date")), raw(it.get("title")),
+                           raw(it.get("desc")), raw(it.get("url"), "")])
+    return sheet.rows
+
+
+def flat_sheet(wb, name, items, bold):
+    """flat 그룹 — 항목 스칼라 키(처음 나온 순서)가 열."""
+    items = [it for it in items if isinstance(it, dict)]
+    keys = list(dict.fromkeys(k for it in items for k, v in it.items() if not isinstance(v, (dict, list))))
+    sheet = Sheet(wb, name[:31], [(k, 16) for k in keys], bold)
+    for it in items:
+        sheet.row([figure(it.get(k)) for k in keys])
+    return sheet.rows
+
+
+def section_sheet(wb, items, bold):
+    """section 그룹 — 섹션마다 제목 행, 표(머리글·행 전부), 차트(라벨·값)."""
+    sheet = Sheet(wb, "표", (("섹션", 24), ("", 16), ("", 16), ("", 16)), bold)
+    for i, it in enumerate(x for x in items if isinstance(x, dict)):
+        table = it.get("table") if isinstance(it.get("table"), dict) else None
+        chart = it.get("chart") if isinstance(it.get("chart"), dict) else None
+        if not table and not chart:
+            continue
+        sheet.head([rr.js_str(it.get("heading") or f"Section {i + 1}")])
+        if table:
+            headers = table.get("headers") if isinstance(table.get("headers"), list) else []
+            if headers:
+                sheet.head([rr.js_str(h) for h in headers])
+            for r in table.get("rows") if isinstance(table.get("rows"), list) else []:
+                sheet.row([figure(c) for c in (r if isinstance(r, list) else [r])])
+        if chart:
+            labels = chart.get("labels") if isinstance(chart.get("labels"), list) else []
+            series = rr.numeric_series(labels, chart.get("values") if isinstance(chart.get("values"), list) else [],
+                                       len(labels))
+            sheet.head([rr.js_str(chart.get("title") or "차트"), rr.js_str(chart.get("unit") or "")])
+            for label, v in series:
+                sheet.row([label, v])
+        sheet.ws.append([])  # 섹션 사이 빈 행
+    return sheet.rows
+
+
+def source_sheet(wb, items, bold):
+    sheet = Sheet(wb, "출처", (("#", 5), ("제목", 48), ("URL", 48)), bold)
+    for i, it in enumerate(x for x in items if isinstance(x, dict)):
+        sheet.row([i + 1, rr.js_str(it.get("title") or it.get("url") or "—"), rr.js_str(it.get("url"))])
+    return sheet.rows
+
+
+SPEC_SHEETS = {"section": section_sheet, "source": source_sheet}
+
+
+def write(out_path, values, groups, counts, data, spec=None):
+    """prepare 결과 → xlsx 파일. {out, bytes, rows}. 그룹은 읽기만 한다(닫지 않음).
+
+    레지스트리 템플릿은 렌더용 항목(안전 HTML)이 아니라 data 의 원 배열을 싣는다.
+    """
+    wb = Workbook(write_only=True)
+    bold = Font(bold=True)
+    if spec is None:
+        rows = kpi_sheet(wb, values, data, bold) + cmp_sheet(wb, values, bold) + news_sheet(wb, groups, bold)
+    else:
+        rows = 0
+        for name, gspec in spec["groups"].items():
+            items = data.get(gspec["source"])
+            items = items if isinstance(items, list) else []
+            sheet = SPEC_SHEETS.get(gspec["kind"])
+            rows += sheet(wb, items, bold) if sheet else flat_sheet(wb, name, items, bold)
+    wb.save(out_path)
+    return {"out": out_path, "bytes": os.path.getsize(out_path), "rows": rows}
@@ -0,0 +1,175 @@
+/**
+ * 보고서 렌더러 패리티·처리량 벤치마크 — TS(report-renderer) vs Python(render_report.py).
+ *
+ * 골든 코퍼스(apps/api/src/services/report/__tests__/golden/<case>.json + .html)를 두 구현으로
+ * 렌더해 기대 HTML·상호 간 바이트 단위로 비교하고, 구현별 지연(p50/p95)·처리량을 잰다.
+ * 두 쪽 모두 프로세스 안 API 호출만 측정한다(TS renderReport · py render()) — 기동·파일 I/O 제외.
+ *
+ * 사용: node scripts/eval/report-renderer-parity.js [--iterations N] [--json 결과.json] [--update]
+ *   선행: apps/api 빌드(dist) — `npm run build:backend`
+ *   --update: 두 구현이 서로 일치할 때만 기대 HTML 을 그 출력으로 갱신(계약 변경 시)
+ *
+ * 불일치가 하나라도 있으면 exit 1 — 한쪽만 최적화하다 계약이 갈라지는 것을 막는다.
+ */
+const fs = require('fs');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const ROOT = path.resolve(__dirname, '../..');
+const GOLDEN_DIR = path.join(ROOT, 'apps/api/src/services/report/__tests__/golden');
+const PY_DIR = path.join(ROOT, 'infra/task-runtime/report-template');
+
+// 코퍼스(JSON 배열)를 stdin 으로 받아 케이스별 {html, ms[]} 를 stdout JSON 으로.
+const PY_DRIVER = `
+import sys, json, time
+sys.path.insert(0, sys.argv[1])
+import render_report as rr
+iterations = int(sys.argv[2])
+out = {}
+for c in json.load(sys.stdin):
+    args = dict(template=c["template"], now=c["now"])
+    html = rr.render(c["data"], **args).html
+    ms = []
+    for _ in range(iterations):
+        t = time.perf_counter()
+        rr.render(c["data"], **args)
+        ms.append((time.perf_counter() - t) * 1000)
+    out[c["name"]] = {"html": html, "ms": ms}
+json.dump(out, sys.stdout, ensure_ascii=False)
+`;
+
+function arg(flag, fallback) {
+    const i = process.argv.indexOf(flag);
+    return i >= 0 && i + 1 < process.argv.length ? process.argv[i + 1] : fallback;
+}
+
+function loadCases() {
+    return fs.readdirSync(GOLDEN_DIR).filter((f) => f.endsWith('.json')).sort().map((f) => {
+        const c = JSON.parse(fs.readFileSync(path.join(GOLDEN_DIR, f), 'utf-8'));
+        const htmlPath = path.join(GOLDEN_DIR, f.replace(/\.json$/, '.html'));
+        return {
+            name: f.replace(/\.json$/, ''),
+            template: c.template,
+            now: c.now,
+            data: c.data,
+            htmlPath,
+            expected: fs.existsSync(htmlPath) ? fs.readFileSync(htmlPath, 'utf-8') : null,
+        };
+    });
+}
+
+function runTs(cases, iterations) {
+    let renderReport;
+    try {
+        ({ renderReport } = require(path.join(ROOT, 'apps/api/dist/services/report/report-renderer')));
+    } catch (e) {
+        console.error(`❌ TS 렌더러 로드 실패 — apps/api 빌드 필요 (npm run build:backend): ${e.message}`);
+        process.exit(2);
+    }
+    const out = {};
+    for (const c of cases) {
+        const now = new Date(c.now);
+        const html = renderReport(c.template, c.data, now).html;
+        const ms = [];
+        for (let i = 0; i < iterations; i++) {
+            const t = process.hrtime.bigint();
+            renderReport(c.template, c.data, now);
+            ms.push(Number(process.hrtime.bigint() - t) / 1e6);
+        }
+        out[c.name] = { html, ms };
+    }
+    return out;
+}
+
+function runPy(cases, iterations) {
+    const input = JSON.stringify(cases.map(({ name, template, now, data }) => ({ name, template, now, data })));
+    const r = spawnSync('python3', ['-c', PY_DRIVER, PY_DIR, String(iterations)], {
+        input, encoding: 'utf-8', maxBuffer: 256 * 1024 * 1024,
+    });
+    if (r.status !== 0) {
+        console.error(`❌ Python 렌더러 실패 (exit ${r.status}): ${r.stderr || r.error}`);
+        process.exit(2);
+    }
+    return JSON.parse(r.stdout);
+}
+
+/** 첫 불일치 바이트 위치와 앞뒤 문맥 — 어느 토큰에서 갈라졌는지 바로 보이게. */
+function firstDiff(a, b) {
+    const x = Buffer.from(a, 'utf-8');
+    const y = Buffer.from(b, 'utf-8');
+    let i = 0;
+    while (i < x.length && i < y.length && x[i] === y[i]) i++;
+    const ctx = (buf) => JSON.stringify(buf.subarray(Math.max(0, i - 40), i + 40).toString('utf-8'));
+    return `byte ${i}: ${ctx(x)} ≠ ${ctx(y)}`;
+}
+
+function summarize(ms, bytes) {
+    const sorted = [...ms].sort((a, b) => a - b);
+    const pick = (q) => sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] ?? 0;
+    const mean = sorted.reduce((s, v) => s + v, 0) / Math.max(sorted.length, 1);
+    return {
+        p50Ms: +pick(0.5).toFixed(4),
+        p95Ms: +pick(0.95).toFixed(4),
+        meanMs: +mean.toFixed(4),
+        rendersPerSec: mean > 0 ? +(1000 / mean).toFixed(1) : 0,
+        mbPerSec: mean > 0 ? +((bytes / 1048576) / (mean / 1000)).toFixed(2) : 0,
+    };
+}
+
+function main() {
+    const iterations = Math.max(1, parseInt(arg('--iterations', '50'), 10));
+    const update = process.argv.includes('--update');
+    const cases = loadCases();
+    if (cases.length === 0) {
+        console.error(`❌ 골든 코퍼스 없음: ${GOLDEN_DIR}`);
+        process.exit(2);
+    }
+    const ts = runTs(cases, iterations);
+    const py = runPy(cases, iterations);
+
+    const results = [];
+    let failed = 0;
+    for (const c of cases) {
+        const t = ts[c.name];
+        const p = py[c.name];
+        const bytes = Buffer.byteLength(t.html, 'utf-8');
+        const problems = [];
+        if (t.html !== p.html) problems.push(`ts≠py ${firstDiff(t.html, p.html)}`);
+        if (update && t.html === p.html && t.html !== c.expected) {
+            fs.writeFileSync(c.htmlPath, t.html);
+            c.expected = t.html;
+            console.log(`  ↻ ${c.name}: 기대 HTML 갱신`);
+        }
+        if (c.expected === null) problems.push('기대 HTML 없음');
+        else {
+            if (t.html !== c.expected) problems.push(`ts≠golden ${firstDiff(t.html, c.expected)}`);
+            if (p.html !== c.expected) problems.push(`py≠golden ${firstDiff(p.html, c.expected)}`);
+        }
+        if (problems.length) failed++;
+        results.push({ case: c.name, bytes, ok: problems.length === 0, problems,
+                       ts: summarize(t.ms, bytes), py: summarize(p.ms, bytes) });
+    }
+
+    console.log(`\n보고서 렌더러 패리티 — ${cases.length}건 × ${iterations}회\n`);
+    console.log('case'.padEnd(12) + 'bytes'.padStart(9) + '  ts p50/p95 ms'.padEnd(22) + 'py p50/p95 ms'.padEnd(20) + 'py/ts  결과');
+    for (const r of results) {
+        console.log(
+            r.case.padEnd(12) + String(r.bytes).padStart(9)
+            + `  ${r.ts.p50Ms.toFixed(3)} / ${r.ts.p95Ms.toFixed(3)}`.padEnd(22)
+            + `${r.py.p50Ms.toFixed(3)} / ${r.py.p95Ms.toFixed(3)}`.padEnd(20)
+            + `${(r.py.meanMs / Math.max(r.ts.meanMs, 1e-9)).toFixed(2)}×  ${r.ok ? '✅' : '❌'}`,
+        );
+        for (const p of r.problems) console.log(`    ${p}`);
+    }
+    console.log(`\n${failed === 0 ? '✅ 전 케이스 바이트 일치' : `❌ 불일치 ${failed}건`}`);
+
+    const jsonPath = arg('--json', null);
+    if (jsonPath) {
+        fs.writeFileSync(jsonPath, JSON.stringify({
+            at: new Date().toISOString(), node: process.version, iterations, results,
+        }, null, 2));
+    }
+    process.exit(failed === 0 ? 0 : 1);
+}
+
+main();